@@ -0,0 +1,798 @@
+# aviation_client.py
+import asyncio
+import logging
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import aiohttp
+from cache import TTLCache, SingleFlight
+from config import Config
+from http_client import get_session
+from metar_parser import parse_metar, parse_metars, parse_taf, translate_metar, translate_taf
+from rate_limit import DailyQuota
+from reference_data import get_reference_index
+
+AVWX_BASE_URL = "https://avwx.rest/api"
+AVIATIONWEATHER_METAR_URL = "https://aviationweather.gov/adds/dataserver_current/httpparam"
+ICAO_NOTAM_URL = "https://applications.icao.int/dataservices/api/notams-realtime-list"
+AERODATABOX_HOST = "aerodatabox.p.rapidapi.com"
+AVIATION_EDGE_URL = "https://aviation-edge.com/v2/public"
+NAVIGRAPH_CHARTS_URL = "https://api.navigraph.com/v1/charts"
+OPENWEATHERMAP_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+# Routine METARs are issued hourly; never trust a cached report for less than a minute
+METAR_ISSUE_INTERVAL = timedelta(hours=1)
+METAR_MIN_TTL = 60
+
+# aviation-edge endpoints for each airport product: (path, airport code parameter, extra parameters)
+AVIATION_EDGE_PRODUCTS = {
+    "airport": ("airportDatabase", "codeIataAirport", {}),
+    "airport_icao": ("airportDatabase", "codeIcaoAirport", {}),
+    "flights": ("flights", "arrIata", {}),
+    "notams": ("notams", "codeIataAirport", {}),
+    "tafs": ("weather", "codeIataAirport", {"type": "taf"}),
+}
+
+# aviation-edge answers an empty lookup with HTTP 200 and this error
+AVIATION_EDGE_NO_RECORDS = "No Record Found"
+
+IATA_CODE = re.compile(r"^[A-Z]{3}$")
+ICAO_CODE = re.compile(r"^[A-Z]{4}$")
+
+# Shared cache for station products, created on first use
+_aviation_cache = None
+
+# Calls made today against each aviation-edge API key
+_edge_quotas = {}
+
+# Concurrent identical upstream lookups share a single request
+_in_flight = SingleFlight()
+
+@dataclass
+class MetarReport:
+    """
+    A METAR observation for a single station.
+    """
+    station: str
+    raw: str
+    summary: str = ""
+
+@dataclass
+class TafReport:
+    """
+    A TAF forecast for a single station.
+    """
+    station: str
+    raw: str
+    summary: str = ""
+
+@dataclass
+class NotamList:
+    """
+    The NOTAMs currently in force for a single station.
+    """
+    station: str
+    notams: list = field(default_factory=list)
+
+@dataclass
+class AircraftInfo:
+    """
+    Reference information about an aircraft type.
+    """
+    aircraft_type: str
+    manufacturer: str
+    model: str
+
+@dataclass
+class AirportInfo:
+    """
+    Reference information about an airport.
+    """
+    airport_code: str
+    name: str
+    city: str
+    country: str
+
+@dataclass
+class ChartInfo:
+    """
+    Metadata describing a navigation chart.
+    """
+    chart_name: str
+    name: str
+    icao_code: str
+    chart_type: str
+    publication_date: str
+
+@dataclass
+class WeatherInfo:
+    """
+    Current weather conditions for a location.
+    """
+    location: str
+    description: str
+    temperature: float
+    humidity: float
+    wind_speed: float
+
+def get_aviation_cache():
+    """
+    Get the cache shared by every METAR, TAF and NOTAM lookup, creating it on first use.
+
+    Returns:
+        TTLCache: The shared aviation cache.
+    """
+    global _aviation_cache
+    if _aviation_cache is None:
+        _aviation_cache = TTLCache(Config.AVIATION_CACHE_MAX_BYTES, name="aviation")
+        Config.add_reload_listener(_apply_config)
+    return _aviation_cache
+
+def get_edge_quota(api_key=None):
+    """
+    Get the daily call counter for an aviation-edge API key, creating it on first use.
+
+    Args:
+        api_key (str): The API key (default: Config.AVIATION_EDGE_API_KEY).
+
+    Returns:
+        DailyQuota: The quota tracker for the key, reset at midnight UTC.
+    """
+    api_key = api_key or Config.AVIATION_EDGE_API_KEY
+    quota = _edge_quotas.get(api_key)
+    if quota is None:
+        quota = _edge_quotas[api_key] = DailyQuota(Config.AVIATION_EDGE_DAILY_QUOTA, timezone=timezone.utc)
+    return quota
+
+def _apply_config(changed):
+    _aviation_cache.resize(Config.AVIATION_CACHE_MAX_BYTES)
+    for quota in _edge_quotas.values():
+        quota.limit = Config.AVIATION_EDGE_DAILY_QUOTA
+
+def parse_airport_codes(text):
+    """
+    Extract the IATA airport codes from a command argument.
+
+    Args:
+        text (str): The argument, e.g. "lhr JFK, cdg".
+
+    Returns:
+        tuple: The distinct upper-cased codes in the order given, or None if any
+            code is invalid or there are more than Config.AVIATION_EDGE_MAX_CODES.
+    """
+    codes = dict.fromkeys(code.upper() for code in re.split(r"[\s,]+", text.strip()) if code)
+    if not codes or len(codes) > Config.AVIATION_EDGE_MAX_CODES:
+        return None
+    if not all(IATA_CODE.match(code) for code in codes):
+        return None
+    return tuple(codes)
+
+def metar_ttl(raw_metar, now=None):
+    """
+    Work out how long a METAR stays current, based on its observation time.
+
+    Args:
+        raw_metar (str): The raw METAR text, e.g. "KJFK 121651Z 31012KT ...".
+        now (datetime): The current UTC time (default: the system clock).
+
+    Returns:
+        float: The number of seconds until the next routine METAR is due.
+    """
+    now = now or datetime.now(timezone.utc)
+    match = re.search(r"\b(\d{2})(\d{2})(\d{2})Z\b", raw_metar or "")
+    if not match:
+        return Config.METAR_CACHE_TTL
+    day, hour, minute = (int(group) for group in match.groups())
+    observed = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if day != now.day:
+        # Only a report from yesterday can still be current; anything older is stale
+        observed -= timedelta(days=1)
+        if observed.day != day:
+            return METAR_MIN_TTL
+    remaining = (observed + METAR_ISSUE_INTERVAL - now).total_seconds()
+    return min(max(remaining, METAR_MIN_TTL), METAR_ISSUE_INTERVAL.total_seconds())
+
+async def _cached(key, ttl, request):
+    """
+    Return a cached station product, requesting and caching it on a miss.
+
+    Concurrent misses for the same key share a single upstream request.
+
+    Args:
+        key (tuple): The cache key, e.g. ("metar", "KJFK").
+        ttl (Callable): A function mapping the fetched result to its time-to-live in seconds.
+        request (Callable): A coroutine function performing the upstream request.
+
+    Returns:
+        The cached or freshly fetched result, or None if the request failed.
+    """
+    cache = get_aviation_cache()
+    result = cache.get(key)
+    if result is None:
+        result = await _in_flight.do(key, request)
+        if result is not None:
+            cache.set(key, result, ttl(result))
+    return result
+
+async def fetch_metar(station_code):
+    """
+    Fetch the latest METAR from AVWX and translate it into plain language.
+
+    Reports are cached until the next routine observation is due.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        MetarReport: The METAR report, or None if an error occurred.
+    """
+    return await _cached(("metar", station_code), lambda report: metar_ttl(report.raw),
+                         lambda: _request_metar(station_code))
+
+async def fetch_raw_metar(station_code):
+    """
+    Fetch the latest raw METAR text from aviationweather.gov.
+
+    Reports are cached until the next routine observation is due.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        MetarReport: The METAR report without a translation, or None if unavailable.
+    """
+    return (await fetch_raw_metars([station_code])).get(station_code)
+
+async def fetch_raw_metars(station_codes):
+    """
+    Fetch the latest raw METAR text for several stations from aviationweather.gov.
+
+    Cached stations are served from the cache; the rest are requested
+    together in a single call.
+
+    Args:
+        station_codes (Iterable): The ICAO station codes.
+
+    Returns:
+        dict: The METAR report for each station that has one, in the order given.
+    """
+    station_codes = list(dict.fromkeys(station_codes))
+    cache = get_aviation_cache()
+    reports = {code: cache.get(("raw_metar", code)) for code in station_codes}
+    missing = tuple(code for code, report in reports.items() if report is None)
+    if missing:
+        fetched = await _in_flight.do(("raw_metars", missing), lambda: _request_raw_metars(missing))
+        for code, report in (fetched or {}).items():
+            cache.set(("raw_metar", code), report, metar_ttl(report.raw))
+            reports[code] = report
+    return {code: report for code, report in reports.items() if report is not None}
+
+async def fetch_taf(station_code):
+    """
+    Fetch the current TAF from AVWX and translate it into plain language.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        TafReport: The TAF report, or None if an error occurred.
+    """
+    return await _cached(("taf", station_code), lambda report: Config.TAF_CACHE_TTL,
+                         lambda: _request_taf(station_code))
+
+async def fetch_notams(station_code):
+    """
+    Fetch the critical NOTAMs in force for a station from the ICAO API.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        NotamList: The NOTAMs for the station, or None if an error occurred.
+    """
+    return await _cached(("notam", station_code), lambda notam_list: Config.NOTAM_CACHE_TTL,
+                         lambda: _request_notams(station_code))
+
+async def fetch_aircraft_info(aircraft_type):
+    """
+    Fetch reference information about an aircraft type.
+
+    The bundled reference data is consulted first; AeroDataBox is only asked
+    about types it does not know.
+
+    Args:
+        aircraft_type (str): The aircraft type (ICAO code).
+
+    Returns:
+        AircraftInfo: The aircraft information, or None if an error occurred.
+    """
+    aircraft = get_reference_index().aircraft(aircraft_type)
+    if aircraft is not None:
+        return AircraftInfo(aircraft_type, aircraft.manufacturer, aircraft.model)
+    return await _in_flight.do(("aircraft", aircraft_type), lambda: _request_aircraft_info(aircraft_type))
+
+async def fetch_airport_info(airport_code):
+    """
+    Fetch reference information about an airport.
+
+    The bundled reference data is consulted first; AeroDataBox is only asked
+    about airports it does not know.
+
+    Args:
+        airport_code (str): The IATA airport code.
+
+    Returns:
+        AirportInfo: The airport information, or None if an error occurred.
+    """
+    airport = get_reference_index().airport(airport_code)
+    if airport is not None:
+        return AirportInfo(airport_code, airport.name, airport.city, airport.country)
+    return await _in_flight.do(("airport", airport_code), lambda: _request_airport_info(airport_code))
+
+async def fetch_chart_info(chart_name):
+    """
+    Fetch metadata about a navigation chart from Navigraph.
+
+    Args:
+        chart_name (str): The name of the chart.
+
+    Returns:
+        ChartInfo: The chart information, or None if an error occurred.
+    """
+    return await _in_flight.do(("chart", chart_name), lambda: _request_chart_info(chart_name))
+
+async def fetch_weather_info(location):
+    """
+    Fetch the current weather for a location from OpenWeatherMap.
+
+    Args:
+        location (str): The location (city name).
+
+    Returns:
+        WeatherInfo: The weather information, or None if an error occurred.
+    """
+    return await _in_flight.do(("weather", location.lower()), lambda: _request_weather_info(location))
+
+async def fetch_airport_database(airport_code):
+    """
+    Fetch the aviation-edge airport database entry for an airport.
+
+    Args:
+        airport_code (str): The IATA or ICAO airport code.
+
+    Returns:
+        list: The airport records as returned by aviation-edge, or None if an error occurred.
+    """
+    product = "airport_icao" if ICAO_CODE.match(airport_code) else "airport"
+    return await _cached(("edge_airport", airport_code), lambda records: Config.EDGE_AIRPORT_CACHE_TTL,
+                         lambda: _request_edge(product, airport_code))
+
+async def fetch_flights(airport_code):
+    """
+    Fetch the flights arriving at an airport from aviation-edge.
+
+    Args:
+        airport_code (str): The IATA airport code.
+
+    Returns:
+        list: The flight records as returned by aviation-edge (empty if there are none), or None if an error occurred.
+    """
+    return await _cached(("edge_flights", airport_code), lambda flights: Config.FLIGHTS_CACHE_TTL,
+                         lambda: _request_edge("flights", airport_code))
+
+async def fetch_edge_notams(airport_code):
+    """
+    Fetch the NOTAMs for an airport from aviation-edge.
+
+    Args:
+        airport_code (str): The IATA airport code.
+
+    Returns:
+        list: The NOTAM records as returned by aviation-edge (empty if there are none), or None if an error occurred.
+    """
+    return await _cached(("edge_notams", airport_code), lambda notams: Config.NOTAM_CACHE_TTL,
+                         lambda: _request_edge("notams", airport_code))
+
+async def fetch_edge_tafs(airport_code):
+    """
+    Fetch the TAFs for an airport from aviation-edge.
+
+    Args:
+        airport_code (str): The IATA airport code.
+
+    Returns:
+        list: The TAF records as returned by aviation-edge (empty if there are none), or None if an error occurred.
+    """
+    return await _cached(("edge_tafs", airport_code), lambda tafs: Config.TAF_CACHE_TTL,
+                         lambda: _request_edge("tafs", airport_code))
+
+async def fetch_for_airports(fetch, airport_codes):
+    """
+    Run one airport lookup for several airports concurrently.
+
+    Args:
+        fetch (Callable): A coroutine function taking one airport code, e.g. fetch_flights.
+        airport_codes (Iterable): The IATA airport codes.
+
+    Returns:
+        dict: The result of the lookup for each distinct airport code, in the order given.
+    """
+    airport_codes = list(dict.fromkeys(airport_codes))
+    results = await asyncio.gather(*(fetch(code) for code in airport_codes))
+    return dict(zip(airport_codes, results))
+
+async def _get(url, params=None, headers=None, as_text=False):
+    """
+    Issue a GET request through the shared HTTP session.
+
+    Args:
+        url (str): The URL of the API endpoint.
+        params (dict): The query parameters for the request (default: None).
+        headers (dict): The HTTP headers for the request (default: None).
+        as_text (bool): Return the body as text instead of decoded JSON (default: False).
+
+    Returns:
+        The decoded response body, or None if an error occurred.
+    """
+    session = get_session()
+    try:
+        async with session.get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            if as_text:
+                return await response.text()
+            return await response.json(content_type=None)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logging.error(f"Aviation API request to {url} failed: {e}")
+        return None
+
+async def _request_edge(product, airport_code):
+    """
+    Request an airport product from aviation-edge, within the daily quota of the API key.
+
+    Args:
+        product (str): The product, a key of AVIATION_EDGE_PRODUCTS.
+        airport_code (str): The airport code, IATA unless the product looks airports up by ICAO code.
+
+    Returns:
+        list: The records as returned by aviation-edge (empty if there are none), or None if an error occurred.
+    """
+    quota = get_edge_quota()
+    if not quota.try_consume():
+        logging.warning(f"Daily aviation-edge quota of {quota.limit} calls used up; not fetching {product} for {airport_code}")
+        return None
+    path, code_parameter, extra_parameters = AVIATION_EDGE_PRODUCTS[product]
+    params = {"key": Config.AVIATION_EDGE_API_KEY, code_parameter: airport_code, **extra_parameters}
+    data = await _get(f"{AVIATION_EDGE_URL}/{path}", params=params)
+    if isinstance(data, dict) and "error" in data:
+        if data["error"] == AVIATION_EDGE_NO_RECORDS:
+            return []
+        logging.error(f"aviation-edge {product} request for {airport_code} failed: {data['error']}")
+        return None
+    return data
+
+async def _request_metar(station_code):
+    """
+    Request the latest METAR from AVWX and translate it locally.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        MetarReport: The METAR report, or None if an error occurred.
+    """
+    url = f"{AVWX_BASE_URL}/metar/{station_code}"
+    headers = {"Authorization": f"BEARER {Config.AVWX_API_KEY}"}
+    data = await _get(url, params={"options": "info"}, headers=headers)
+    try:
+        return MetarReport(station_code, data['raw'], _translate(parse_metar, translate_metar, data['raw']))
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected METAR response for {station_code}: {e}")
+        return None
+
+async def _request_raw_metars(station_codes):
+    """
+    Request the latest raw METAR text for several stations from aviationweather.gov in one call.
+
+    Args:
+        station_codes (tuple): The ICAO station codes.
+
+    Returns:
+        dict: The METAR report for each station that has one, or None if the request failed.
+    """
+    params = {
+        "dataSource": "metars",
+        "requestType": "retrieve",
+        "format": "xml",
+        "stationString": ",".join(station_codes),
+        "hoursBeforeNow": 1,
+        "mostRecentForEachStation": "constraint"
+    }
+    xml_data = await _get(AVIATIONWEATHER_METAR_URL, params=params, as_text=True)
+    if xml_data is None:
+        return None
+    try:
+        raw_texts = [element.text for element in ET.fromstring(xml_data).iterfind(".//METAR/raw_text")]
+    except ET.ParseError as e:
+        logging.error(f"Invalid METAR XML for {', '.join(station_codes)}: {e}")
+        return None
+    reports = {}
+    for metar in parse_metars(raw_texts):
+        # The response lists the latest report first for each station
+        if metar is not None and metar.station in station_codes and metar.station not in reports:
+            reports[metar.station] = MetarReport(metar.station, metar.raw)
+    return reports
+
+def _translate(parse, translate, raw):
+    """
+    Translate a raw report into plain language with the local parser.
+
+    Args:
+        parse (Callable): The parser, parse_metar or parse_taf.
+        translate (Callable): The matching translator, translate_metar or translate_taf.
+        raw (str): The raw report.
+
+    Returns:
+        str: The translation, or an empty string if the report could not be decoded.
+    """
+    decoded = parse(" ".join(raw.split()))
+    return translate(decoded) if decoded is not None else ""
+
+async def _request_taf(station_code):
+    """
+    Request the current TAF from AVWX and translate it locally.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        TafReport: The TAF report, or None if an error occurred.
+    """
+    url = f"{AVWX_BASE_URL}/taf/{station_code}"
+    headers = {"Authorization": f"BEARER {Config.AVWX_API_KEY}"}
+    data = await _get(url, headers=headers)
+    try:
+        return TafReport(station_code, data['raw'], _translate(parse_taf, translate_taf, data['raw']))
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected TAF response for {station_code}: {e}")
+        return None
+
+async def _request_notams(station_code):
+    """
+    Request the critical NOTAMs for a station from the ICAO API.
+
+    Args:
+        station_code (str): The ICAO station code.
+
+    Returns:
+        NotamList: The NOTAMs for the station, or None if an error occurred.
+    """
+    params = {
+        "api_key": Config.ICAO_API_KEY,
+        "format": "json",
+        "criticality": 1,
+        "locations": station_code
+    }
+    data = await _get(ICAO_NOTAM_URL, params=params)
+    try:
+        return NotamList(station_code, [notam['all'] for notam in data['notams']])
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected NOTAM response for {station_code}: {e}")
+        return None
+
+async def _request_aircraft_info(aircraft_type):
+    """
+    Request reference information about an aircraft type from AeroDataBox.
+
+    Args:
+        aircraft_type (str): The aircraft type (ICAO code).
+
+    Returns:
+        AircraftInfo: The aircraft information, or None if an error occurred.
+    """
+    url = f"https://{AERODATABOX_HOST}/aircrafts/icao/{aircraft_type}"
+    headers = {
+        "X-RapidAPI-Host": AERODATABOX_HOST,
+        "X-RapidAPI-Key": Config.RAPIDAPI_KEY
+    }
+    data = await _get(url, headers=headers)
+    try:
+        return AircraftInfo(aircraft_type, data['manufacturer'], data['model'])
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected aircraft response for {aircraft_type}: {e}")
+        return None
+
+async def _request_airport_info(airport_code):
+    """
+    Request reference information about an airport from AeroDataBox.
+
+    Args:
+        airport_code (str): The IATA airport code.
+
+    Returns:
+        AirportInfo: The airport information, or None if an error occurred.
+    """
+    url = f"https://{AERODATABOX_HOST}/airports/iata/{airport_code}"
+    headers = {
+        "X-RapidAPI-Host": AERODATABOX_HOST,
+        "X-RapidAPI-Key": Config.RAPIDAPI_KEY
+    }
+    data = await _get(url, headers=headers)
+    try:
+        location = data['location']
+        return AirportInfo(airport_code, data['name'], location['city'], location['country'])
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected airport response for {airport_code}: {e}")
+        return None
+
+async def _request_chart_info(chart_name):
+    """
+    Request metadata about a navigation chart from Navigraph.
+
+    Args:
+        chart_name (str): The name of the chart.
+
+    Returns:
+        ChartInfo: The chart information, or None if an error occurred.
+    """
+    url = f"{NAVIGRAPH_CHARTS_URL}/{chart_name}"
+    headers = {
+        "Authorization": f"Bearer {Config.NAVIGRAPH_API_KEY}",
+        "Accept": "application/json"
+    }
+    data = await _get(url, headers=headers)
+    try:
+        return ChartInfo(chart_name, data['name'], data['icaoCode'], data['chartType'], data['publicationDate'])
+    except (KeyError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected chart response for {chart_name}: {e}")
+        return None
+
+async def _request_weather_info(location):
+    """
+    Request the current weather for a location from OpenWeatherMap.
+
+    Args:
+        location (str): The location (city name).
+
+    Returns:
+        WeatherInfo: The weather information, or None if an error occurred.
+    """
+    params = {
+        "q": location,
+        "appid": Config.OPENWEATHERMAP_API_KEY,
+        "units": "metric"
+    }
+    data = await _get(OPENWEATHERMAP_URL, params=params)
+    try:
+        return WeatherInfo(
+            location,
+            data['weather'][0]['description'],
+            data['main']['temp'],
+            data['main']['humidity'],
+            data['wind']['speed']
+        )
+    except (KeyError, IndexError, TypeError) as e:
+        if data is not None:
+            logging.error(f"Unexpected weather response for {location}: {e}")
+        return None
+
+def format_metar(report):
+    """
+    Format a METAR report for chat.
+
+    Args:
+        report (MetarReport): The METAR report.
+
+    Returns:
+        str: The METAR and, when available, its translation.
+    """
+    text = f"METAR for {report.station}:\n{report.raw}"
+    if report.summary:
+        text += f"\n\nTranslation: {report.summary}"
+    return text
+
+def format_metar_line(report):
+    """
+    Format a METAR as one line with its flight category, for multi-station replies.
+
+    Args:
+        report (MetarReport): The METAR report.
+
+    Returns:
+        str: e.g. "EGLL VFR: EGLL 121650Z 24008KT CAVOK 18/09 Q1021".
+    """
+    metar = parse_metar(" ".join(report.raw.split()))
+    category = metar.conditions.flight_category if metar is not None else None
+    return f"{report.station} {category}: {report.raw}" if category else f"{report.station}: {report.raw}"
+
+def format_taf(report):
+    """
+    Format a TAF report for chat.
+
+    Args:
+        report (TafReport): The TAF report.
+
+    Returns:
+        str: The TAF and, when available, its translation.
+    """
+    text = f"TAF for {report.station}:\n{report.raw}"
+    if report.summary:
+        text += f"\n\nTranslation: {report.summary}"
+    return text
+
+def format_notams(notam_list):
+    """
+    Format a list of NOTAMs for chat.
+
+    Args:
+        notam_list (NotamList): The NOTAMs for a station.
+
+    Returns:
+        str: The NOTAM text, or a message saying none were found.
+    """
+    if not notam_list.notams:
+        return f"No NOTAMs found for {notam_list.station}."
+    notam_text = "\n".join(notam_list.notams)
+    return f"NOTAMs for {notam_list.station}:\n{notam_text}"
+
+def format_aircraft_info(info):
+    """
+    Format aircraft information for chat.
+
+    Args:
+        info (AircraftInfo): The aircraft information.
+
+    Returns:
+        str: The formatted aircraft information.
+    """
+    return f"Aircraft Information for {info.aircraft_type}:\nManufacturer: {info.manufacturer}\nModel: {info.model}"
+
+def format_airport_info(info):
+    """
+    Format airport information for chat.
+
+    Args:
+        info (AirportInfo): The airport information.
+
+    Returns:
+        str: The formatted airport information.
+    """
+    return f"Airport Information for {info.airport_code}:\nName: {info.name}\nLocation: {info.city}, {info.country}"
+
+def format_chart_info(info):
+    """
+    Format chart metadata for chat.
+
+    Args:
+        info (ChartInfo): The chart information.
+
+    Returns:
+        str: The formatted chart information.
+    """
+    chart_info = f"Chart Information for {info.chart_name}:\n"
+    chart_info += f"Name: {info.name}\n"
+    chart_info += f"ICAO Code: {info.icao_code}\n"
+    chart_info += f"Chart Type: {info.chart_type}\n"
+    chart_info += f"Published Date: {info.publication_date}\n"
+    return chart_info
+
+def format_weather_info(info):
+    """
+    Format weather information for chat.
+
+    Args:
+        info (WeatherInfo): The weather information.
+
+    Returns:
+        str: The formatted weather information.
+    """
+    return (
+        f"Weather Information for {info.location}:\nDescription: {info.description}\n"
+        f"Temperature: {info.temperature}°C\nHumidity: {info.humidity}%\nWind Speed: {info.wind_speed} m/s"
+    )
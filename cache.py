@@ -0,0 +1,189 @@
+# cache.py
+import sys
+import asyncio
+import time
+import logging
+import dataclasses
+from collections import OrderedDict
+
+def estimate_size(value):
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Args:
+        value (Any): The value to measure. Strings, containers and dataclasses are walked recursively.
+
+    Returns:
+        int: The approximate size of the value in bytes.
+    """
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if dataclasses.is_dataclass(value):
+        return size + sum(estimate_size(getattr(value, f.name)) for f in dataclasses.fields(value))
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item) for item in value)
+    return size
+
+class TTLCache:
+    """
+    An in-memory cache with per-entry expiry and LRU eviction bounded by memory use.
+    """
+
+    def __init__(self, max_bytes, name="cache"):
+        """
+        Initialize the TTLCache instance.
+
+        Args:
+            max_bytes (int): The approximate memory budget for cached values.
+            name (str): A name used when logging cache activity (default: "cache").
+        """
+        self.max_bytes = max_bytes
+        self.name = name
+        self._entries = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Retrieve a value from the cache.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value to return on a miss (default: None).
+
+        Returns:
+            The cached value, or the default if the key is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at, size = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, ttl):
+        """
+        Store a value in the cache.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (float): The number of seconds the value stays fresh.
+        """
+        if ttl <= 0:
+            return
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logging.debug(f"{self.name}: value for {key} exceeds the cache budget, not cached")
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl, size)
+        self._size += size
+        self._evict()
+
+    def resize(self, max_bytes):
+        """
+        Change the memory budget, evicting the least recently used entries if it shrank.
+
+        Args:
+            max_bytes (int): The new approximate memory budget.
+        """
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        """
+        Remove every entry from the cache and reset its counters.
+        """
+        self._entries.clear()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self):
+        """
+        Report cache usage counters.
+
+        Returns:
+            dict: The entry count, memory use, hits, misses, evictions and hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+    def _evict(self):
+        while self._size > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key):
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+class SingleFlight:
+    """
+    Coalesces concurrent requests for the same key into a single in-flight call.
+    """
+
+    def __init__(self):
+        """
+        Initialize the SingleFlight instance.
+        """
+        self._calls = {}
+        self.started = 0
+        self.shared = 0
+
+    def __len__(self):
+        return len(self._calls)
+
+    async def do(self, key, request):
+        """
+        Run a request, or join the identical request already in flight.
+
+        Args:
+            key (Hashable): The key identifying the request.
+            request (Callable): A coroutine function performing the request.
+
+        Returns:
+            The result of the request, shared by every concurrent caller.
+
+        Raises:
+            Exception: Any exception raised by the request is re-raised to every caller.
+        """
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(request())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.shared += 1
+        # Shield the shared call so one cancelled caller does not cancel it for everyone
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._calls.get(key) is future:
+            del self._calls[key]
@@ -0,0 +1,205 @@
+# chat_commands.py
+import re
+import aviation_client
+import web_search
+from command_registry import registry
+from config import Config
+
+class AviationCommands:
+    """
+    The aviation and weather lookups offered by every chat front-end.
+
+    Each front-end inherits from this class and sets platform to its own name,
+    which selects the commands offered to its users.
+    """
+
+    platform = None
+
+    async def fetch_metar(self, station_code):
+        """
+        Fetch METAR data for a given station code.
+
+        Args:
+            station_code (str): The ICAO station code.
+
+        Returns:
+            str: The METAR data and translation, or an error message if an error occurred.
+        """
+        report = await aviation_client.fetch_metar(station_code)
+        if report is None:
+            return "Failed to fetch METAR data. Please try again later."
+        return aviation_client.format_metar(report)
+
+    async def fetch_metars(self, station_codes):
+        """
+        Fetch METAR data for several stations in one request.
+
+        Args:
+            station_codes (list): The ICAO station codes.
+
+        Returns:
+            str: One line per station with its flight category and METAR, or an error message if an error occurred.
+        """
+        if len(station_codes) > Config.METAR_MAX_STATIONS:
+            return f"Please ask for at most {Config.METAR_MAX_STATIONS} stations at a time."
+        reports = await aviation_client.fetch_raw_metars(station_codes)
+        if not reports:
+            return "Failed to fetch METAR data. Please try again later."
+        lines = [aviation_client.format_metar_line(report) for report in reports.values()]
+        lines.extend(f"{code}: No METAR found." for code in station_codes if code not in reports)
+        return "\n".join(lines)
+
+    async def fetch_taf(self, station_code):
+        """
+        Fetch TAF data for a given station code.
+
+        Args:
+            station_code (str): The ICAO station code.
+
+        Returns:
+            str: The TAF data and translation, or an error message if an error occurred.
+        """
+        report = await aviation_client.fetch_taf(station_code)
+        if report is None:
+            return "Failed to fetch TAF data. Please try again later."
+        return aviation_client.format_taf(report)
+
+    async def fetch_notam(self, station_code):
+        """
+        Fetch NOTAM data for a given station code.
+
+        Args:
+            station_code (str): The ICAO station code.
+
+        Returns:
+            str: The NOTAM data, or an error message if an error occurred.
+        """
+        notam_list = await aviation_client.fetch_notams(station_code)
+        if notam_list is None:
+            return "Failed to fetch NOTAM data. Please try again later."
+        return aviation_client.format_notams(notam_list)
+
+    async def fetch_aircraft_info(self, aircraft_type):
+        """
+        Fetch information about a specific aircraft type.
+
+        Args:
+            aircraft_type (str): The aircraft type (ICAO code).
+
+        Returns:
+            str: The aircraft information, or an error message if an error occurred.
+        """
+        info = await aviation_client.fetch_aircraft_info(aircraft_type)
+        if info is None:
+            return "Failed to fetch aircraft information. Please try again later."
+        return aviation_client.format_aircraft_info(info)
+
+    async def fetch_airport_info(self, airport_code):
+        """
+        Fetch information about a specific airport.
+
+        Args:
+            airport_code (str): The IATA airport code.
+
+        Returns:
+            str: The airport information, or an error message if an error occurred.
+        """
+        info = await aviation_client.fetch_airport_info(airport_code)
+        if info is None:
+            return "Failed to fetch airport information. Please try again later."
+        return aviation_client.format_airport_info(info)
+
+    async def fetch_chart_info(self, chart_name):
+        """
+        Fetch information about a specific chart.
+
+        Args:
+            chart_name (str): The name of the chart.
+
+        Returns:
+            str: The chart information, or an error message if an error occurred.
+        """
+        info = await aviation_client.fetch_chart_info(chart_name)
+        if info is None:
+            return "Failed to fetch chart information. Please try again later."
+        return aviation_client.format_chart_info(info)
+
+    async def fetch_weather_info(self, location):
+        """
+        Fetch weather information for a specific location.
+
+        Args:
+            location (str): The location (city name).
+
+        Returns:
+            str: The weather information, or an error message if an error occurred.
+        """
+        info = await aviation_client.fetch_weather_info(location)
+        if info is None:
+            return "Failed to fetch weather information. Please try again later."
+        return aviation_client.format_weather_info(info)
+
+    async def search_web(self, query):
+        """
+        Search the web and summarize the results within the platform's reply budget.
+
+        Args:
+            query (str): The search query.
+
+        Returns:
+            str: The result snippets, at most web_search.budget_for(platform) characters, or an error message if the search failed.
+        """
+        results = await web_search.search(query)
+        if results is None:
+            return "Failed to search the web. Please try again later."
+        return web_search.format_results(results, web_search.budget_for(self.platform), include_links=self.platform == "discord")
+
+ICAO_ERROR = "Please provide a valid 4-letter ICAO station code."
+IATA_ERROR = "Please provide a valid 3-letter IATA airport code."
+
+@registry.command("metar", usage="!metar <station_code> [<station_code> ...]", description="Get METAR data for one or more stations",
+                  pattern=r"[A-Z]{4}(?:[\s,]+[A-Z]{4})*", error=ICAO_ERROR, uppercase=True)
+async def metar_command(service, station_codes):
+    station_codes = list(dict.fromkeys(re.split(r"[\s,]+", station_codes)))
+    if len(station_codes) == 1:
+        return await service.fetch_metar(station_codes[0])
+    return await service.fetch_metars(station_codes)
+
+@registry.command("taf", usage="!taf <station_code>", description="Get TAF data for a given station",
+                  pattern=r"[A-Z]{4}", error=ICAO_ERROR, uppercase=True)
+async def taf_command(service, station_code):
+    return await service.fetch_taf(station_code)
+
+@registry.command("notam", usage="!notam <station_code>", description="Get NOTAM data for a given station",
+                  pattern=r"[A-Z]{4}", error=ICAO_ERROR, uppercase=True)
+async def notam_command(service, station_code):
+    return await service.fetch_notam(station_code)
+
+@registry.command("aircraft", usage="!aircraft <aircraft_type>", description="Get information about a specific aircraft type",
+                  pattern=r"\S+", error="Please provide an aircraft type, e.g. A320.")
+async def aircraft_command(service, aircraft_type):
+    return await service.fetch_aircraft_info(aircraft_type)
+
+@registry.command("airport", usage="!airport <airport_code>", description="Get information about a specific airport",
+                  pattern=r"[A-Z]{3}", error=IATA_ERROR, uppercase=True)
+async def airport_command(service, airport_code):
+    return await service.fetch_airport_info(airport_code)
+
+@registry.command("chart", usage="!chart <chart_name>", description="Get information about a specific chart",
+                  pattern=r".+", error="Please provide a chart name.")
+async def chart_command(service, chart_name):
+    return await service.fetch_chart_info(chart_name)
+
+@registry.command("weather", usage="!weather <location>", description="Get weather information for a specific location",
+                  pattern=r".+", error="Please provide a location.")
+async def weather_command(service, location):
+    return await service.fetch_weather_info(location)
+
+@registry.command("websearch", usage="!websearch <query>", description="Search the web",
+                  pattern=r".+", error="Please provide a search query.")
+async def websearch_command(service, query):
+    return await service.search_web(query)
+
+@registry.command("help", usage="!help", description="List the available commands")
+async def help_command(service, argument):
+    return "Here are the commands I understand:\n\n" + registry.help_text(service.platform)
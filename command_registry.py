@@ -0,0 +1,208 @@
+# command_registry.py
+import re
+import logging
+from dataclasses import dataclass, field
+
+@dataclass
+class Command:
+    """
+    A chat command and the rules for validating its argument.
+    """
+    name: str
+    handler: object
+    usage: str = ""
+    description: str = ""
+    pattern: object = None
+    error: str = ""
+    uppercase: bool = False
+    platforms: frozenset = None
+    aliases: tuple = field(default_factory=tuple)
+
+    def available_on(self, platform):
+        """
+        Check whether the command is offered on a platform.
+
+        Args:
+            platform (str): The platform name, e.g. "youtube".
+
+        Returns:
+            bool: True if the command is available on the platform.
+        """
+        return self.platforms is None or platform in self.platforms
+
+    def parse_argument(self, argument):
+        """
+        Normalize and validate the argument passed to the command.
+
+        Args:
+            argument (str): The raw text following the command name.
+
+        Returns:
+            tuple: The normalized argument and None, or None and the validation error message.
+        """
+        argument = argument.strip()
+        if self.uppercase:
+            argument = argument.upper()
+        if self.pattern is not None and not self.pattern.fullmatch(argument):
+            return None, self.error or f"Usage: {self.usage}"
+        return argument, None
+
+class CommandRegistry:
+    """
+    A registry of chat commands shared by the Discord, Twitch and YouTube front-ends.
+
+    Commands are looked up by name in a dictionary, so dispatch cost does not
+    grow with the number of registered commands.
+    """
+
+    def __init__(self, prefix="!", ignore_unknown=("twitch",)):
+        """
+        Initialize the CommandRegistry instance.
+
+        Args:
+            prefix (str): The prefix that marks a chat message as a command (default: "!").
+            ignore_unknown (Iterable): The platforms where unknown commands get no reply, because
+                viewers there often address other channel bots, e.g. !lurk (default: Twitch).
+        """
+        self.prefix = prefix
+        self.ignore_unknown = frozenset(ignore_unknown)
+        self._commands = {}
+        self._lookup = {}
+
+    def __contains__(self, name):
+        return name.lower() in self._lookup
+
+    def command(self, name, usage="", description="", pattern=None, error="", uppercase=False, platforms=None, aliases=()):
+        """
+        Decorator registering a coroutine function as a chat command.
+
+        The decorated function is called as handler(service, argument) and returns the reply text.
+
+        Args:
+            name (str): The command name, without the prefix.
+            usage (str): The usage string shown in help, e.g. "!metar <station_code>".
+            description (str): A short description shown in help.
+            pattern (str): A regular expression the whole argument must match (default: no validation).
+            error (str): The reply sent when the argument does not match the pattern.
+            uppercase (bool): Convert the argument to upper case before validation (default: False).
+            platforms (Iterable): The platforms offering the command (default: all platforms).
+            aliases (Iterable): Alternative names for the command.
+
+        Returns:
+            Callable: The decorator.
+        """
+        def decorator(handler):
+            self.register(Command(
+                name=name,
+                handler=handler,
+                usage=usage or f"{self.prefix}{name}",
+                description=description,
+                pattern=re.compile(pattern) if pattern else None,
+                error=error,
+                uppercase=uppercase,
+                platforms=frozenset(platforms) if platforms else None,
+                aliases=tuple(aliases)
+            ))
+            return handler
+        return decorator
+
+    def register(self, command):
+        """
+        Add a command to the registry.
+
+        Args:
+            command (Command): The command to register.
+
+        Raises:
+            ValueError: If the name or one of the aliases is already registered.
+        """
+        names = [command.name.lower()] + [alias.lower() for alias in command.aliases]
+        for name in names:
+            if name in self._lookup:
+                raise ValueError(f"Command {self.prefix}{name} is already registered.")
+        self._commands[command.name.lower()] = command
+        for name in names:
+            self._lookup[name] = command
+
+    def get(self, name, platform=None):
+        """
+        Look up a command by name or alias.
+
+        Args:
+            name (str): The command name, without the prefix.
+            platform (str): Only return the command if it is offered on this platform (default: any).
+
+        Returns:
+            Command: The command, or None if no matching command is registered.
+        """
+        command = self._lookup.get(name.lower())
+        if command is None or (platform is not None and not command.available_on(platform)):
+            return None
+        return command
+
+    def commands_for(self, platform):
+        """
+        List the commands offered on a platform, in registration order.
+
+        Args:
+            platform (str): The platform name.
+
+        Returns:
+            list: The commands available on the platform.
+        """
+        return [command for command in self._commands.values() if command.available_on(platform)]
+
+    def help_text(self, platform):
+        """
+        Build the list of commands shown to users of a platform.
+
+        Args:
+            platform (str): The platform name.
+
+        Returns:
+            str: One line per command with its usage and description.
+        """
+        return "".join(f"{command.usage} - {command.description}\n" for command in self.commands_for(platform))
+
+    async def invoke(self, command, argument, service):
+        """
+        Validate the argument and run a command.
+
+        Args:
+            command (Command): The command to run.
+            argument (str): The raw text following the command name.
+            service (Any): The front-end object passed to the handler.
+
+        Returns:
+            str: The reply text.
+        """
+        argument, error = command.parse_argument(argument)
+        if error:
+            return error
+        return await command.handler(service, argument)
+
+    async def dispatch(self, text, service):
+        """
+        Run the command contained in a chat message.
+
+        Args:
+            text (str): The chat message.
+            service (Any): The front-end object passed to the handler. Its platform attribute selects the available commands.
+
+        Returns:
+            str: The reply text, or None if the message is not a command or is an unknown command on a platform that ignores them.
+        """
+        if not text.startswith(self.prefix):
+            return None
+        platform = service.platform
+        name, _, argument = text[len(self.prefix):].partition(" ")
+        command = self.get(name, platform)
+        if command is None:
+            logging.debug(f"Unknown command {name!r} on {platform}")
+            if platform in self.ignore_unknown:
+                return None
+            return f"I'm sorry, I don't know that command. Try {self.prefix}help for the list of commands."
+        return await self.invoke(command, argument, service)
+
+# The registry every front-end registers its commands into
+registry = CommandRegistry()
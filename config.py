@@ -1,10 +1,348 @@
 import os
+import json
+import signal
+import asyncio
+import logging
+from dataclasses import dataclass, field, fields, replace
+from typing import Optional, Union, get_args, get_origin
+
+# Chat platforms the bot can run on
+PLATFORMS = ("discord", "twitch", "youtube")
+
+# Language model providers the bot can route between
+LLM_PROVIDER_NAMES = ("openai", "anthropic", "stub")
+
+# The config file read when CONFIG_FILE is not set, if it exists
+DEFAULT_CONFIG_FILE = "config.json"
+
+def credential(platform="shared", provider=None):
+    """
+    Declare a secret setting.
+
+    Args:
+        platform (str): The platform that requires it, or "shared" if every deployment does;
+            None makes it optional (default: "shared").
+        provider (str): The language model provider that requires it when listed in LLM_PROVIDERS (default: None).
+
+    Returns:
+        dataclasses.Field: The field, defaulting to None and only changeable by a restart.
+    """
+    return field(default=None, metadata={"required": platform, "provider": provider, "live": False})
+
+def tunable(default, live=True, minimum=None, maximum=None, choices=None):
+    """
+    Declare a tunable setting.
+
+    Args:
+        default (Any): The default value.
+        live (bool): Whether a hot reload applies the new value without a restart (default: True).
+        minimum (float): The smallest valid value (default: no limit).
+        maximum (float): The largest valid value (default: no limit).
+        choices (tuple): The valid values (default: any).
+
+    Returns:
+        dataclasses.Field: The field.
+    """
+    return field(default=default, metadata={"live": live, "minimum": minimum, "maximum": maximum, "choices": choices})
+
+def parse_platforms(value):
+    """
+    Split a comma-separated platform list.
+
+    Args:
+        value (str): The list, e.g. "discord, youtube".
+
+    Returns:
+        list: The platform names, lower-cased, in the order given.
+
+    Raises:
+        ValueError: If an unknown platform is listed.
+    """
+    platforms = [name.strip().lower() for name in value.split(",") if name.strip()]
+    for name in platforms:
+        if name not in PLATFORMS:
+            raise ValueError(f"Unknown platform {name!r} in ENABLED_PLATFORMS; expected one of {', '.join(PLATFORMS)}.")
+    return platforms
+
+def parse_providers(value):
+    """
+    Split a comma-separated language model provider list.
+
+    Args:
+        value (str): The list, e.g. "openai, anthropic".
+
+    Returns:
+        list: The provider names, lower-cased, in the order given.
+
+    Raises:
+        ValueError: If an unknown provider is listed or the list is empty.
+    """
+    providers = [name.strip().lower() for name in value.split(",") if name.strip()]
+    if not providers:
+        raise ValueError("LLM_PROVIDERS must list at least one provider.")
+    for name in providers:
+        if name not in LLM_PROVIDER_NAMES:
+            raise ValueError(f"Unknown provider {name!r} in LLM_PROVIDERS; expected one of {', '.join(LLM_PROVIDER_NAMES)}.")
+    return providers
+
+@dataclass(slots=True, frozen=True)
+class Settings:
+    """
+    Every configuration value, typed and validated.
+
+    Values come from the defaults below, then the JSON config file, then
+    environment variables of the same name.
+    """
+
+    # Platforms to run; only the enabled platforms' credentials are required
+    ENABLED_PLATFORMS: str = tunable("discord,twitch,youtube", live=False)
+
+    # Credentials
+    DISCORD_BOT_TOKEN: Optional[str] = credential("discord")
+    DISCORD_CLIENT_ID: Optional[str] = credential(None)
+    TWITCH_CLIENT_ID: Optional[str] = credential("twitch")
+    TWITCH_CLIENT_SECRET: Optional[str] = credential("twitch")
+    TWITCH_BOT_TOKEN: Optional[str] = credential("twitch")
+    YOUTUBE_API_KEY: Optional[str] = credential("youtube")
+    YOUTUBE_ACCESS_TOKEN: Optional[str] = credential("youtube")
+    YOUTUBE_LIVE_CHAT_ID: Optional[str] = credential("youtube")
+    OPENAI_API_KEY: Optional[str] = credential(None, provider="openai")
+    ANTHROPIC_API_KEY: Optional[str] = credential(None, provider="anthropic")
+    GOOGLE_PSE_ID: Optional[str] = credential()
+    GOOGLE_PSE_API_KEY: Optional[str] = credential()
+    AVWX_API_KEY: Optional[str] = credential()
+    ICAO_API_KEY: Optional[str] = credential()
+    RAPIDAPI_KEY: Optional[str] = credential()
+    OPENWEATHERMAP_API_KEY: Optional[str] = credential()
+    AVIATION_EDGE_API_KEY: Optional[str] = credential()
+    NAVIGRAPH_API_KEY: Optional[str] = credential()
+
+    # Twitch identity
+    TWITCH_BOT_NAME: str = tunable("defaultBotName", live=False)
+    TWITCH_CHANNEL_NAME: str = tunable("defaultChannelName", live=False)
+
+    # Bot supervisor tunables, in seconds
+    SUPERVISOR_BASE_DELAY: float = tunable(1.0, minimum=0.01)
+    SUPERVISOR_MAX_DELAY: float = tunable(300.0, minimum=0.01)
+    SUPERVISOR_STABLE_AFTER: float = tunable(600.0, minimum=0)
+    SUPERVISOR_REPORT_INTERVAL: float = tunable(900.0, live=False, minimum=0)
+
+    # Shared HTTP client tunables
+    HTTP_POOL_LIMIT: int = tunable(100, live=False, minimum=1)
+    HTTP_POOL_LIMIT_PER_HOST: int = tunable(10, live=False, minimum=1)
+    HTTP_DNS_CACHE_TTL: int = tunable(300, live=False, minimum=0)
+    HTTP_KEEPALIVE_TIMEOUT: float = tunable(30.0, live=False, minimum=0)
+    HTTP_REQUEST_TIMEOUT: float = tunable(15.0, live=False, minimum=0.1)
+
+    # Aviation product cache tunables, in bytes and seconds
+    AVIATION_CACHE_MAX_BYTES: int = tunable(2_000_000, minimum=0)
+    METAR_CACHE_TTL: float = tunable(600.0, minimum=0)
+    TAF_CACHE_TTL: float = tunable(7200.0, minimum=0)
+    NOTAM_CACHE_TTL: float = tunable(600.0, minimum=0)
+    METAR_MAX_STATIONS: int = tunable(5, minimum=1)
+    FLIGHTS_CACHE_TTL: float = tunable(60.0, minimum=0)
+    EDGE_AIRPORT_CACHE_TTL: float = tunable(86400.0, minimum=0)
+
+    # aviation-edge usage limits: calls per API key per UTC day, and airports per command
+    AVIATION_EDGE_DAILY_QUOTA: int = tunable(1000, minimum=0)
+    AVIATION_EDGE_MAX_CODES: int = tunable(5, minimum=1)
+
+    # Discord replies longer than one message are split over at most this many messages
+    DISCORD_MAX_PAGES: int = tunable(3, minimum=1)
+
+    # Live flight boards: seconds between refreshes, seconds each board stays live, and boards live at once
+    FLIGHT_BOARD_REFRESH: float = tunable(120.0, minimum=10)
+    FLIGHT_BOARD_DURATION: float = tunable(3600.0, minimum=60)
+    FLIGHT_BOARD_MAX_ACTIVE: int = tunable(5, minimum=1)
+
+    # Chat message dispatch tunables
+    DISPATCH_CONCURRENCY: int = tunable(4, minimum=1)
+    DISPATCH_MAX_PENDING: int = tunable(100, live=False, minimum=1)
+
+    # Web search tunables; the free Custom Search tier allows 100 queries a day
+    GOOGLE_PSE_DAILY_QUOTA: int = tunable(100, minimum=0)
+    SEARCH_RESULTS: int = tunable(5, minimum=1, maximum=10)
+    SEARCH_CACHE_TTL: float = tunable(3600.0, minimum=0)
+    SEARCH_CACHE_MAX_BYTES: int = tunable(500_000, minimum=0)
+
+    # Named-entity extraction tunables
+    NER_CACHE_SIZE: int = tunable(2048, minimum=1)
+
+    # YouTube live chat delivery tunables
+    YOUTUBE_MESSAGE_MAX_LENGTH: int = tunable(200, minimum=1)
+    YOUTUBE_SEND_RATE: float = tunable(0.5, minimum=0.01)
+    YOUTUBE_SEND_BURST: int = tunable(3, minimum=1)
+    YOUTUBE_SEND_MAX_RETRIES: int = tunable(4, minimum=0)
+
+    # Twitch chat rate limit profile
+    TWITCH_RATE_PROFILE: str = tunable("user", choices=("user", "moderator", "verified"))
+
+    # Language model tunables; only the listed providers' API keys are required
+    LLM_PROVIDERS: str = tunable("openai", live=False)
+    OPENAI_MODEL: str = tunable("gpt-4o")
+    ANTHROPIC_MODEL: str = tunable("claude-3-5-sonnet-20240620")
+    LLM_HEDGE_AFTER: float = tunable(2.5, minimum=0)
+    LLM_STATS_WINDOW: int = tunable(50, live=False, minimum=1)
+    LLM_MAX_ERROR_RATE: float = tunable(0.5, minimum=0, maximum=1)
+    LLM_UNHEALTHY_COOLDOWN: float = tunable(60.0, minimum=0)
+    LLM_MAX_TOKENS: int = tunable(300, minimum=1)
+    LLM_FLUSH_MIN_CHARS: int = tunable(60, minimum=1)
+    LLM_FLUSH_MAX_CHARS: int = tunable(450, minimum=1)
+    LLM_SYSTEM_PROMPT: str = tunable(
+        "You are a friendly chatbot in a flight simulation live stream chat. "
+        "Answer viewers' questions about aviation and the stream concisely, in a few sentences."
+    )
+
+    # Conversation memory tunables; set MEMORY_DB_PATH to persist history in SQLite
+    MEMORY_MAX_CONVERSATIONS: int = tunable(200, minimum=1)
+    MEMORY_MAX_TURNS: int = tunable(40, live=False, minimum=1)
+    MEMORY_TOKEN_BUDGET: int = tunable(1500, minimum=1)
+    MEMORY_IDLE_TIMEOUT: float = tunable(3600.0, minimum=0)
+    MEMORY_DB_PATH: Optional[str] = tunable(None, live=False)
+
+    # Response cache tunables; TTLs are per question topic, in seconds
+    RESPONSE_CACHE_MAX_ENTRIES: int = tunable(1000, minimum=1)
+    RESPONSE_CACHE_SIMILARITY: float = tunable(0.8, minimum=0.01, maximum=1)
+    RESPONSE_CACHE_TTL: float = tunable(3600.0, minimum=0)
+    RESPONSE_CACHE_WEATHER_TTL: float = tunable(600.0, minimum=0)
+    RESPONSE_CACHE_FLIGHTS_TTL: float = tunable(300.0, minimum=0)
+
+    @classmethod
+    def load(cls, config_file=None, environ=None):
+        """
+        Build validated settings from the config file and the environment.
+
+        Args:
+            config_file (str): The JSON config file (default: $CONFIG_FILE, or config.json if it exists).
+            environ (Mapping): The environment variables (default: os.environ).
+
+        Returns:
+            Settings: The validated settings.
+
+        Raises:
+            ValueError: If the config file is malformed or any value is missing or invalid.
+        """
+        environ = os.environ if environ is None else environ
+        config_file = config_file or environ.get("CONFIG_FILE")
+        if config_file is None and os.path.exists(DEFAULT_CONFIG_FILE):
+            config_file = DEFAULT_CONFIG_FILE
+        values = {}
+        if config_file:
+            try:
+                with open(config_file) as file:
+                    values = json.load(file)
+            except (OSError, ValueError) as e:
+                raise ValueError(f"Could not read config file {config_file}: {e}")
+            if not isinstance(values, dict):
+                raise ValueError(f"Config file {config_file} must contain a JSON object.")
+        names = {f.name for f in fields(cls)}
+        unknown = sorted(set(values) - names)
+        if unknown:
+            raise ValueError(f"Unknown settings in {config_file}: {', '.join(unknown)}")
+        for name in names:
+            if name in environ:
+                values[name] = environ[name]
+        return cls.from_values(values)
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Build validated settings from raw values, converting each to its declared type.
+
+        Args:
+            values (dict): Setting names mapped to values; strings are converted.
+
+        Returns:
+            Settings: The validated settings.
+
+        Raises:
+            ValueError: Listing every value that is missing or invalid.
+        """
+        errors = []
+        converted = {}
+        for f in fields(cls):
+            if f.name in values:
+                try:
+                    converted[f.name] = _convert(values[f.name], f.type)
+                except (TypeError, ValueError):
+                    errors.append(f"{f.name} must be {_type_name(f.type)}, got {values[f.name]!r}")
+        if errors:
+            raise ValueError("Invalid configuration: " + "; ".join(errors))
+        settings = cls(**converted)
+        settings.validate()
+        return settings
+
+    def validate(self):
+        """
+        Check that required credentials are present and tunables are in range.
+
+        Raises:
+            ValueError: Listing every problem found.
+        """
+        errors = []
+        try:
+            enabled = parse_platforms(self.ENABLED_PLATFORMS)
+        except ValueError as e:
+            errors.append(str(e))
+            enabled = []
+        try:
+            providers = parse_providers(self.LLM_PROVIDERS)
+        except ValueError as e:
+            errors.append(str(e))
+            providers = []
+        for f in fields(self):
+            value = getattr(self, f.name)
+            required = f.metadata.get("required")
+            if required is not None and value is None and (required == "shared" or required in enabled):
+                errors.append(f"{f.name} is required but not set")
+            if value is None and f.metadata.get("provider") in providers:
+                errors.append(f"{f.name} is required when LLM_PROVIDERS includes {f.metadata['provider']}")
+            minimum, maximum, choices = f.metadata.get("minimum"), f.metadata.get("maximum"), f.metadata.get("choices")
+            if minimum is not None and value < minimum:
+                errors.append(f"{f.name} must be at least {minimum}, got {value}")
+            if maximum is not None and value > maximum:
+                errors.append(f"{f.name} must be at most {maximum}, got {value}")
+            if choices is not None and value not in choices:
+                errors.append(f"{f.name} must be one of {', '.join(choices)}, got {value!r}")
+        if errors:
+            raise ValueError("Invalid configuration: " + "; ".join(errors))
+
+def _convert(value, annotation):
+    if get_origin(annotation) is Union:
+        if value is None:
+            return None
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation in (int, float) and isinstance(value, bool):
+        raise TypeError(f"{value!r} is not a number")
+    if annotation is int and isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{value!r} is not an integer")
+    return annotation(value)
+
+def _type_name(annotation):
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    return {int: "an integer", float: "a number", str: "a string"}.get(annotation, annotation.__name__)
 
 class Config:
     """
-    A class to manage configuration variables loaded from environment variables.
+    The current configuration, exposed as class attributes.
+
+    Every field of Settings is mirrored here so modules can keep reading
+    Config.NAME at call time; a hot reload swaps in new values in place.
     """
 
+    PLATFORMS = PLATFORMS
+
+    # The validated settings currently applied, and the file they came from
+    settings = Settings()
+    config_file = None
+
+    # Runtime state, not configuration
+    ACCESS_TOKEN = None
+    TOKEN_EXPIRY = 0
+
+    _reload_listeners = []
+
     @staticmethod
     def get_env_variable(name, default=None, required=False):
         """
@@ -27,31 +365,138 @@ class Config:
         return value
 
     @classmethod
-    def load_configuration(cls):
-        """
-        Load configuration values from environment variables and assign them to class variables.
-        """
-        cls.DISCORD_BOT_TOKEN = cls.get_env_variable('DISCORD_BOT_TOKEN', required=True)
-        cls.TWITCH_CLIENT_ID = cls.get_env_variable('TWITCH_CLIENT_ID', required=True)
-        cls.TWITCH_CLIENT_SECRET = cls.get_env_variable('TWITCH_CLIENT_SECRET', required=True)
-        cls.OPENAI_API_KEY = cls.get_env_variable('OPENAI_API_KEY', required=True)
-        cls.GOOGLE_PSE_ID = cls.get_env_variable('GOOGLE_PSE_ID', required=True)
-        cls.GOOGLE_PSE_API_KEY = cls.get_env_variable('GOOGLE_PSE_API_KEY', required=True)
-        cls.TWITCH_BOT_NAME = cls.get_env_variable('TWITCH_BOT_NAME', 'defaultBotName')
-        cls.TWITCH_BOT_TOKEN = cls.get_env_variable('TWITCH_BOT_TOKEN', required=True)
-        cls.TWITCH_CHANNEL_NAME = cls.get_env_variable('TWITCH_CHANNEL_NAME', 'defaultChannelName')
-        cls.YOUTUBE_API_KEY = cls.get_env_variable('YOUTUBE_API_KEY', required=True)
-        cls.YOUTUBE_ACCESS_TOKEN = cls.get_env_variable('YOUTUBE_ACCESS_TOKEN', required=True)
-        cls.YOUTUBE_LIVE_CHAT_ID = cls.get_env_variable('YOUTUBE_LIVE_CHAT_ID', required=True)
-        cls.AVWX_API_KEY = cls.get_env_variable('AVWX_API_KEY', required=True)
-        cls.ICAO_API_KEY = cls.get_env_variable('ICAO_API_KEY', required=True)
-        cls.RAPIDAPI_KEY = cls.get_env_variable('RAPIDAPI_KEY', required=True)
-        cls.OPENWEATHERMAP_API_KEY = cls.get_env_variable('OPENWEATHERMAP_API_KEY', required=True)
-        cls.AVIATION_EDGE_API_KEY = cls.get_env_variable('AVIATION_EDGE_API_KEY', required=True)
-        cls.NAVIGRAPH_API_KEY = cls.get_env_variable('NAVIGRAPH_API_KEY', required=True)
+    def enabled_platforms(cls):
+        """
+        List the platforms selected by ENABLED_PLATFORMS.
+
+        Returns:
+            list: The enabled platform names, in the order given.
+
+        Raises:
+            ValueError: If an unknown platform is listed.
+        """
+        return parse_platforms(cls.ENABLED_PLATFORMS)
+
+    @classmethod
+    def platform_enabled(cls, platform):
+        """
+        Check whether a platform is enabled.
+
+        Args:
+            platform (str): The platform name, e.g. "discord".
+
+        Returns:
+            bool: True if the platform is listed in ENABLED_PLATFORMS.
+        """
+        return platform in cls.enabled_platforms()
+
+    @classmethod
+    def apply(cls, settings):
+        """
+        Make a set of settings current.
+
+        Args:
+            settings (Settings): The validated settings.
+        """
+        cls.settings = settings
+        for f in fields(settings):
+            setattr(cls, f.name, getattr(settings, f.name))
+
+    @classmethod
+    def load_configuration(cls, config_file=None):
+        """
+        Load and validate the configuration from the config file and environment variables.
+
+        Args:
+            config_file (str): The JSON config file (default: $CONFIG_FILE, or config.json if it exists).
+
+        Raises:
+            ValueError: If any value is missing or invalid.
+        """
+        cls.config_file = config_file
+        cls.apply(Settings.load(config_file))
         cls.ACCESS_TOKEN = None
         cls.TOKEN_EXPIRY = 0
 
+    @classmethod
+    def reload(cls):
+        """
+        Re-read the configuration and apply the tunables that can change without a restart.
+
+        Invalid configuration is rejected as a whole and the current values are kept.
+        Changes to settings that need a restart, such as credentials, are ignored with a warning.
+
+        Returns:
+            set: The names of the settings that changed.
+        """
+        try:
+            loaded = Settings.load(cls.config_file)
+        except ValueError as e:
+            logging.error(f"Configuration reload rejected: {e}")
+            return set()
+        current = cls.settings
+        changed = set()
+        restart = []
+        for f in fields(current):
+            if getattr(loaded, f.name) == getattr(current, f.name):
+                continue
+            if f.metadata.get("live", True):
+                changed.add(f.name)
+            else:
+                restart.append(f.name)
+        if restart:
+            logging.warning(f"Configuration reload ignored settings that need a restart: {', '.join(sorted(restart))}")
+        if not changed:
+            logging.info("Configuration reloaded; no changes")
+            return changed
+        cls.apply(replace(current, **{name: getattr(loaded, name) for name in changed}))
+        logging.info(f"Configuration reloaded; changed {', '.join(sorted(changed))}")
+        for listener in list(cls._reload_listeners):
+            try:
+                listener(changed)
+            except Exception as e:
+                logging.error(f"Error applying reloaded configuration: {e}")
+        return changed
+
+    @classmethod
+    def add_reload_listener(cls, listener):
+        """
+        Register a function called after a reload changes any settings.
+
+        Args:
+            listener (Callable): Called with the set of changed setting names.
+        """
+        cls._reload_listeners.append(listener)
+
+    @classmethod
+    def remove_reload_listener(cls, listener):
+        """
+        Unregister a reload listener.
+
+        Args:
+            listener (Callable): The listener passed to add_reload_listener.
+        """
+        if listener in cls._reload_listeners:
+            cls._reload_listeners.remove(listener)
+
+    @classmethod
+    def install_reload_handler(cls, loop=None):
+        """
+        Reload the configuration whenever the process receives SIGHUP.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The event loop handling the signal (default: the running loop).
+
+        Returns:
+            bool: False if the platform has no SIGHUP.
+        """
+        if not hasattr(signal, "SIGHUP"):
+            return False
+        (loop or asyncio.get_running_loop()).add_signal_handler(signal.SIGHUP, cls.reload)
+        return True
+
+Config.apply(Config.settings)
+
 # Example usage
 if __name__ == "__main__":
     Config.load_configuration()
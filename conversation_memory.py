@@ -0,0 +1,263 @@
+# conversation_memory.py
+import re
+import time
+import logging
+import asyncio
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from config import Config
+
+# Words and individual punctuation marks approximate model tokens closely enough for budgeting
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+# Store shared by every conversation, created on first use
+_store = None
+
+def count_tokens(text):
+    """
+    Estimate the number of model tokens in a piece of text.
+
+    Args:
+        text (str): The text to measure.
+
+    Returns:
+        int: The approximate token count.
+    """
+    return len(TOKEN_PATTERN.findall(text))
+
+class Turn:
+    """
+    A single message in a conversation.
+    """
+
+    __slots__ = ("role", "content", "tokens", "timestamp")
+
+    def __init__(self, role, content, timestamp=None):
+        """
+        Initialize the Turn instance.
+
+        Args:
+            role (str): "user" or "assistant".
+            content (str): The message text.
+            timestamp (float): When the message was sent, as a Unix time (default: now).
+        """
+        self.role = role
+        self.content = content
+        self.tokens = count_tokens(content)
+        self.timestamp = timestamp or time.time()
+
+class Conversation:
+    """
+    The recent turns of one conversation, held in a ring buffer with a running token count.
+    """
+
+    __slots__ = ("conversation_id", "turns", "tokens", "last_active")
+
+    def __init__(self, conversation_id, max_turns):
+        """
+        Initialize the Conversation instance.
+
+        Args:
+            conversation_id (str): The conversation key, e.g. "twitch_<channel>".
+            max_turns (int): The maximum number of turns kept.
+        """
+        self.conversation_id = conversation_id
+        self.turns = deque(maxlen=max_turns)
+        self.tokens = 0
+        self.last_active = time.monotonic()
+
+    def add(self, turn, token_budget):
+        """
+        Append a turn, dropping the oldest turns beyond the turn limit or token budget.
+
+        Args:
+            turn (Turn): The turn to append.
+            token_budget (int): The maximum total tokens kept for the conversation.
+        """
+        if len(self.turns) == self.turns.maxlen:
+            self.tokens -= self.turns.popleft().tokens
+        self.turns.append(turn)
+        self.tokens += turn.tokens
+        while self.tokens > token_budget and len(self.turns) > 1:
+            self.tokens -= self.turns.popleft().tokens
+        self.last_active = time.monotonic()
+
+    def window(self, token_budget):
+        """
+        Select the most recent turns that fit a token budget.
+
+        Args:
+            token_budget (int): The maximum total tokens to return.
+
+        Returns:
+            list: The selected turns in chronological order, starting with a user turn.
+        """
+        selected = []
+        used = 0
+        for turn in reversed(self.turns):
+            if used + turn.tokens > token_budget:
+                break
+            selected.append(turn)
+            used += turn.tokens
+        selected.reverse()
+        # Models expect the history to open with a user message
+        while selected and selected[0].role != "user":
+            selected.pop(0)
+        return selected
+
+class ConversationStore:
+    """
+    Bounded in-memory conversation history with optional SQLite persistence.
+
+    Conversations are kept in LRU order; the least recently used ones are
+    evicted when there are too many or when they have been idle too long.
+    Evicted conversations are reloaded from SQLite when persistence is on.
+    """
+
+    def __init__(self, max_conversations=None, max_turns=None, token_budget=None, idle_timeout=None, db_path=None):
+        """
+        Initialize the ConversationStore instance.
+
+        Args:
+            max_conversations (int): The number of conversations kept in memory (default: Config.MEMORY_MAX_CONVERSATIONS).
+            max_turns (int): The number of turns kept per conversation (default: Config.MEMORY_MAX_TURNS).
+            token_budget (int): The number of tokens kept per conversation (default: Config.MEMORY_TOKEN_BUDGET).
+            idle_timeout (float): Seconds of inactivity before a conversation is evicted (default: Config.MEMORY_IDLE_TIMEOUT).
+            db_path (str): The SQLite database file; None keeps history in memory only (default: Config.MEMORY_DB_PATH).
+        """
+        self.max_conversations = max_conversations or Config.MEMORY_MAX_CONVERSATIONS
+        self.max_turns = max_turns or Config.MEMORY_MAX_TURNS
+        self.token_budget = token_budget or Config.MEMORY_TOKEN_BUDGET
+        self.idle_timeout = idle_timeout or Config.MEMORY_IDLE_TIMEOUT
+        self._conversations = OrderedDict()
+        self._db = None
+        self._db_lock = threading.Lock()
+        db_path = db_path or Config.MEMORY_DB_PATH
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS turns ("
+                "conversation_id TEXT NOT NULL, role TEXT NOT NULL, content TEXT NOT NULL, timestamp REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS turns_by_conversation ON turns (conversation_id, timestamp)")
+            self._db.commit()
+
+    def __len__(self):
+        return len(self._conversations)
+
+    async def add_turn(self, conversation_id, role, content):
+        """
+        Record a message in a conversation.
+
+        Args:
+            conversation_id (str): The conversation key.
+            role (str): "user" or "assistant".
+            content (str): The message text.
+        """
+        conversation = await self._get(conversation_id)
+        turn = Turn(role, content)
+        conversation.add(turn, self.token_budget)
+        if self._db is not None:
+            await asyncio.to_thread(self._save_turn, conversation_id, turn)
+
+    async def context(self, conversation_id, token_budget=None):
+        """
+        Build the chat history to send to the model for a conversation.
+
+        Args:
+            conversation_id (str): The conversation key.
+            token_budget (int): The maximum tokens of history to include (default: the store's budget).
+
+        Returns:
+            list: The recent turns as dictionaries with "role" and "content".
+        """
+        conversation = await self._get(conversation_id)
+        turns = conversation.window(token_budget or self.token_budget)
+        return [{"role": turn.role, "content": turn.content} for turn in turns]
+
+    def evict_idle(self):
+        """
+        Drop conversations that have been idle longer than the idle timeout.
+
+        Returns:
+            int: The number of conversations evicted.
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        evicted = 0
+        while self._conversations:
+            conversation = next(iter(self._conversations.values()))
+            if conversation.last_active > cutoff:
+                break
+            self._conversations.popitem(last=False)
+            evicted += 1
+        return evicted
+
+    def close(self):
+        """
+        Close the SQLite database, if any.
+        """
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+
+    async def _get(self, conversation_id):
+        conversation = self._conversations.get(conversation_id)
+        if conversation is not None:
+            self._conversations.move_to_end(conversation_id)
+            return conversation
+        self.evict_idle()
+        conversation = Conversation(conversation_id, self.max_turns)
+        if self._db is not None:
+            for role, content, timestamp in await asyncio.to_thread(self._load_turns, conversation_id):
+                conversation.add(Turn(role, content, timestamp), self.token_budget)
+            # Another caller may have loaded the same conversation while we waited
+            if conversation_id in self._conversations:
+                return self._conversations[conversation_id]
+        self._conversations[conversation_id] = conversation
+        while len(self._conversations) > self.max_conversations:
+            evicted_id, _ = self._conversations.popitem(last=False)
+            logging.debug(f"Evicted conversation {evicted_id} from memory")
+        return conversation
+
+    def _load_turns(self, conversation_id):
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT role, content, timestamp FROM turns WHERE conversation_id = ? ORDER BY timestamp DESC LIMIT ?",
+                (conversation_id, self.max_turns)
+            ).fetchall()
+        return list(reversed(rows))
+
+    def _save_turn(self, conversation_id, turn):
+        with self._db_lock:
+            self._db.execute(
+                "INSERT INTO turns (conversation_id, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                (conversation_id, turn.role, turn.content, turn.timestamp)
+            )
+            # Keep only the turns that could ever be loaded back
+            self._db.execute(
+                "DELETE FROM turns WHERE conversation_id = ? AND timestamp < ("
+                "SELECT MIN(timestamp) FROM (SELECT timestamp FROM turns WHERE conversation_id = ? "
+                "ORDER BY timestamp DESC LIMIT ?))",
+                (conversation_id, conversation_id, self.max_turns)
+            )
+            self._db.commit()
+
+def get_conversation_store():
+    """
+    Get the shared conversation store, creating it on first use.
+
+    Returns:
+        ConversationStore: The store configured from Config.
+    """
+    global _store
+    if _store is None:
+        _store = ConversationStore()
+        Config.add_reload_listener(_apply_config)
+    return _store
+
+def _apply_config(changed):
+    _store.max_conversations = Config.MEMORY_MAX_CONVERSATIONS
+    _store.token_budget = Config.MEMORY_TOKEN_BUDGET
+    _store.idle_timeout = Config.MEMORY_IDLE_TIMEOUT
@@ -1,110 +1,54 @@
-import os
+import time
 import logging
 import discord
 from discord.ext import commands
-import aiohttp
 import asyncio
-from nltk import word_tokenize, pos_tag, ne_chunk
-from nltk.tree import Tree
-import nltk
-import openai
 from pypresence import Presence
-import signal
+import aviation_client
+import discord_render
+from flight_board import LiveFlightBoard
+from chat_commands import AviationCommands
+from command_registry import registry
 from config import Config
-from utils import setup_nltk, make_api_request, get_continuous_chunks, perform_web_search, format_search_results
-
-# Set up detailed logging
-logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)-8s %(name)-12s %(message)s')
-
-# Ensure NLTK modules are downloaded
-setup_nltk()
+from message_bus import ChatMessage, get_message_bus
+from reference_data import get_reference_index
 
 # Discord Bot Setup
 intents = discord.Intents.all()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
-
-# Discord Rich Presence setup
-client_id = Config.DISCORD_CLIENT_ID  # Replace with your Discord application's client ID
-RPC = Presence(client_id)
-RPC.connect()
-
-def get_airport_info(airport_code):
-    """
-    Retrieve airport information for a given airport code.
-
-    Args:
-        airport_code (str): The IATA airport code.
 
-    Returns:
-        dict: The airport information as a dictionary, or None if not found.
-    """
-    url = f'https://aviation-edge.com/v2/public/airportDatabase?key={Config.AVIATION_EDGE_API_KEY}&codeIataAirport={airport_code}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        logging.error(f"Failed to fetch airport info: {response.status_code}")
-        return None
+# The bot, created by run_discord_bot. discord.py 1.x binds a Bot to the event
+# loop of the thread creating it, and main imports this module on a worker thread.
+bot = None
 
-def get_flight_info(airport_code):
-    """
-    Retrieve real-time flight information for a given airport code.
+# Discord Rich Presence client, connected when the bot starts
+RPC = None
 
-    Args:
-        airport_code (str): The IATA airport code.
-
-    Returns:
-        dict: The flight information as a dictionary, or None if not found.
-    """
-    url = f'https://aviation-edge.com/v2/public/flights?key={Config.AVIATION_EDGE_API_KEY}&arrIata={airport_code}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        logging.error(f"Failed to fetch flight info: {response.status_code}")
-        return None
-
-def get_notams(airport_code):
-    """
-    Retrieve NOTAMs (Notices to Airmen) for a given airport code.
-
-    Args:
-        airport_code (str): The IATA airport code.
-
-    Returns:
-        dict: The NOTAMs as a dictionary, or None if not found.
-    """
-    url = f'https://aviation-edge.com/v2/public/notams?key={Config.AVIATION_EDGE_API_KEY}&codeIataAirport={airport_code}'
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        logging.error(f"Failed to fetch NOTAMs: {response.status_code}")
-        return None
+# Live flight board tasks, keyed by channel ID and airport code
+flight_boards = {}
 
-def get_tafs(airport_code):
+def connect_discord_presence():
     """
-    Retrieve TAFs (Terminal Aerodrome Forecasts) for a given airport code.
-
-    Args:
-        airport_code (str): The IATA airport code.
-
-    Returns:
-        dict: The TAFs as a dictionary, or None if not found.
+    Connect to Discord Rich Presence (blocking).
     """
-    url = f'https://aviation-edge.com/v2/public/weather?key={Config.AVIATION_EDGE_API_KEY}&codeIataAirport={airport_code}&type=taf'
-    response = requests.get(url)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        logging.error(f"Failed to fetch TAFs: {response.status_code}")
-        return None
+    global RPC
+    if not Config.DISCORD_CLIENT_ID:
+        logging.info("DISCORD_CLIENT_ID is not set; Discord Rich Presence disabled.")
+        return
+    try:
+        RPC = Presence(Config.DISCORD_CLIENT_ID)
+        RPC.connect()
+        logging.info("Connected to Discord Rich Presence successfully.")
+    except Exception as e:
+        RPC = None
+        logging.error(f"Failed to connect to Discord Rich Presence: {e}")
 
 def update_discord_presence():
     """
     Update the Discord Rich Presence status.
     """
+    if RPC is None:
+        return
     try:
         # Example: Update Discord Rich Presence to reflect user's current activity
         RPC.update(state="Engaged in Activity",
@@ -125,25 +69,16 @@ def disconnect_discord_presence():
     """
     Disconnect from Discord Rich Presence.
     """
+    global RPC
+    if RPC is None:
+        return
     try:
         RPC.close()
         logging.info("Disconnected from Discord Rich Presence successfully.")
     except Exception as e:
         logging.error(f"Failed to disconnect from Discord Rich Presence: {e}")
+    RPC = None
 
-def signal_handler(sig, frame):
-    """
-    Signal handler for graceful shutdown.
-    """
-    logging.info('Shutdown signal received. Disconnecting from Discord Rich Presence...')
-    disconnect_discord_presence()
-    # Perform any other cleanup tasks here
-    sys.exit(0)
-
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
-
-@bot.event
 async def on_ready():
     """
     Event listener for when the bot is ready.
@@ -151,110 +86,259 @@ async def on_ready():
     print(f'{bot.user.name} has connected to Discord!')
     logging.info(f'Logged in as {bot.user}')
 
-@bot.command(name='metar')
-async def metar_command(ctx, *, station_code: str):
+class DiscordCommands(AviationCommands):
     """
-    Command to fetch METAR data for a given station code.
+    The shared chat commands as offered on Discord.
+    """
+
+    platform = "discord"
+
+    async def reply(self, message, text):
+        """
+        Send a reply from the message bus to the channel the command came from.
+
+        Args:
+            message (message_bus.ChatMessage): The message being answered.
+            text (str): The reply text.
+        """
+        await message.reply_to.send(text)
+
+discord_commands = DiscordCommands()
+
+def make_discord_command(command):
+    """
+    Wrap a shared registry command as a Discord bot command.
+
+    The command is published to the shared message bus, so it runs on the
+    same worker pool as the other platforms' commands.
+
+    Args:
+        command (command_registry.Command): The registry command.
+
+    Returns:
+        discord.ext.commands.Command: The Discord command running the registry command.
+    """
+    async def callback(ctx, *, argument=""):
+        await get_message_bus().publish(ChatMessage(
+            platform=discord_commands.platform,
+            channel=str(ctx.channel.id),
+            author=ctx.author.name,
+            text=f"{registry.prefix}{command.name} {argument}".rstrip(),
+            reply_to=ctx
+        ))
+    return commands.Command(callback, name=command.name, aliases=list(command.aliases), help=command.description)
+
+@commands.command(name='airportinfo')
+async def airport_info(ctx, *, query: str = ""):
+    """
+    Command to fetch and display airport information for an airport code or name.
+
+    The bundled reference data answers codes and names such as "heathrow"
+    locally. A 3- or 4-letter code it does not know is looked up on
+    aviation-edge rather than matched against names, unless it was typed in
+    lower case and aviation-edge has no such airport, e.g. "oslo".
 
     Args:
         ctx: The command context.
-        station_code (str): The ICAO station code.
+        query (str): The IATA or ICAO airport code, or part of the airport or city name.
     """
     try:
-        station_code = station_code.upper().strip()
-        if re.match(r'\b[A-Z]{4}\b', station_code):
-            metar_data = await fetch_metar(station_code)
-            await ctx.send(metar_data)
+        query = query.strip()
+        if not query:
+            await ctx.send("Please provide an airport code or name.")
+            return
+        index = get_reference_index()
+        code = query.upper()
+        if aviation_client.IATA_CODE.match(code) or aviation_client.ICAO_CODE.match(code):
+            airport = index.airport(code)
+            if airport is not None:
+                await send_reference_airports(ctx, [airport])
+                return
+            info = await aviation_client.fetch_airport_database(code)
+            if info:
+                for page in discord_render.render_airports(info):
+                    await ctx.send(page)
+                return
+            if query == code:
+                await ctx.send("Airport information not found.")
+                return
+        airports = index.search_airports(query)
+        if airports:
+            await send_reference_airports(ctx, airports)
         else:
-            await ctx.send("Please provide a valid ICAO airport code.")
+            await ctx.send("Airport information not found.")
     except Exception as e:
-        logging.error(f"Error in metar command: {e}")
+        logging.error(f"Error in airportinfo command: {e}")
         await ctx.send("An error occurred while processing the command.")
 
-@bot.command(name='airportinfo')
-async def airport_info(ctx, airport_code: str):
+async def send_reference_airports(ctx, airports):
     """
-    Command to fetch and display airport information for a given airport code.
+    Send bundled airport records as one message.
 
     Args:
         ctx: The command context.
-        airport_code (str): The IATA airport code.
+        airports (list): The reference_data.Airport records.
     """
-    try:
-        info = get_airport_info(airport_code)
+    await ctx.send("\n\n".join(
+        aviation_client.format_airport_info(aviation_client.AirportInfo(airport.iata, airport.name, airport.city, airport.country))
+        for airport in airports
+    ))
+
+async def send_airport_lookups(ctx, fetch, render, argument, not_found):
+    """
+    Look up several airports concurrently and send the replies for each airport.
+
+    Args:
+        ctx: The command context.
+        fetch (Callable): The aviation_client coroutine function looking up one airport.
+        render (Callable): The discord_render function turning an airport code and its records into messages.
+        argument (str): The airport codes given to the command.
+        not_found (str): The reply for an airport without results.
+    """
+    airport_codes = aviation_client.parse_airport_codes(argument)
+    if airport_codes is None:
+        await ctx.send(f"Please provide up to {Config.AVIATION_EDGE_MAX_CODES} IATA airport codes, e.g. LHR JFK CDG.")
+        return
+    results = await aviation_client.fetch_for_airports(fetch, airport_codes)
+    for airport_code, info in results.items():
         if info:
-            await ctx.send(json.dumps(info, indent=2))
+            for page in render(airport_code, info):
+                await ctx.send(page)
         else:
-            await ctx.send("Airport information not found.")
-    except Exception as e:
-        logging.error(f"Error in airportinfo command: {e}")
-        await ctx.send("An error occurred while processing the command.")
+            await ctx.send(f"{airport_code}: {not_found}")
 
-@bot.command(name='flightinfo')
-async def flight_info(ctx, airport_code: str):
+@commands.command(name='flightinfo')
+async def flight_info(ctx, *, airport_codes: str = ""):
     """
-    Command to fetch and display flight information for a given airport code.
+    Command to fetch and display flight information for one or more airport codes.
 
     Args:
         ctx: The command context.
-        airport_code (str): The IATA airport code.
+        airport_codes (str): The IATA airport codes, e.g. "LHR JFK".
     """
     try:
-        info = get_flight_info(airport_code)
-        if info:
-            await ctx.send(json.dumps(info, indent=2))
-        else:
-            await ctx.send("Flight information not found.")
+        await send_airport_lookups(ctx, aviation_client.fetch_flights, discord_render.render_flights, airport_codes, "Flight information not found.")
     except Exception as e:
         logging.error(f"Error in flightinfo command: {e}")
         await ctx.send("An error occurred while processing the command.")
 
-@bot.command(name='notams')
-async def notams(ctx, airport_code: str):
+@commands.command(name='flightboard')
+async def flight_board(ctx, airport_code: str = "", action: str = ""):
     """
-    Command to fetch and display NOTAMs for a given airport code.
+    Command to post a live arrivals board for an airport and keep it updated.
+
+    The board is posted once and then edited in place whenever a flight is
+    added, changes status or leaves, until Config.FLIGHT_BOARD_DURATION has
+    passed or "!flightboard <code> stop" is sent.
 
     Args:
         ctx: The command context.
         airport_code (str): The IATA airport code.
+        action (str): "stop" to stop the board, otherwise empty.
     """
-    try:
-        info = get_notams(airport_code)
-        if info:
-            await ctx.send(json.dumps(info, indent=2))
+    airport_code = airport_code.upper()
+    if not aviation_client.IATA_CODE.match(airport_code):
+        await ctx.send("Please provide an IATA airport code, e.g. !flightboard LHR.")
+        return
+    key = (ctx.channel.id, airport_code)
+    task = flight_boards.get(key)
+    if action.lower() == "stop":
+        if task is None:
+            await ctx.send(f"There is no live flight board for {airport_code} in this channel.")
         else:
-            await ctx.send("NOTAMs not found.")
+            task.cancel()
+            await ctx.send(f"Stopped the flight board for {airport_code}.")
+        return
+    if task is not None:
+        await ctx.send(f"The flight board for {airport_code} is already live in this channel.")
+        return
+    if len(flight_boards) >= Config.FLIGHT_BOARD_MAX_ACTIVE:
+        await ctx.send("Too many flight boards are live right now. Please try again later.")
+        return
+    board = LiveFlightBoard(airport_code, ctx.send)
+    task = asyncio.create_task(board.run(), name=f"flightboard-{airport_code}")
+    flight_boards[key] = task
+    task.add_done_callback(lambda done: flight_board_finished(key, done))
+
+def flight_board_finished(key, task):
+    """
+    Forget a flight board whose task has ended, logging why it failed if it did.
+
+    Args:
+        key (tuple): The channel ID and airport code of the board.
+        task (asyncio.Task): The finished board task.
+    """
+    flight_boards.pop(key, None)
+    if not task.cancelled() and task.exception() is not None:
+        logging.error(f"Flight board for {key[1]} failed: {task.exception()}")
+
+@commands.command(name='notams')
+async def notams(ctx, *, airport_codes: str = ""):
+    """
+    Command to fetch and display NOTAMs for one or more airport codes.
+
+    Args:
+        ctx: The command context.
+        airport_codes (str): The IATA airport codes, e.g. "LHR JFK".
+    """
+    try:
+        await send_airport_lookups(ctx, aviation_client.fetch_edge_notams, discord_render.render_notams, airport_codes, "NOTAMs not found.")
     except Exception as e:
         logging.error(f"Error in notams command: {e}")
         await ctx.send("An error occurred while processing the command.")
 
-@bot.command(name='tafs')
-async def tafs(ctx, airport_code: str):
+@commands.command(name='tafs')
+async def tafs(ctx, *, airport_codes: str = ""):
     """
-    Command to fetch and display TAFs for a given airport code.
+    Command to fetch and display TAFs for one or more airport codes.
 
     Args:
         ctx: The command context.
-        airport_code (str): The IATA airport code.
+        airport_codes (str): The IATA airport codes, e.g. "LHR JFK CDG".
     """
     try:
-        info = get_tafs(airport_code)
-        if info:
-            await ctx.send(json.dumps(info, indent=2))
-        else:
-            await ctx.send("TAFs not found.")
+        await send_airport_lookups(ctx, aviation_client.fetch_edge_tafs, discord_render.render_tafs, airport_codes, "TAFs not found.")
     except Exception as e:
         logging.error(f"Error in tafs command: {e}")
         await ctx.send("An error occurred while processing the command.")
 
-async def run_discord_bot():
+# The Discord-only commands, added to the bot next to the shared registry commands
+BOT_COMMANDS = (airport_info, flight_info, flight_board, notams, tafs)
+
+def create_bot():
     """
-    Run the Discord bot.
+    Create the Discord bot with every command added, bound to the running event loop.
+
+    Returns:
+        discord.ext.commands.Bot: The new bot.
     """
-    await bot.start(Config.DISCORD_BOT_TOKEN)
+    new_bot = commands.Bot(command_prefix=registry.prefix, intents=intents, help_command=None)
+    new_bot.add_listener(on_ready)
+    for registered_command in registry.commands_for(DiscordCommands.platform):
+        new_bot.add_command(make_discord_command(registered_command))
+    for command in BOT_COMMANDS:
+        new_bot.add_command(command)
+    return new_bot
 
 async def run_discord_bot():
     """
     Run the Discord bot.
+
+    The bot and its Rich Presence connection are created here rather than at
+    import time, so importing this module has no side effects. A fresh bot is
+    created on every run, so a restart by the supervisor starts clean.
     """
-    await bot.start(Config.DISCORD_BOT_TOKEN)
+    global bot
+    bot = create_bot()
+    bus = get_message_bus()
+    bus.register(discord_commands)
+    bus.start()
+    await asyncio.to_thread(connect_discord_presence)
+    try:
+        await bot.start(Config.DISCORD_BOT_TOKEN)
+    finally:
+        bus.unregister(discord_commands)
+        for task in list(flight_boards.values()):
+            task.cancel()
+        await asyncio.to_thread(disconnect_discord_presence)
+        await bot.close()
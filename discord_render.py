@@ -0,0 +1,219 @@
+# discord_render.py
+import json
+import math
+from config import Config
+
+# Discord rejects messages longer than this many characters
+DISCORD_MESSAGE_LIMIT = 2000
+
+# Room kept on the last page for the "…and N more." footer
+FOOTER_RESERVE = 24
+
+ELLIPSIS = "…"
+
+# aviation-edge has no fixed text field for NOTAMs and TAFs; the first of these that is present is shown
+TEXT_FIELDS = ("raw", "rawText", "raw_text", "text", "notamText", "message", "all")
+
+def field(record, path, default=""):
+    """
+    Read a nested field from an upstream record.
+
+    Args:
+        record (dict): The record, e.g. one flight from aviation-edge.
+        path (str): The dotted path of the field, e.g. "flight.iataNumber".
+        default (Any): The value returned if the field is missing or empty (default: "").
+
+    Returns:
+        The field value, or the default.
+    """
+    value = record
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return default if value in (None, "") else value
+
+def shorten(text, width):
+    """
+    Cut text to a maximum width, marking the cut with an ellipsis.
+
+    Args:
+        text (str): The text.
+        width (int): The maximum number of characters.
+
+    Returns:
+        str: The text, shortened if necessary.
+    """
+    return text if len(text) <= width else text[:width - len(ELLIPSIS)] + ELLIPSIS
+
+def as_records(records):
+    """
+    Treat an upstream answer as a list of records.
+
+    Args:
+        records (Any): A list of records, or a single record dict as some endpoints return.
+
+    Returns:
+        list: The records.
+    """
+    return [records] if isinstance(records, dict) else records
+
+def render_records(title, records, format_record, limit=DISCORD_MESSAGE_LIMIT, max_pages=None):
+    """
+    Render records as one line each, packed into as few messages as fit.
+
+    Records are formatted lazily: once the last page is full, the remaining
+    records are only counted, not formatted.
+
+    Args:
+        title (str): The first line of the first message.
+        records (list): The records to render; a single dict counts as one record.
+        format_record (Callable): A function formatting one record as a line of text.
+        limit (int): The maximum length of one message (default: DISCORD_MESSAGE_LIMIT).
+        max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+    Returns:
+        list: The messages to send, each at most limit characters long.
+    """
+    max_pages = max_pages or Config.DISCORD_MAX_PAGES
+    records = as_records(records)
+    pages = []
+    page = shorten(title, limit - FOOTER_RESERVE)
+    shown = 0
+    for record in records:
+        line = shorten(format_record(record), limit - FOOTER_RESERVE)
+        if not line:
+            shown += 1
+            continue
+        on_last_page = len(pages) == max_pages - 1
+        reserve = FOOTER_RESERVE if on_last_page else 0
+        if page and len(page) + 1 + len(line) + reserve > limit:
+            if on_last_page:
+                break
+            pages.append(page)
+            page = line
+        else:
+            page = f"{page}\n{line}" if page else line
+        shown += 1
+    if shown < len(records):
+        page += f"\n{ELLIPSIS}and {len(records) - shown} more."
+    pages.append(page)
+    return pages
+
+def format_flight(flight):
+    """
+    Format an aviation-edge flight record as one line.
+
+    Args:
+        flight (dict): The flight record.
+
+    Returns:
+        str: The flight number, route, status and aircraft, e.g. "BA117 LHR→JFK en-route B77W".
+    """
+    number = field(flight, "flight.iataNumber") or field(flight, "flight.icaoNumber", "?")
+    route = f"{field(flight, 'departure.iataCode', '?')}→{field(flight, 'arrival.iataCode', '?')}"
+    details = [number, route, field(flight, "status"), field(flight, "aircraft.icaoCode")]
+    altitude = field(flight, "geography.altitude", None)
+    if not field(flight, "speed.isGround", False):
+        try:
+            altitude = float(altitude)
+        except (TypeError, ValueError):
+            # Missing or malformed upstream values are left out rather than failing the whole page
+            altitude = None
+        if altitude is not None and math.isfinite(altitude):
+            details.append(f"{altitude:.0f} m")
+    return " ".join(str(detail) for detail in details if detail)
+
+def format_text_record(record):
+    """
+    Format an aviation-edge NOTAM or TAF record as one line.
+
+    Args:
+        record (dict): The record.
+
+    Returns:
+        str: The record's text field, or its compact JSON if it has none.
+    """
+    for name in TEXT_FIELDS:
+        text = field(record, name)
+        if text:
+            return " ".join(str(text).split())
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+def format_airport_record(airport):
+    """
+    Format an aviation-edge airport database record as one line.
+
+    Args:
+        airport (dict): The airport record.
+
+    Returns:
+        str: The airport name, codes, country, position and time zone.
+    """
+    codes = "/".join(code for code in (field(airport, "codeIataAirport"), field(airport, "codeIcaoAirport")) if code)
+    line = f"{field(airport, 'nameAirport', 'Unknown airport')} ({codes})"
+    country = field(airport, "nameCountry")
+    if country:
+        line += f", {country}"
+    latitude, longitude = field(airport, "latitudeAirport", None), field(airport, "longitudeAirport", None)
+    if latitude is not None and longitude is not None:
+        line += f" at {float(latitude):.3f}, {float(longitude):.3f}"
+    timezone = field(airport, "timezone")
+    if timezone:
+        line += f" ({timezone})"
+    return line
+
+def render_flights(airport_code, flights, max_pages=None):
+    """
+    Render the flights arriving at an airport.
+
+    Args:
+        airport_code (str): The IATA airport code.
+        flights (list): The aviation-edge flight records.
+        max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+    Returns:
+        list: The messages to send.
+    """
+    return render_records(f"**Flights arriving at {airport_code}** ({len(as_records(flights))})", flights, format_flight, max_pages=max_pages)
+
+def render_notams(airport_code, notams, max_pages=None):
+    """
+    Render the NOTAMs for an airport.
+
+    Args:
+        airport_code (str): The IATA airport code.
+        notams (list): The aviation-edge NOTAM records.
+        max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+    Returns:
+        list: The messages to send.
+    """
+    return render_records(f"**NOTAMs for {airport_code}** ({len(as_records(notams))})", notams, format_text_record, max_pages=max_pages)
+
+def render_tafs(airport_code, tafs, max_pages=None):
+    """
+    Render the TAFs for an airport.
+
+    Args:
+        airport_code (str): The IATA airport code.
+        tafs (list): The aviation-edge TAF records.
+        max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+    Returns:
+        list: The messages to send.
+    """
+    return render_records(f"**TAFs for {airport_code}**", tafs, format_text_record, max_pages=max_pages)
+
+def render_airports(airports, max_pages=None):
+    """
+    Render aviation-edge airport database records.
+
+    Args:
+        airports (list): The airport records.
+        max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+    Returns:
+        list: The messages to send.
+    """
+    return render_records("", airports, format_airport_record, max_pages=max_pages)
@@ -0,0 +1,147 @@
+# dispatcher.py
+import time
+import logging
+import asyncio
+from collections import deque
+from config import Config
+
+# Queued in place of a user to make one worker exit
+RETIRE = object()
+
+class MessageDispatcher:
+    """
+    Dispatches chat messages to a handler through a bounded pool of worker tasks.
+
+    Messages are queued per user and users are served round-robin, with at most
+    one message per user in progress, so a single busy user cannot starve the
+    others. Once the number of pending messages reaches the limit, submit()
+    waits until a worker frees a slot.
+    """
+
+    def __init__(self, handler, concurrency=None, max_pending=None, name="dispatcher"):
+        """
+        Initialize the MessageDispatcher instance.
+
+        Args:
+            handler (Callable): A coroutine function called with each message.
+            concurrency (int): The number of worker tasks (default: Config.DISPATCH_CONCURRENCY).
+            max_pending (int): The number of queued messages before submit() waits (default: Config.DISPATCH_MAX_PENDING).
+            name (str): A name used when logging dispatcher activity (default: "dispatcher").
+        """
+        self.handler = handler
+        self.concurrency = concurrency or Config.DISPATCH_CONCURRENCY
+        self.max_pending = max_pending or Config.DISPATCH_MAX_PENDING
+        self.name = name
+        self._pending = {}
+        self._ready = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._workers = []
+        self.depth = 0
+        self.max_depth = 0
+        self.processed = 0
+        self.failed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def start(self):
+        """
+        Start the worker tasks.
+        """
+        if not self._workers:
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+            logging.info(f"{self.name}: started {self.concurrency} workers")
+
+    def resize(self, concurrency):
+        """
+        Change the number of worker tasks while running.
+
+        Extra workers finish the message they are handling before they exit.
+
+        Args:
+            concurrency (int): The new number of worker tasks.
+        """
+        if self._workers:
+            for _ in range(concurrency - self.concurrency):
+                self._workers.append(asyncio.create_task(self._worker()))
+            for _ in range(self.concurrency - concurrency):
+                self._ready.put_nowait(RETIRE)
+        logging.info(f"{self.name}: resized from {self.concurrency} to {concurrency} workers")
+        self.concurrency = concurrency
+
+    async def stop(self):
+        """
+        Cancel the worker tasks and wait for them to finish.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        logging.info(f"{self.name}: stopped, {self.stats()}")
+
+    async def submit(self, user, message):
+        """
+        Queue a message for processing, waiting while the queue is full.
+
+        Args:
+            user (str): The author of the message, used for fairness between users.
+            message (Any): The message passed to the handler.
+        """
+        await self._slots.acquire()
+        queue = self._pending.get(user)
+        if queue is None:
+            self._pending[user] = deque([(time.monotonic(), message)])
+            self._ready.put_nowait(user)
+        else:
+            queue.append((time.monotonic(), message))
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    async def join(self):
+        """
+        Wait until every queued message has been handled.
+        """
+        await self._ready.join()
+
+    def stats(self):
+        """
+        Report dispatcher metrics.
+
+        Returns:
+            dict: The queue depth, peak depth, processed and failed counts, and average and maximum wait in seconds.
+        """
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "processed": self.processed,
+            "failed": self.failed,
+            "avg_wait": self.total_wait / self.processed if self.processed else 0.0,
+            "max_wait": self.max_wait
+        }
+
+    async def _worker(self):
+        while True:
+            user = await self._ready.get()
+            if user is RETIRE:
+                self._ready.task_done()
+                self._workers.remove(asyncio.current_task())
+                return
+            queue = self._pending[user]
+            enqueued_at, message = queue.popleft()
+            self.depth -= 1
+            self._slots.release()
+            wait = time.monotonic() - enqueued_at
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            try:
+                await self.handler(message)
+            except Exception as e:
+                self.failed += 1
+                logging.error(f"{self.name}: error handling message from {user}: {e}")
+            finally:
+                self.processed += 1
+                # Put the user back at the end of the line if they have more messages waiting
+                if queue:
+                    self._ready.put_nowait(user)
+                else:
+                    del self._pending[user]
+                self._ready.task_done()
@@ -0,0 +1,230 @@
+# entity_extraction.py
+import re
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from config import Config
+
+# NLTK data paths and the package that provides each
+NLTK_RESOURCES = [
+    ("tokenizers/punkt_tab", "punkt_tab"),
+    ("taggers/averaged_perceptron_tagger_eng", "averaged_perceptron_tagger_eng"),
+    ("chunkers/maxent_ne_chunker_tab", "maxent_ne_chunker_tab"),
+    ("corpora/words", "words"),
+]
+
+ICAO_CODE = re.compile(r"\b[A-Z]{4}\b")
+IATA_CODE = re.compile(r"\b[A-Z]{3}\b")
+AIRCRAFT_TYPE = re.compile(
+    r"\b(?:A3[1-8]\d(?:neo)?|B?7[0-8]7(?:-\d{1,3})?|E1[79]\d|CRJ-?\d{3}|ATR ?[47]2|Q400|DHC-?8|C1[5-8]\d)\b",
+    re.IGNORECASE
+)
+
+# The named-entity chunker relies on capitalisation, so a message without a
+# capitalised word or an aviation code has no entities to find
+CAPITALIZED_WORD = re.compile(r"\b[A-Z]")
+
+# Extractor shared by every front-end, created on first use
+_extractor = None
+
+@dataclass
+class AviationCodes:
+    """
+    Airport codes and aircraft types mentioned in a message.
+    """
+    icao: tuple
+    iata: tuple
+    aircraft: tuple
+
+    def __bool__(self):
+        return bool(self.icao or self.iata or self.aircraft)
+
+def find_aviation_codes(text):
+    """
+    Find candidate ICAO codes, IATA codes and aircraft types in a message without running NLTK.
+
+    Args:
+        text (str): The message text.
+
+    Returns:
+        AviationCodes: The distinct codes found, in order of appearance.
+    """
+    return AviationCodes(
+        icao=tuple(dict.fromkeys(ICAO_CODE.findall(text))),
+        iata=tuple(dict.fromkeys(IATA_CODE.findall(text))),
+        aircraft=tuple(dict.fromkeys(match.upper() for match in AIRCRAFT_TYPE.findall(text)))
+    )
+
+def might_contain_names(text):
+    """
+    Check cheaply whether a message could contain named entities.
+
+    Args:
+        text (str): The message text.
+
+    Returns:
+        bool: False if the message has no capitalised word and find_aviation_codes finds nothing in it.
+    """
+    return bool(CAPITALIZED_WORD.search(text) or find_aviation_codes(text))
+
+def ensure_nltk_resources():
+    """
+    Download any NLTK data the entity extractor needs that is not installed yet (blocking).
+    """
+    import nltk
+    for path, package in NLTK_RESOURCES:
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            logging.info(f"Downloading NLTK resource {package}")
+            nltk.download(package, quiet=True)
+
+def names_from_tree(tree):
+    """
+    Collect the named entities from a chunked sentence.
+
+    Adjacent entity subtrees are joined into one name, as before.
+
+    Args:
+        tree (nltk.tree.Tree): The output of the named-entity chunker.
+
+    Returns:
+        tuple: The distinct entity names, in order of appearance.
+    """
+    from nltk.tree import Tree
+    names = {}
+    current = []
+    for node in tree:
+        if isinstance(node, Tree):
+            current.append(" ".join(token for token, _ in node.leaves()))
+        elif current:
+            names[" ".join(current)] = None
+            current = []
+    if current:
+        names[" ".join(current)] = None
+    return tuple(names)
+
+class EntityExtractor:
+    """
+    Extracts named entities from chat messages with NLTK.
+
+    The tokenizer, tagger and chunker are loaded once, lazily, on a background
+    thread, and results are cached by message text. Messages with no capitalised
+    word and no airport code or aircraft type are skipped without running NLTK;
+    most chat messages start with a capital letter, so the cache does most of the saving.
+    """
+
+    def __init__(self, cache_size=None):
+        """
+        Initialize the EntityExtractor instance.
+
+        Args:
+            cache_size (int): The number of message results kept (default: Config.NER_CACHE_SIZE).
+        """
+        self.cache_size = cache_size or Config.NER_CACHE_SIZE
+        self._loader = ThreadPoolExecutor(1, thread_name_prefix="ner-loader")
+        self._loading = None
+        self._loading_lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+
+    def warm_up(self):
+        """
+        Start loading the NLTK models in the background if they are not loaded yet.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the loaded models.
+        """
+        with self._loading_lock:
+            if self._loading is None:
+                self._loading = self._loader.submit(self._load_models)
+            return self._loading
+
+    def extract_sync(self, text):
+        """
+        Extract the named entities from a message on the calling thread (blocking).
+
+        Args:
+            text (str): The message text.
+
+        Returns:
+            tuple: The distinct entity names, in order of appearance.
+        """
+        cached = self._cached(text)
+        if cached is not None:
+            return cached
+        if not might_contain_names(text):
+            self.skipped += 1
+            return ()
+        names = self._extract(text)
+        self._store(text, names)
+        return names
+
+    def stats(self):
+        """
+        Report how often messages were answered from the cache or skipped.
+
+        Returns:
+            dict: The cache hits, misses, pre-filter skips and cached entries.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "skipped": self.skipped,
+            "entries": len(self._cache),
+        }
+
+    def close(self):
+        """
+        Shut down the model loading thread.
+        """
+        self._loader.shutdown(wait=False, cancel_futures=True)
+
+    def _cached(self, text):
+        names = self._cache.get(text)
+        if names is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(text)
+        self.hits += 1
+        return names
+
+    def _store(self, text, names):
+        self._cache[text] = names
+        self._cache.move_to_end(text)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _load_models(self):
+        ensure_nltk_resources()
+        from nltk import word_tokenize
+        from nltk.chunk import ne_chunker
+        from nltk.tag import PerceptronTagger
+        # pos_tag and ne_chunk reload their models on every call; keep one instance of each instead
+        models = (word_tokenize, PerceptronTagger(), ne_chunker())
+        logging.info("NLTK models loaded")
+        return models
+
+    def _extract(self, text):
+        tokenize, tagger, chunker = self.warm_up().result()
+        return names_from_tree(chunker.parse(tagger.tag(tokenize(text))))
+
+def get_entity_extractor():
+    """
+    Get the shared entity extractor, creating it on first use.
+
+    Returns:
+        EntityExtractor: The extractor configured from Config.
+    """
+    global _extractor
+    if _extractor is None:
+        _extractor = EntityExtractor()
+        Config.add_reload_listener(_apply_config)
+    return _extractor
+
+def _apply_config(changed):
+    _extractor.cache_size = Config.NER_CACHE_SIZE
@@ -0,0 +1,195 @@
+# flight_board.py
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field as dataclass_field
+from datetime import datetime, timezone
+import aviation_client
+from config import Config
+from discord_render import field, render_records
+
+@dataclass
+class BoardDiff:
+    """
+    The flights that changed between two refreshes of a flight board.
+    """
+    added: list = dataclass_field(default_factory=list)
+    changed: list = dataclass_field(default_factory=list)
+    removed: list = dataclass_field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.changed or self.removed)
+
+def flight_key(flight):
+    """
+    Identify a flight across refreshes.
+
+    The scheduled departure and the operating carrier, when the record has
+    them, keep a codeshare apart from the flight it is sold on and two legs
+    sharing a flight number apart from each other.
+
+    Args:
+        flight (dict): The aviation-edge flight record.
+
+    Returns:
+        str: The flight number, departure airport, scheduled departure and operating carrier, e.g. "BAW117 LHR 2024-07-12T08:25:00.000 BAW".
+    """
+    number = field(flight, "flight.icaoNumber") or field(flight, "flight.iataNumber", "?")
+    operator = field(flight, "codeshared.airline.icaoCode") or field(flight, "airline.icaoCode")
+    parts = [number, field(flight, "departure.iataCode", "?"), field(flight, "departure.scheduledTime"), operator]
+    return " ".join(str(part) for part in parts if part)
+
+def board_line(flight):
+    """
+    Format a flight as a board line, leaving out fields that change on every refresh.
+
+    Args:
+        flight (dict): The aviation-edge flight record.
+
+    Returns:
+        str: The flight number, origin, status and aircraft, e.g. "BA117 from LHR en-route B77W".
+    """
+    number = field(flight, "flight.iataNumber") or field(flight, "flight.icaoNumber", "?")
+    details = [number, f"from {field(flight, 'departure.iataCode', '?')}", field(flight, "status"), field(flight, "aircraft.icaoCode")]
+    return " ".join(str(detail) for detail in details if detail)
+
+class FlightBoard:
+    """
+    The last known arrivals at one airport, as board lines keyed by flight.
+
+    Each refresh is compared against the snapshot, so callers only redraw the
+    board when a flight was added, changed status or left.
+    """
+
+    def __init__(self, airport_code):
+        """
+        Initialize the FlightBoard instance.
+
+        Args:
+            airport_code (str): The IATA airport code.
+        """
+        self.airport_code = airport_code
+        self.snapshot = {}
+        self.updated_at = None
+
+    def update(self, flights, now=None):
+        """
+        Replace the snapshot with a fresh flight list.
+
+        Args:
+            flights (list): The aviation-edge flight records.
+            now (datetime): The time of the refresh (default: the system clock).
+
+        Returns:
+            BoardDiff: The keys of the flights added, changed and removed since the previous update.
+        """
+        snapshot = {flight_key(flight): board_line(flight) for flight in flights}
+        diff = BoardDiff(
+            added=[key for key in snapshot if key not in self.snapshot],
+            changed=[key for key, line in snapshot.items() if key in self.snapshot and self.snapshot[key] != line],
+            removed=[key for key in self.snapshot if key not in snapshot]
+        )
+        self.snapshot = snapshot
+        self.updated_at = now or datetime.now(timezone.utc)
+        return diff
+
+    def render(self, max_pages=None):
+        """
+        Render the board, ordered by flight so lines keep their place between refreshes.
+
+        Args:
+            max_pages (int): The maximum number of messages (default: Config.DISCORD_MAX_PAGES).
+
+        Returns:
+            list: The board messages.
+        """
+        title = f"**Arrivals board for {self.airport_code}** ({len(self.snapshot)} flights"
+        if self.updated_at is not None:
+            title += f", updated {self.updated_at:%H:%M}Z"
+        title += ")"
+        lines = [self.snapshot[key] for key in sorted(self.snapshot)]
+        return render_records(title, lines, str, max_pages=max_pages)
+
+class LiveFlightBoard:
+    """
+    Keeps a posted flight board up to date by editing its messages in place.
+
+    Messages are edited only when a flight changed and only if their own text
+    changed; pages are posted or deleted as the board grows or shrinks.
+    """
+
+    def __init__(self, airport_code, send, fetch=None, refresh_interval=None, duration=None):
+        """
+        Initialize the LiveFlightBoard instance.
+
+        Args:
+            airport_code (str): The IATA airport code.
+            send (Callable): A coroutine function posting a message and returning it. The message
+                must offer edit(content=...) and delete() coroutines, like discord.Message.
+            fetch (Callable): A coroutine function returning the flights for an airport (default: aviation_client.fetch_flights).
+            refresh_interval (float): Seconds between refreshes (default: Config.FLIGHT_BOARD_REFRESH).
+            duration (float): Seconds after which the board stops updating (default: Config.FLIGHT_BOARD_DURATION).
+        """
+        self.board = FlightBoard(airport_code)
+        self.send = send
+        self.fetch = fetch or aviation_client.fetch_flights
+        self.refresh_interval = refresh_interval or Config.FLIGHT_BOARD_REFRESH
+        self.duration = duration or Config.FLIGHT_BOARD_DURATION
+        self.messages = []
+        self._texts = []
+        self.refreshes = 0
+        self.edits = 0
+
+    async def refresh(self):
+        """
+        Fetch the flights and update the posted board if anything changed.
+
+        Returns:
+            BoardDiff: The changes since the previous refresh, or None if the flights could not be fetched.
+        """
+        flights = await self.fetch(self.board.airport_code)
+        if flights is None:
+            return None
+        self.refreshes += 1
+        diff = self.board.update(flights)
+        if diff or not self.messages:
+            await self._publish(self.board.render())
+        return diff
+
+    async def run(self):
+        """
+        Refresh the board periodically until its duration has passed.
+
+        If the first load fails, an "unavailable" message is posted instead and
+        the board stops; later failures leave the posted board as it was.
+        """
+        stop_at = time.monotonic() + self.duration
+        while True:
+            diff = await self.refresh()
+            if diff is None and not self.messages:
+                logging.warning(f"Flight board {self.board.airport_code} stopped: the first flight fetch failed")
+                await self.send(f"The flight board for {self.board.airport_code} is unavailable right now. Please try again later.")
+                return
+            if diff:
+                logging.info(
+                    f"Flight board {self.board.airport_code}: {len(diff.added)} added, "
+                    f"{len(diff.changed)} changed, {len(diff.removed)} removed"
+                )
+            if time.monotonic() + self.refresh_interval > stop_at:
+                break
+            await asyncio.sleep(self.refresh_interval)
+        logging.info(f"Flight board {self.board.airport_code} finished after {self.refreshes} refreshes and {self.edits} edits")
+
+    async def _publish(self, pages):
+        for index, page in enumerate(pages):
+            if index < len(self.messages):
+                if self._texts[index] != page:
+                    await self.messages[index].edit(content=page)
+                    self._texts[index] = page
+                    self.edits += 1
+            else:
+                self.messages.append(await self.send(page))
+                self._texts.append(page)
+        while len(self.messages) > len(pages):
+            self._texts.pop()
+            await self.messages.pop().delete()
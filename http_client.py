@@ -0,0 +1,62 @@
+# http_client.py
+import asyncio
+import logging
+import aiohttp
+from config import Config
+
+# Process-wide HTTP session shared by every bot module
+_session = None
+_session_loop = None
+
+def _create_session():
+    """
+    Create a new aiohttp session backed by a pooled, keep-alive connector.
+
+    Returns:
+        aiohttp.ClientSession: The newly created session.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=Config.HTTP_POOL_LIMIT,
+        limit_per_host=Config.HTTP_POOL_LIMIT_PER_HOST,
+        ttl_dns_cache=Config.HTTP_DNS_CACHE_TTL,
+        use_dns_cache=True,
+        keepalive_timeout=Config.HTTP_KEEPALIVE_TIMEOUT
+    )
+    timeout = aiohttp.ClientTimeout(total=Config.HTTP_REQUEST_TIMEOUT)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+def get_session():
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    The session is bound to the running event loop; a new one is created if the
+    previous session was closed or belongs to a different loop.
+
+    Returns:
+        aiohttp.ClientSession: The shared HTTP session.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = _create_session()
+        _session_loop = loop
+        logging.debug("Created shared HTTP session")
+    return _session
+
+async def start_http_session():
+    """
+    Open the shared HTTP session ahead of the first request.
+    """
+    get_session()
+    logging.info("Shared HTTP session started")
+
+async def close_http_session():
+    """
+    Close the shared HTTP session and release its pooled connections.
+    """
+    global _session, _session_loop
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logging.info("Shared HTTP session closed")
+    _session = None
+    _session_loop = None
@@ -0,0 +1,568 @@
+# llm.py
+import re
+import json
+import time
+import logging
+import asyncio
+from collections import deque
+import aiohttp
+from config import Config, parse_providers
+from conversation_memory import get_conversation_store
+from http_client import get_session
+from response_cache import get_response_cache
+
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+ANTHROPIC_MESSAGES_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_VERSION = "2023-06-01"
+
+FALLBACK_RESPONSE = "I'm sorry, I couldn't come up with a response right now. Please try again later."
+
+# A sentence ends at terminal punctuation followed by whitespace, or at a line break
+SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+# Providers need this many recent outcomes before their error rate can mark them unhealthy
+MIN_HEALTH_SAMPLES = 4
+
+# Router shared by every conversation, created on first use
+_router = None
+
+class LLMUnavailableError(Exception):
+    """
+    Raised when no language model provider produced a response.
+    """
+
+async def stream_chat_completion(messages):
+    """
+    Stream a chat completion from the OpenAI API token by token.
+
+    Args:
+        messages (list): The chat messages, as dictionaries with "role" and "content".
+
+    Yields:
+        str: Each piece of generated text as it arrives.
+
+    Raises:
+        aiohttp.ClientError: If the request fails or returns an error status.
+    """
+    headers = {
+        "Authorization": f"Bearer {Config.OPENAI_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    payload = {
+        "model": Config.OPENAI_MODEL,
+        "messages": messages,
+        "max_tokens": Config.LLM_MAX_TOKENS,
+        "stream": True
+    }
+    session = get_session()
+    async with session.post(OPENAI_CHAT_URL, headers=headers, json=payload) as response:
+        response.raise_for_status()
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            data = line[len(b"data:"):].strip()
+            if data == b"[DONE]":
+                break
+            choices = json.loads(data).get("choices") or [{}]
+            content = choices[0].get("delta", {}).get("content")
+            if content:
+                yield content
+
+def merge_consecutive_roles(messages):
+    """
+    Merge consecutive messages from the same role, as required by APIs expecting alternating turns.
+
+    Args:
+        messages (list): The chat messages, as dictionaries with "role" and "content".
+
+    Returns:
+        list: The messages with each run of same-role messages joined by newlines.
+    """
+    merged = []
+    for message in messages:
+        if merged and merged[-1]["role"] == message["role"]:
+            merged[-1] = {"role": message["role"], "content": merged[-1]["content"] + "\n" + message["content"]}
+        else:
+            merged.append(message)
+    return merged
+
+async def stream_anthropic_messages(messages):
+    """
+    Stream a reply from the Anthropic Messages API token by token.
+
+    Args:
+        messages (list): The chat messages, as dictionaries with "role" and "content".
+            System messages are sent as the system prompt.
+
+    Yields:
+        str: Each piece of generated text as it arrives.
+
+    Raises:
+        aiohttp.ClientError: If the request fails or returns an error status.
+    """
+    headers = {
+        "x-api-key": Config.ANTHROPIC_API_KEY,
+        "anthropic-version": ANTHROPIC_VERSION,
+        "Content-Type": "application/json"
+    }
+    payload = {
+        "model": Config.ANTHROPIC_MODEL,
+        "system": "\n\n".join(message["content"] for message in messages if message["role"] == "system"),
+        "messages": merge_consecutive_roles([message for message in messages if message["role"] != "system"]),
+        "max_tokens": Config.LLM_MAX_TOKENS,
+        "stream": True
+    }
+    session = get_session()
+    async with session.post(ANTHROPIC_MESSAGES_URL, headers=headers, json=payload) as response:
+        response.raise_for_status()
+        async for line in response.content:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            event = json.loads(line[len(b"data:"):].strip())
+            if event.get("type") == "message_stop":
+                break
+            if event.get("type") == "error":
+                raise aiohttp.ClientPayloadError(event.get("error", {}).get("message", "Anthropic stream error"))
+            text = event.get("delta", {}).get("text") if event.get("type") == "content_block_delta" else None
+            if text:
+                yield text
+
+class LLMProvider:
+    """
+    A language model backend, with rolling latency and error statistics.
+
+    Latency is measured to the first generated token, since that is what
+    viewers wait for when replies are streamed.
+    """
+
+    name = "provider"
+
+    def __init__(self, window=None):
+        """
+        Initialize the LLMProvider instance.
+
+        Args:
+            window (int): The number of recent requests the statistics cover (default: Config.LLM_STATS_WINDOW).
+        """
+        window = window or Config.LLM_STATS_WINDOW
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+        self.last_failure = None
+        self.requests = 0
+        self.cancelled = 0
+
+    def stream(self, messages):
+        """
+        Stream a reply to the chat messages.
+
+        Args:
+            messages (list): The chat messages, as dictionaries with "role" and "content".
+
+        Returns:
+            AsyncIterator: The generated text pieces.
+        """
+        raise NotImplementedError
+
+    def record_success(self, latency):
+        """
+        Record a request that produced its first token.
+
+        Args:
+            latency (float): The time to first token, in seconds.
+        """
+        self.latencies.append(latency)
+        self.outcomes.append(True)
+
+    def record_failure(self):
+        """
+        Record a failed request.
+        """
+        self.outcomes.append(False)
+        self.last_failure = time.monotonic()
+
+    def percentile(self, percent):
+        """
+        Compute a percentile of the recent time-to-first-token latencies.
+
+        Args:
+            percent (float): The percentile, between 0 and 100.
+
+        Returns:
+            float: The latency in seconds, or 0.0 if no request has succeeded yet.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+    @property
+    def error_rate(self):
+        """
+        float: The fraction of recent requests that failed.
+        """
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def is_healthy(self):
+        """
+        Check whether the provider should receive traffic.
+
+        A provider with a high recent error rate is skipped until the cooldown
+        since its last failure has passed, after which it is tried again.
+
+        Returns:
+            bool: True if the provider is healthy.
+        """
+        if len(self.outcomes) < MIN_HEALTH_SAMPLES or self.error_rate <= Config.LLM_MAX_ERROR_RATE:
+            return True
+        return time.monotonic() - self.last_failure >= Config.LLM_UNHEALTHY_COOLDOWN
+
+    def stats(self):
+        """
+        Report the provider's rolling statistics.
+
+        Returns:
+            dict: The p50 and p95 time to first token, error rate, health, and request and cancellation counts.
+        """
+        return {
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "error_rate": self.error_rate,
+            "healthy": self.is_healthy(),
+            "requests": self.requests,
+            "cancelled": self.cancelled
+        }
+
+class OpenAIProvider(LLMProvider):
+    """
+    GPT-4o through the OpenAI Chat Completions API.
+    """
+
+    name = "openai"
+
+    def stream(self, messages):
+        return stream_chat_completion(messages)
+
+class AnthropicProvider(LLMProvider):
+    """
+    Claude 3.5 Sonnet through the Anthropic Messages API.
+    """
+
+    name = "anthropic"
+
+    def stream(self, messages):
+        return stream_anthropic_messages(messages)
+
+class StubProvider(LLMProvider):
+    """
+    A local provider returning a canned reply, for tests and offline runs.
+    """
+
+    name = "stub"
+
+    def __init__(self, reply="This is a stub response.", delay=0.0, error=None, name=None, window=None):
+        """
+        Initialize the StubProvider instance.
+
+        Args:
+            reply (str): The reply to stream, one word at a time (default: "This is a stub response.").
+            delay (float): Seconds to wait before the first token (default: 0.0).
+            error (Exception): An exception to raise instead of replying (default: None).
+            name (str): The provider name reported in statistics (default: "stub").
+            window (int): The number of recent requests the statistics cover (default: Config.LLM_STATS_WINDOW).
+        """
+        super().__init__(window)
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        if name:
+            self.name = name
+
+    async def stream(self, messages):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        words = self.reply.split(" ")
+        for index, word in enumerate(words):
+            yield word if index == len(words) - 1 else word + " "
+
+class LLMRouter:
+    """
+    Routes each request to the fastest healthy language model provider.
+
+    If the chosen provider has not produced its first token within the hedge
+    delay, the same request is also sent to the next provider; whichever
+    answers first is streamed and the other request is cancelled. A provider
+    that fails before its first token is replaced by the next one in line.
+    """
+
+    def __init__(self, providers, hedge_after=None):
+        """
+        Initialize the LLMRouter instance.
+
+        Args:
+            providers (list): The providers to route between.
+            hedge_after (float): Seconds to wait for a first token before hedging; 0 disables hedging
+                (default: Config.LLM_HEDGE_AFTER).
+        """
+        self.providers = providers
+        self.hedge_after = Config.LLM_HEDGE_AFTER if hedge_after is None else hedge_after
+
+    def ranked(self):
+        """
+        Order the providers for the next request.
+
+        Returns:
+            list: Healthy providers by median time to first token, followed by unhealthy ones.
+        """
+        return sorted(self.providers, key=lambda provider: (not provider.is_healthy(), provider.percentile(50)))
+
+    def stats(self):
+        """
+        Report every provider's rolling statistics.
+
+        Returns:
+            dict: The statistics of each provider, keyed by provider name.
+        """
+        return {provider.name: provider.stats() for provider in self.providers}
+
+    async def stream(self, messages):
+        """
+        Stream a reply from whichever provider answers first.
+
+        Args:
+            messages (list): The chat messages, as dictionaries with "role" and "content".
+
+        Yields:
+            str: Each piece of generated text as it arrives.
+
+        Raises:
+            LLMUnavailableError: If no provider is configured, or every provider failed before producing a token.
+        """
+        if not self.providers:
+            raise LLMUnavailableError("No language model provider is configured.")
+        waiting = deque(self.ranked())
+        attempts = {}
+        hedged = False
+
+        def launch():
+            provider = waiting.popleft()
+            provider.requests += 1
+            tokens = provider.stream(messages)
+            attempts[asyncio.ensure_future(tokens.__anext__())] = (provider, tokens, time.monotonic())
+
+        launch()
+        winner = None
+        try:
+            while attempts and winner is None:
+                timeout = self.hedge_after if self.hedge_after and waiting and not hedged else None
+                done, _ = await asyncio.wait(attempts, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    logging.info(f"No first token after {self.hedge_after}s, hedging with {waiting[0].name}")
+                    launch()
+                    continue
+                for task in done:
+                    provider, tokens, started = attempts.pop(task)
+                    try:
+                        first_token = task.result()
+                    except Exception as e:
+                        provider.record_failure()
+                        logging.error(f"Language model provider {provider.name} failed: {e!r}")
+                        if not attempts and waiting:
+                            launch()
+                        continue
+                    provider.record_success(time.monotonic() - started)
+                    winner = (provider, tokens, first_token)
+                    break
+        finally:
+            # Cancel the requests that lost the race (or all of them if we were cancelled)
+            for task, (provider, tokens, _) in attempts.items():
+                task.cancel()
+                provider.cancelled += 1
+            await asyncio.gather(*attempts, return_exceptions=True)
+            for provider, tokens, _ in attempts.values():
+                await tokens.aclose()
+
+        if winner is None:
+            raise LLMUnavailableError("All language model providers failed.")
+        provider, tokens, first_token = winner
+        try:
+            yield first_token
+            async for token in tokens:
+                yield token
+        except Exception:
+            provider.record_failure()
+            raise
+        finally:
+            await tokens.aclose()
+
+def build_providers(names):
+    """
+    Create the providers named in the configuration.
+
+    Args:
+        names (str): A comma-separated list of provider names, e.g. "openai,anthropic".
+
+    Returns:
+        list: The providers, skipping those whose API key is not configured.
+
+    Raises:
+        ValueError: If an unknown provider is listed or the list is empty.
+    """
+    providers = []
+    for name in parse_providers(names):
+        if name == "openai" and Config.OPENAI_API_KEY:
+            providers.append(OpenAIProvider())
+        elif name == "anthropic" and Config.ANTHROPIC_API_KEY:
+            providers.append(AnthropicProvider())
+        elif name == "stub":
+            providers.append(StubProvider())
+        else:
+            logging.warning(f"Language model provider {name} has no API key, skipping")
+    return providers
+
+def get_router():
+    """
+    Get the shared language model router, creating it on first use.
+
+    Returns:
+        LLMRouter: The router over the configured providers.
+    """
+    global _router
+    if _router is None:
+        _router = LLMRouter(build_providers(Config.LLM_PROVIDERS))
+        Config.add_reload_listener(_apply_config)
+    return _router
+
+def _apply_config(changed):
+    _router.hedge_after = Config.LLM_HEDGE_AFTER
+
+async def sentence_chunks(tokens, min_chars=None, max_chars=None):
+    """
+    Regroup a stream of tokens into sentence-sized pieces of chat text.
+
+    Args:
+        tokens (AsyncIterable): The generated text pieces.
+        min_chars (int): Hold short sentences back until a piece is at least this long (default: Config.LLM_FLUSH_MIN_CHARS).
+        max_chars (int): Flush at a word boundary once a piece grows past this length (default: Config.LLM_FLUSH_MAX_CHARS).
+
+    Yields:
+        str: Each complete piece of text, stripped of surrounding whitespace.
+    """
+    min_chars = min_chars or Config.LLM_FLUSH_MIN_CHARS
+    max_chars = max_chars or Config.LLM_FLUSH_MAX_CHARS
+    buffer = ""
+    async for token in tokens:
+        buffer += token
+        while True:
+            cut = 0
+            for match in SENTENCE_END.finditer(buffer):
+                if match.end() > max_chars:
+                    break
+                cut = match.end()
+            if cut >= min_chars or (cut and len(buffer) > max_chars):
+                piece, buffer = buffer[:cut], buffer[cut:]
+            elif len(buffer) > max_chars:
+                cut = buffer.rfind(" ", 0, max_chars) + 1 or max_chars
+                piece, buffer = buffer[:cut], buffer[cut:]
+            else:
+                break
+            if piece.strip():
+                yield piece.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+def build_messages(user_message, author, history=()):
+    """
+    Build the chat messages sent to the language model for a viewer's message.
+
+    Args:
+        user_message (str): The viewer's message.
+        author (str): The viewer's display name.
+        history (list): Earlier turns of the conversation, as dictionaries with "role" and "content" (default: none).
+
+    Returns:
+        list: The system prompt, the conversation history and the viewer's message.
+    """
+    return [
+        {"role": "system", "content": Config.LLM_SYSTEM_PROMPT},
+        *history,
+        {"role": "user", "content": format_user_message(user_message, author)}
+    ]
+
+def format_user_message(user_message, author):
+    """
+    Attribute a viewer's message to its author, since many viewers share one conversation.
+
+    Args:
+        user_message (str): The viewer's message.
+        author (str): The viewer's display name.
+
+    Returns:
+        str: The message prefixed with the author's name.
+    """
+    return f"{author}: {user_message}"
+
+async def stream_response(user_message, author, conversation_id):
+    """
+    Generate a reply to a chat message, yielding it sentence by sentence as it is generated.
+
+    Questions already answered recently in the same conversation are served from the response
+    cache without calling a model. Only replies that finished cleanly and do not address the
+    author by name are cached.
+
+    Args:
+        user_message (str): The viewer's message.
+        author (str): The viewer's display name.
+        conversation_id (str): The conversation the message belongs to, e.g. "twitch_<channel>".
+
+    Yields:
+        str: Each sentence-sized piece of the reply, or a fallback message if generation failed.
+    """
+    store = get_conversation_store()
+    cache = get_response_cache()
+    cached = cache.get(user_message, conversation_id)
+    if cached is not None:
+        for piece in cached:
+            yield piece
+        await store.add_turn(conversation_id, "user", format_user_message(user_message, author))
+        await store.add_turn(conversation_id, "assistant", " ".join(cached))
+        return
+    messages = build_messages(user_message, author, await store.context(conversation_id))
+    pieces = []
+    try:
+        async for piece in sentence_chunks(get_router().stream(messages)):
+            pieces.append(piece)
+            yield piece
+    except (LLMUnavailableError, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logging.error(f"Error generating response for {conversation_id}: {e}")
+        if not pieces:
+            yield FALLBACK_RESPONSE
+        # A reply cut off mid-stream is neither cached nor remembered
+        return
+    if not pieces:
+        yield FALLBACK_RESPONSE
+        return
+    reply = " ".join(pieces)
+    if author.lower() not in reply.lower():
+        cache.set(user_message, pieces, conversation_id)
+    await store.add_turn(conversation_id, "user", format_user_message(user_message, author))
+    await store.add_turn(conversation_id, "assistant", reply)
+
+async def get_response(user_message, author, conversation_id):
+    """
+    Generate a complete reply to a chat message.
+
+    Args:
+        user_message (str): The viewer's message.
+        author (str): The viewer's display name.
+        conversation_id (str): The conversation the message belongs to, e.g. "twitch_<channel>".
+
+    Returns:
+        str: The reply, or a fallback message if generation failed.
+    """
+    return " ".join([piece async for piece in stream_response(user_message, author, conversation_id)])
@@ -1,34 +1,108 @@
 # main.py
+import time
 import asyncio
+import logging
+import importlib
 from config import Config
-from discord_bot import run_discord_bot
-from twitch_bot import run_twitch_bot
-from youtube_bot import YouTubeBot, run_youtube_bot
+from http_client import start_http_session, close_http_session
+from supervisor import Supervisor
+
+# Each platform's module and the coroutine function that runs it. The modules
+# pull in heavy client libraries, so they are only imported once main() runs.
+PLATFORMS = {
+    "discord": ("discord_bot", "run_discord_bot"),
+    "twitch": ("twitch_bot", "run_twitch_bot"),
+    "youtube": ("youtube_bot", "run_youtube_bot"),
+}
+
+# Project modules every platform imports. Loading them first means the
+# parallel platform imports below only race on independent libraries.
+SHARED_MODULES = ("utils", "chat_commands", "message_bus")
+
+def import_modules(module_names):
+    """
+    Import modules in order (blocking).
+
+    Args:
+        module_names (Iterable): The module names.
+    """
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+async def load_platform(platform):
+    """
+    Import a platform module off the event loop and return its runner.
+
+    Args:
+        platform (str): The platform name, a key of PLATFORMS.
+
+    Returns:
+        Callable: The coroutine function running the platform's bot.
+    """
+    module_name, runner_name = PLATFORMS[platform]
+    started = time.perf_counter()
+    module = await asyncio.to_thread(importlib.import_module, module_name)
+    logging.info(f"Loaded {platform} in {time.perf_counter() - started:.2f}s")
+    return getattr(module, runner_name)
+
+def platform_runner(platform):
+    """
+    Build the coroutine function the supervisor runs for a platform.
+
+    Args:
+        platform (str): The platform name, a key of PLATFORMS.
+
+    Returns:
+        Callable: A coroutine function importing the platform module, then running its bot.
+    """
+    async def run():
+        runner = await load_platform(platform)
+        await runner()
+    return run
 
 async def main():
     """
-    The main function that runs the bots concurrently.
+    The main function that runs the enabled bots concurrently under a supervisor.
     """
+    supervisor = None
+    bus = None
     try:
         # Load the configuration
         Config.load_configuration()
 
-        # Create tasks for running each bot
-        discord_task = asyncio.create_task(run_discord_bot())
-        twitch_task = asyncio.create_task(run_twitch_bot())
+        # Open the shared HTTP connection pool used by every bot
+        await start_http_session()
 
-        # Create an instance of the YouTubeBot
-        youtube_bot = YouTubeBot(Config.YOUTUBE_API_KEY, Config.YOUTUBE_ACCESS_TOKEN, Config.YOUTUBE_LIVE_CHAT_ID)
+        # Each enabled platform is imported in parallel, off the event loop, and restarted if it crashes
+        await asyncio.to_thread(import_modules, SHARED_MODULES)
 
-        # Create a task for running the YouTube bot
-        youtube_task = asyncio.create_task(run_youtube_bot(youtube_bot))
+        # Every platform publishes its chat messages to one shared pool of command and LLM workers
+        bus = importlib.import_module("message_bus").get_message_bus()
+        bus.start()
+        supervisor = Supervisor()
+        Config.add_reload_listener(supervisor.apply_config)
 
-        # Run all the tasks concurrently
-        await asyncio.gather(discord_task, twitch_task, youtube_task)
+        # Retune rate limits, cache TTLs and concurrency on SIGHUP without dropping chat connections
+        Config.install_reload_handler()
+        for platform in Config.enabled_platforms():
+            supervisor.add(platform, platform_runner(platform))
+        await supervisor.run()
 
     except Exception as e:
         logging.error(f"An error occurred while running the bots: {e}")
 
+    finally:
+        if supervisor is not None:
+            Config.remove_reload_listener(supervisor.apply_config)
+            await supervisor.stop()
+        if bus is not None:
+            await bus.stop()
+        # Release pooled connections on shutdown
+        await close_http_session()
+
 if __name__ == '__main__':
+    # Set up detailed logging
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)-8s %(name)-12s %(message)s')
+
     # Run the main function
     asyncio.run(main())
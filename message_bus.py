@@ -0,0 +1,172 @@
+# message_bus.py
+import time
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+from command_registry import registry
+from config import Config
+from dispatcher import MessageDispatcher
+from llm import stream_response
+
+@dataclass
+class ChatMessage:
+    """
+    A chat message received on any platform, in a platform-neutral form.
+
+    Attributes:
+        platform (str): The platform the message arrived on, e.g. "twitch".
+        channel (str): The channel or live chat the message was posted in.
+        author (str): The display name of the author.
+        text (str): The message text, with any mention of the bot removed.
+        mentions_bot (bool): Whether the message addresses the bot and should get an LLM reply.
+        reply_to (Any): A platform object the adapter uses to send replies, e.g. a Twitch channel.
+        received_at (float): The monotonic time the message was received.
+    """
+    platform: str
+    channel: str
+    author: str
+    text: str
+    mentions_bot: bool = False
+    reply_to: Any = None
+    received_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def conversation_id(self):
+        """
+        The key under which the conversation's history is remembered.
+        """
+        return f"{self.platform}_{self.channel}"
+
+class MessageBus:
+    """
+    An in-process bus carrying chat messages from every platform to one shared worker pool.
+
+    Platform adapters publish ChatMessage records and register themselves to
+    receive replies. The workers run commands and LLM replies for all platforms,
+    so they share caches, rate limiters and worker capacity, and messages are
+    served round-robin per author so one busy user cannot starve the others.
+
+    An adapter is any object with a platform attribute, which also selects the
+    available commands, and a coroutine method reply(message, text).
+    """
+
+    def __init__(self, concurrency=None, max_pending=None):
+        """
+        Initialize the MessageBus instance.
+
+        Args:
+            concurrency (int): The number of worker tasks (default: Config.DISPATCH_CONCURRENCY).
+            max_pending (int): The number of queued messages before publish() waits (default: Config.DISPATCH_MAX_PENDING).
+        """
+        self.dispatcher = MessageDispatcher(self.handle, concurrency, max_pending, name="message bus")
+        self._adapters = {}
+        self.published = Counter()
+        self.unrouted = 0
+
+    def register(self, adapter):
+        """
+        Register the adapter that replies to messages from its platform.
+
+        Args:
+            adapter (Any): The platform adapter.
+        """
+        self._adapters[adapter.platform] = adapter
+
+    def unregister(self, adapter):
+        """
+        Remove a platform adapter, if it is still the registered one.
+
+        Args:
+            adapter (Any): The platform adapter.
+        """
+        if self._adapters.get(adapter.platform) is adapter:
+            del self._adapters[adapter.platform]
+
+    def start(self):
+        """
+        Start the worker tasks. Calling it again while running has no effect.
+        """
+        self.dispatcher.start()
+
+    async def stop(self):
+        """
+        Cancel the worker tasks and wait for them to finish.
+        """
+        await self.dispatcher.stop()
+
+    async def publish(self, message):
+        """
+        Queue a message for the workers, waiting while the queue is full.
+
+        Args:
+            message (ChatMessage): The message to process.
+        """
+        self.published[message.platform] += 1
+        await self.dispatcher.submit(f"{message.platform}:{message.author}", message)
+
+    async def join(self):
+        """
+        Wait until every published message has been handled.
+        """
+        await self.dispatcher.join()
+
+    async def handle(self, message):
+        """
+        Run the command or LLM reply for a message and send the replies through its adapter.
+
+        Args:
+            message (ChatMessage): The message to process.
+        """
+        adapter = self._adapters.get(message.platform)
+        if adapter is None:
+            self.unrouted += 1
+            logging.warning(f"No adapter registered for {message.platform}, dropping message from {message.author}")
+            return
+
+        if message.text.startswith(registry.prefix):
+            try:
+                response = await registry.dispatch(message.text, adapter)
+            except Exception as e:
+                logging.error(f"Error handling {message.platform} command {message.text!r}: {e}")
+                response = "An error occurred while processing the command."
+            if response:
+                await adapter.reply(message, response)
+            return
+
+        if message.mentions_bot:
+            # Send each sentence as soon as it is generated instead of waiting for the full reply
+            async for sentence in stream_response(message.text, message.author, message.conversation_id):
+                await adapter.reply(message, sentence)
+
+    def stats(self):
+        """
+        Report bus metrics.
+
+        Returns:
+            dict: The worker pool metrics, plus messages published per platform and messages dropped for lack of an adapter.
+        """
+        return {
+            **self.dispatcher.stats(),
+            "published": dict(self.published),
+            "unrouted": self.unrouted
+        }
+
+_bus = None
+
+def get_message_bus():
+    """
+    Get the shared message bus, creating it on first use.
+
+    Returns:
+        MessageBus: The bus configured from Config.
+    """
+    global _bus
+    if _bus is None:
+        _bus = MessageBus()
+        Config.add_reload_listener(_apply_config)
+    return _bus
+
+def _apply_config(changed):
+    if Config.DISPATCH_CONCURRENCY != _bus.dispatcher.concurrency:
+        _bus.dispatcher.resize(Config.DISPATCH_CONCURRENCY)
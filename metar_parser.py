@@ -0,0 +1,453 @@
+# metar_parser.py
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+METERS_PER_STATUTE_MILE = 1609.344
+
+# Visibility of 9999 meters or CAVOK means 10 km or more
+UNLIMITED_VISIBILITY_METERS = 10000
+
+# Cloud covers that form a ceiling
+CEILING_COVERS = ("BKN", "OVC", "VV")
+
+# Groups reporting no significant cloud
+CLEAR_SKY = ("SKC", "CLR", "NSC", "NCD")
+
+COVER_NAMES = {
+    "FEW": "Few clouds",
+    "SCT": "Scattered clouds",
+    "BKN": "Broken layer",
+    "OVC": "Overcast layer",
+    "VV": "Vertical visibility",
+}
+
+WEATHER_NAMES = {
+    "-": "Light", "+": "Heavy", "VC": "Nearby",
+    "MI": "shallow", "PR": "partial", "BC": "patches of", "DR": "low drifting", "BL": "blowing",
+    "SH": "showers of", "TS": "thunderstorm", "FZ": "freezing",
+    "DZ": "drizzle", "RA": "rain", "SN": "snow", "SG": "snow grains", "IC": "ice crystals",
+    "PL": "ice pellets", "GR": "hail", "GS": "small hail", "UP": "unknown precipitation",
+    "BR": "mist", "FG": "fog", "FU": "smoke", "VA": "volcanic ash", "DU": "dust", "SA": "sand",
+    "HZ": "haze", "PY": "spray", "PO": "dust whirls", "SQ": "squalls", "FC": "funnel cloud",
+    "SS": "sandstorm", "DS": "duststorm",
+}
+
+WIND = re.compile(r"^(VRB|\d{3})(\d{2,3})(?:G(\d{2,3}))?(KT|MPS|KMH)$")
+WIND_VARIATION = re.compile(r"^(\d{3})V(\d{3})$")
+VISIBILITY_METERS = re.compile(r"^(\d{4})(?:NDV)?$")
+VISIBILITY_MILES = re.compile(r"^([MP])?(?:(\d+)|(\d+)/(\d+))SM$")
+WHOLE_MILES = re.compile(r"^\d$")
+RUNWAY_VISUAL_RANGE = re.compile(r"^R\d{2}[LCR]?/")
+WEATHER = re.compile(
+    r"^(-|\+|VC)?(MI|PR|BC|DR|BL|SH|TS|FZ)?"
+    r"((?:DZ|RA|SN|SG|IC|PL|GR|GS|UP|BR|FG|FU|VA|DU|SA|HZ|PY|PO|SQ|FC|SS|DS)*)$"
+)
+WEATHER_CODES = re.compile(r"[A-Z]{2}")
+CLOUD = re.compile(r"^(FEW|SCT|BKN|OVC|VV)(\d{3}|///)(CB|TCU)?$")
+TEMPERATURES = re.compile(r"^(M?\d{2})/(M?\d{2})?$")
+ALTIMETER = re.compile(r"^([AQ])(\d{4})$")
+OBSERVATION_TIME = re.compile(r"^\d{6}Z$")
+VALID_PERIOD = re.compile(r"^(\d{4})/(\d{4})$")
+CHANGE_GROUP = re.compile(r"^(FM\d{6}|TEMPO|BECMG|PROB\d{2})$")
+
+@dataclass(frozen=True, slots=True)
+class Wind:
+    """
+    A reported or forecast surface wind.
+    """
+    direction: int  # Degrees true, or None when variable
+    speed: int
+    gust: int = None
+    unit: str = "KT"
+    variable_from: int = None
+    variable_to: int = None
+
+@dataclass(frozen=True, slots=True)
+class CloudLayer:
+    """
+    A cloud layer or vertical visibility.
+    """
+    cover: str
+    base: int  # Feet above ground, or None if not reported
+    cloud_type: str = None
+
+@dataclass(frozen=True, slots=True)
+class Conditions:
+    """
+    The weather elements shared by METARs and TAF periods.
+    """
+    wind: Wind = None
+    visibility: float = None  # Statute miles
+    weather: tuple = ()
+    clouds: tuple = ()
+
+    @property
+    def ceiling(self):
+        """
+        The base of the lowest broken or overcast layer, in feet, or None if there is none.
+        """
+        bases = [layer.base for layer in self.clouds if layer.cover in CEILING_COVERS and layer.base is not None]
+        return min(bases) if bases else None
+
+    @property
+    def flight_category(self):
+        """
+        The FAA flight category: VFR, MVFR, IFR or LIFR, or None if neither visibility nor a ceiling was reported.
+        """
+        return flight_category(self.visibility, self.ceiling)
+
+@dataclass(frozen=True, slots=True)
+class Metar:
+    """
+    A decoded METAR observation.
+    """
+    station: str
+    time: str
+    conditions: Conditions
+    temperature: int = None
+    dewpoint: int = None
+    altimeter: float = None
+    altimeter_unit: str = None
+    raw: str = ""
+
+@dataclass(frozen=True, slots=True)
+class TafPeriod:
+    """
+    One period of a TAF: the base forecast, or a FM, BECMG, TEMPO or PROB change group.
+    """
+    kind: str
+    start: str
+    end: str
+    conditions: Conditions
+
+@dataclass(frozen=True, slots=True)
+class Taf:
+    """
+    A decoded TAF forecast.
+    """
+    station: str
+    time: str
+    periods: tuple
+    raw: str = ""
+
+def flight_category(visibility, ceiling):
+    """
+    Classify flying conditions using the FAA ceiling and visibility thresholds.
+
+    Args:
+        visibility (float): The visibility in statute miles, or None if not reported.
+        ceiling (int): The ceiling in feet, or None if there is none.
+
+    Returns:
+        str: "LIFR", "IFR", "MVFR" or "VFR", or None if neither was reported.
+    """
+    if visibility is None and ceiling is None:
+        return None
+    if (ceiling is not None and ceiling < 500) or (visibility is not None and visibility < 1):
+        return "LIFR"
+    if (ceiling is not None and ceiling < 1000) or (visibility is not None and visibility < 3):
+        return "IFR"
+    if (ceiling is not None and ceiling <= 3000) or (visibility is not None and visibility <= 5):
+        return "MVFR"
+    return "VFR"
+
+def _temperature(text):
+    return -int(text[1:]) if text.startswith("M") else int(text)
+
+def parse_conditions(tokens):
+    """
+    Decode the wind, visibility, weather and cloud groups of a report.
+
+    Unrecognized groups, such as runway visual range, are skipped.
+
+    Args:
+        tokens (list): The groups of the report, in order.
+
+    Returns:
+        tuple: The Conditions and the groups that were not weather elements.
+    """
+    wind = None
+    visibility = None
+    weather = []
+    clouds = []
+    rest = []
+    whole_miles = 0
+    for token in tokens:
+        if WHOLE_MILES.match(token):
+            # The whole part of a visibility such as "1 1/2SM"
+            whole_miles = int(token)
+            continue
+        match = WIND.match(token)
+        if match and wind is None:
+            direction, speed, gust, unit = match.groups()
+            wind = Wind(None if direction == "VRB" else int(direction), int(speed), int(gust) if gust else None, unit)
+            continue
+        match = WIND_VARIATION.match(token)
+        if match and wind is not None:
+            wind = Wind(wind.direction, wind.speed, wind.gust, wind.unit, int(match.group(1)), int(match.group(2)))
+            continue
+        if token == "CAVOK":
+            visibility = UNLIMITED_VISIBILITY_METERS / METERS_PER_STATUTE_MILE
+            continue
+        match = VISIBILITY_MILES.match(token)
+        if match:
+            # M (less than) and P (more than) bounds are read as the stated value
+            _, whole, numerator, denominator = match.groups()
+            visibility = int(whole) if whole else whole_miles + int(numerator) / int(denominator)
+            whole_miles = 0
+            continue
+        match = VISIBILITY_METERS.match(token)
+        if match and visibility is None:
+            meters = int(match.group(1))
+            visibility = (UNLIMITED_VISIBILITY_METERS if meters == 9999 else meters) / METERS_PER_STATUTE_MILE
+            continue
+        if RUNWAY_VISUAL_RANGE.match(token):
+            continue
+        match = CLOUD.match(token)
+        if match:
+            cover, base, cloud_type = match.groups()
+            clouds.append(CloudLayer(cover, None if base == "///" else int(base) * 100, cloud_type))
+            continue
+        if token in CLEAR_SKY:
+            continue
+        match = WEATHER.match(token)
+        if match and (match.group(2) or match.group(3)):
+            weather.append(token)
+            continue
+        rest.append(token)
+    return Conditions(wind, visibility, tuple(weather), tuple(clouds)), rest
+
+@lru_cache(maxsize=4096)
+def parse_metar(raw):
+    """
+    Decode a METAR.
+
+    Decoded reports are memoized, so the same report polled by several
+    channels or commands is only parsed once.
+
+    Args:
+        raw (str): The raw METAR, e.g. "KJFK 121651Z 31012KT 10SM FEW250 24/08 A3012".
+
+    Returns:
+        Metar: The decoded report, or None if it has no station and time.
+    """
+    tokens = raw.split()
+    while tokens and tokens[0] in ("METAR", "SPECI"):
+        tokens.pop(0)
+    if len(tokens) < 2 or not OBSERVATION_TIME.match(tokens[1]):
+        return None
+    station, time = tokens[0], tokens[1]
+    body = []
+    for token in tokens[2:]:
+        if token in ("RMK", "TEMPO", "BECMG", "NOSIG"):
+            # Remarks and trend forecasts are not part of the observation
+            break
+        if token not in ("AUTO", "COR"):
+            body.append(token)
+    conditions, rest = parse_conditions(body)
+    temperature = dewpoint = altimeter = altimeter_unit = None
+    for token in rest:
+        match = TEMPERATURES.match(token)
+        if match:
+            temperature = _temperature(match.group(1))
+            dewpoint = _temperature(match.group(2)) if match.group(2) else None
+            continue
+        match = ALTIMETER.match(token)
+        if match:
+            if match.group(1) == "A":
+                altimeter, altimeter_unit = int(match.group(2)) / 100, "inHg"
+            else:
+                altimeter, altimeter_unit = int(match.group(2)), "hPa"
+    return Metar(station, time, conditions, temperature, dewpoint, altimeter, altimeter_unit, raw)
+
+def parse_metars(raws):
+    """
+    Decode many METARs at once.
+
+    Args:
+        raws (Iterable): The raw METARs.
+
+    Returns:
+        list: The decoded reports, in order, with None for any report that could not be decoded.
+    """
+    return [parse_metar(" ".join(raw.split())) if raw else None for raw in raws]
+
+@lru_cache(maxsize=1024)
+def parse_taf(raw):
+    """
+    Decode a TAF into its base forecast and change groups.
+
+    Args:
+        raw (str): The raw TAF, e.g. "TAF KJFK 121120Z 1212/1318 31012KT P6SM FEW250 TEMPO 1214/1218 BKN030".
+
+    Returns:
+        Taf: The decoded forecast, or None if it has no station and issue time.
+    """
+    tokens = raw.split()
+    while tokens and tokens[0] in ("TAF", "AMD", "COR"):
+        tokens.pop(0)
+    if len(tokens) < 2 or not OBSERVATION_TIME.match(tokens[1]):
+        return None
+    station, time = tokens[0], tokens[1]
+    groups = [["BASE"]]
+    for token in tokens[2:]:
+        if token == "RMK":
+            break
+        if CHANGE_GROUP.match(token) and not (token == "TEMPO" and groups[-1][0].startswith("PROB") and len(groups[-1]) == 1):
+            groups.append([token])
+        elif token == "TEMPO":
+            # PROB30 TEMPO is a single change group
+            groups[-1][0] += " TEMPO"
+        else:
+            groups[-1].append(token)
+    periods = []
+    for kind, *group_tokens in groups:
+        start = end = None
+        if kind.startswith("FM"):
+            start, kind = kind[2:], "FM"
+        if group_tokens:
+            match = VALID_PERIOD.match(group_tokens[0])
+            if match:
+                start, end = match.groups()
+                group_tokens = group_tokens[1:]
+        conditions, _ = parse_conditions(group_tokens)
+        periods.append(TafPeriod(kind, start, end, conditions))
+    return Taf(station, time, tuple(periods), raw)
+
+def parse_tafs(raws):
+    """
+    Decode many TAFs at once.
+
+    Args:
+        raws (Iterable): The raw TAFs.
+
+    Returns:
+        list: The decoded forecasts, in order, with None for any forecast that could not be decoded.
+    """
+    return [parse_taf(" ".join(raw.split())) if raw else None for raw in raws]
+
+def describe_wind(wind):
+    """
+    Describe a wind in words.
+
+    Args:
+        wind (Wind): The wind.
+
+    Returns:
+        str: e.g. "Winds 310 at 12kt gusting 20kt".
+    """
+    unit = wind.unit.lower()
+    if wind.speed == 0:
+        return "Winds calm"
+    direction = "variable" if wind.direction is None else f"{wind.direction:03d}"
+    text = f"Winds {direction} at {wind.speed}{unit}"
+    if wind.gust:
+        text += f" gusting {wind.gust}{unit}"
+    if wind.variable_from is not None:
+        text += f" varying {wind.variable_from:03d}-{wind.variable_to:03d}"
+    return text
+
+def describe_visibility(visibility):
+    """
+    Describe a visibility in words.
+
+    Args:
+        visibility (float): The visibility in statute miles.
+
+    Returns:
+        str: e.g. "Vis 10sm" or "Vis 1.5sm".
+    """
+    return f"Vis {visibility:.1f}".rstrip("0").rstrip(".") + "sm"
+
+def describe_weather(code):
+    """
+    Describe a present-weather group in words.
+
+    Args:
+        code (str): The group, e.g. "-SHRA".
+
+    Returns:
+        str: e.g. "Light showers of rain".
+    """
+    words = []
+    if code[:1] in "+-":
+        words.append(WEATHER_NAMES[code[0]])
+        code = code[1:]
+    elif code.startswith("VC"):
+        words.append(WEATHER_NAMES["VC"])
+        code = code[2:]
+    words.extend(WEATHER_NAMES.get(part, part) for part in WEATHER_CODES.findall(code))
+    text = " ".join(words)
+    return text[:1].upper() + text[1:]
+
+def describe_conditions(conditions):
+    """
+    Describe the wind, visibility, weather and clouds of a report.
+
+    Args:
+        conditions (Conditions): The decoded conditions.
+
+    Returns:
+        list: One phrase per element reported.
+    """
+    parts = []
+    if conditions.wind is not None:
+        parts.append(describe_wind(conditions.wind))
+    if conditions.visibility is not None:
+        parts.append(describe_visibility(conditions.visibility))
+    parts.extend(describe_weather(code) for code in conditions.weather)
+    for layer in conditions.clouds:
+        text = COVER_NAMES[layer.cover]
+        if layer.base is not None:
+            text += f" at {layer.base}ft"
+        if layer.cloud_type:
+            text += f" ({layer.cloud_type})"
+        parts.append(text)
+    return parts
+
+def translate_metar(metar):
+    """
+    Translate a decoded METAR into plain language.
+
+    Args:
+        metar (Metar): The decoded report.
+
+    Returns:
+        str: e.g. "Winds 310 at 12kt, Vis 10sm, Few clouds at 25000ft, Temp 24°C, Dew 8°C, Alt 30.12inHg, VFR".
+    """
+    parts = describe_conditions(metar.conditions)
+    if metar.temperature is not None:
+        parts.append(f"Temp {metar.temperature}°C")
+    if metar.dewpoint is not None:
+        parts.append(f"Dew {metar.dewpoint}°C")
+    if metar.altimeter is not None:
+        parts.append(f"Alt {metar.altimeter:.2f}inHg" if metar.altimeter_unit == "inHg" else f"Alt {metar.altimeter}hPa")
+    category = metar.conditions.flight_category
+    if category:
+        parts.append(category)
+    return ", ".join(parts)
+
+def translate_taf(taf):
+    """
+    Translate a decoded TAF into plain language, one period per line.
+
+    Args:
+        taf (Taf): The decoded forecast.
+
+    Returns:
+        str: e.g. "1212-1318: Winds 310 at 12kt, Vis 6sm, Few clouds at 25000ft, VFR".
+    """
+    lines = []
+    for period in taf.periods:
+        if period.kind == "FM":
+            label = f"From {period.start[2:4]}:{period.start[4:6]}Z on the {int(period.start[:2])}"
+        else:
+            span = f"{period.start}-{period.end}" if period.start else ""
+            label = span if period.kind == "BASE" else f"{period.kind} {span}".strip()
+        parts = describe_conditions(period.conditions)
+        category = period.conditions.flight_category
+        if category:
+            parts.append(category)
+        lines.append(f"{label}: {', '.join(parts) or 'No change'}")
+    return "\n".join(lines)
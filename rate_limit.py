@@ -0,0 +1,232 @@
+# rate_limit.py
+import time
+import random
+import logging
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+
+class TokenBucket:
+    """
+    An asynchronous token-bucket rate limiter.
+
+    Tokens refill continuously at a fixed rate up to the bucket capacity, which
+    allows short bursts while holding the long-run rate. Waiters are served in
+    arrival order.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize the TokenBucket instance.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (float): The maximum number of tokens the bucket holds.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def configure(self, rate, capacity):
+        """
+        Change the refill rate and capacity, keeping the tokens already earned.
+
+        Args:
+            rate (float): The number of tokens added per second.
+            capacity (float): The maximum number of tokens the bucket holds.
+        """
+        self._refill()
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = min(self.tokens, capacity)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens=1):
+        """
+        Take tokens from the bucket if they are available right now.
+
+        Args:
+            tokens (float): The number of tokens to take (default: 1).
+
+        Returns:
+            bool: True if the tokens were taken.
+        """
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens=1):
+        """
+        Wait until tokens are available, then take them.
+
+        Args:
+            tokens (float): The number of tokens to take (default: 1).
+        """
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+def backoff_delay(attempt, base=1.0, cap=30.0):
+    """
+    Compute a retry delay using exponential backoff with full jitter.
+
+    Args:
+        attempt (int): The number of attempts made so far, starting at 0.
+        base (float): The delay ceiling for the first retry, in seconds (default: 1.0).
+        cap (float): The maximum delay ceiling, in seconds (default: 30.0).
+
+    Returns:
+        float: A random delay between zero and the exponential ceiling.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+class ChannelSendScheduler:
+    """
+    Schedules outgoing chat chunks against a per-channel token bucket.
+
+    Concurrent replies to the same channel share its budget: their chunks are
+    interleaved round-robin, so one long answer cannot hold up a short one.
+    """
+
+    def __init__(self, rate, capacity):
+        """
+        Initialize the ChannelSendScheduler instance.
+
+        Args:
+            rate (float): The number of messages each channel may send per second.
+            capacity (int): The number of messages each channel may send back to back.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets = {}
+        self._replies = {}
+        self._workers = {}
+
+    def bucket_for(self, channel_name):
+        """
+        Get the token bucket holding a channel's send budget.
+
+        Args:
+            channel_name (str): The name of the channel.
+
+        Returns:
+            TokenBucket: The channel's token bucket.
+        """
+        bucket = self._buckets.get(channel_name)
+        if bucket is None:
+            bucket = self._buckets[channel_name] = TokenBucket(self.rate, self.capacity)
+        return bucket
+
+    def configure(self, rate, capacity):
+        """
+        Change the send budget of every channel.
+
+        Args:
+            rate (float): The number of messages each channel may send per second.
+            capacity (int): The number of messages each channel may send back to back.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        for bucket in self._buckets.values():
+            bucket.configure(rate, capacity)
+
+    async def send(self, channel_name, chunks, send):
+        """
+        Send a reply's chunks as fast as the channel's budget allows.
+
+        Args:
+            channel_name (str): The name of the channel.
+            chunks (list): The message chunks, in order.
+            send (Callable): A coroutine function sending one chunk to the channel.
+
+        Raises:
+            Exception: The first error raised while sending a chunk; the rest of that reply is dropped.
+        """
+        if not chunks:
+            return
+        done = asyncio.get_running_loop().create_future()
+        self._replies.setdefault(channel_name, deque()).append((deque(chunks), send, done))
+        worker = self._workers.get(channel_name)
+        if worker is None or worker.done():
+            self._workers[channel_name] = asyncio.create_task(self._run(channel_name))
+        await done
+
+    async def _run(self, channel_name):
+        replies = self._replies[channel_name]
+        bucket = self.bucket_for(channel_name)
+        while replies:
+            reply = replies.popleft()
+            chunks, send, done = reply
+            await bucket.acquire()
+            try:
+                await send(chunks.popleft())
+            except Exception as e:
+                logging.error(f"Error sending message to {channel_name}: {e}")
+                if not done.done():
+                    done.set_exception(e)
+                continue
+            if chunks:
+                replies.append(reply)
+            elif not done.done():
+                done.set_result(None)
+
+class DailyQuota:
+    """
+    Counts the requests made against a daily API quota.
+    """
+
+    def __init__(self, limit, timezone=timezone.utc):
+        """
+        Initialize the DailyQuota instance.
+
+        Args:
+            limit (int): The number of requests allowed per day.
+            timezone (tzinfo): The time zone in which the quota day starts (default: UTC).
+        """
+        self.limit = limit
+        self.timezone = timezone
+        self.day = None
+        self.used = 0
+
+    def _roll_over(self, now):
+        day = (now or datetime.now(self.timezone)).astimezone(self.timezone).date()
+        if day != self.day:
+            self.day = day
+            self.used = 0
+
+    def try_consume(self, now=None):
+        """
+        Use one request from today's quota if any is left.
+
+        Args:
+            now (datetime): The current time, timezone-aware (default: the system clock).
+
+        Returns:
+            bool: True if the request may be made.
+        """
+        self._roll_over(now)
+        if self.used >= self.limit:
+            return False
+        self.used += 1
+        return True
+
+    def remaining(self, now=None):
+        """
+        Get the number of requests left today.
+
+        Args:
+            now (datetime): The current time, timezone-aware (default: the system clock).
+
+        Returns:
+            int: The remaining requests.
+        """
+        self._roll_over(now)
+        return max(self.limit - self.used, 0)
@@ -0,0 +1,286 @@
+# reference_data.py
+import os
+import csv
+import time
+import bisect
+import difflib
+import logging
+import unicodedata
+from dataclasses import dataclass
+
+# Bundled reference data; airport names and aircraft types change rarely enough to ship with the bot
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+AIRPORTS_FILE = os.path.join(DATA_DIR, "airports.csv")
+AIRCRAFT_FILE = os.path.join(DATA_DIR, "aircraft.csv")
+
+# How similar a misspelled name must be to a known one to count as a match
+FUZZY_CUTOFF = 0.75
+
+# Index shared by every lookup, loaded on first use
+_index = None
+
+@dataclass(frozen=True, slots=True)
+class Airport:
+    """
+    A bundled airport record.
+    """
+    iata: str
+    icao: str
+    name: str
+    city: str
+    country: str
+
+@dataclass(frozen=True, slots=True)
+class AircraftType:
+    """
+    A bundled aircraft type record.
+    """
+    icao: str
+    manufacturer: str
+    model: str
+
+def normalize_name(text):
+    """
+    Canonicalize a name for matching, ignoring case, accents and punctuation.
+
+    Args:
+        text (str): The name, e.g. "Montréal-Trudeau".
+
+    Returns:
+        str: The lower-cased ASCII words separated by single spaces, e.g. "montreal trudeau".
+    """
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii").lower()
+    return " ".join("".join(char if char.isalnum() else " " for char in text).split())
+
+class NameIndex:
+    """
+    Prefix and fuzzy lookup of records by name.
+
+    Every record is indexed under each trailing run of words of each of its
+    names, so "heath" finds "London Heathrow" as well as "lond" does.
+    """
+
+    def __init__(self):
+        """
+        Initialize the NameIndex instance.
+        """
+        self._keys = []
+        self._records = {}
+
+    def add(self, record, *names):
+        """
+        Index a record under one or more names.
+
+        Args:
+            record (Any): The record returned by lookups.
+            *names (str): The names the record is known by.
+        """
+        for name in names:
+            words = normalize_name(name).split()
+            for start in range(len(words)):
+                key = " ".join(words[start:])
+                records = self._records.setdefault(key, [])
+                if record not in records:
+                    records.append(record)
+
+    def freeze(self):
+        """
+        Sort the indexed keys; call once after adding every record.
+        """
+        self._keys = sorted(self._records)
+
+    def prefix(self, query, limit):
+        """
+        Find the records with a name starting with a query.
+
+        Args:
+            query (str): The normalized query.
+            limit (int): The maximum number of records to return.
+
+        Returns:
+            list: The matching records, at most limit of them.
+        """
+        matches = []
+        position = bisect.bisect_left(self._keys, query)
+        while position < len(self._keys) and self._keys[position].startswith(query) and len(matches) < limit:
+            for record in self._records[self._keys[position]]:
+                if record not in matches:
+                    matches.append(record)
+            position += 1
+        return matches[:limit]
+
+    def fuzzy(self, query, limit):
+        """
+        Find the records with a name close to a misspelled query.
+
+        Args:
+            query (str): The normalized query.
+            limit (int): The maximum number of records to return.
+
+        Returns:
+            list: The closest records first, at most limit of them.
+        """
+        matches = []
+        for key in difflib.get_close_matches(query, self._keys, n=limit, cutoff=FUZZY_CUTOFF):
+            for record in self._records[key]:
+                if record not in matches:
+                    matches.append(record)
+        return matches[:limit]
+
+    def search(self, query, limit):
+        """
+        Find records by name prefix, falling back to fuzzy matching.
+
+        Args:
+            query (str): The query, in any case.
+            limit (int): The maximum number of records to return.
+
+        Returns:
+            list: The matching records, at most limit of them.
+        """
+        query = normalize_name(query)
+        if not query:
+            return []
+        return self.prefix(query, limit) or self.fuzzy(query, limit)
+
+class ReferenceIndex:
+    """
+    An in-memory index of the bundled airport and aircraft reference data.
+
+    Code lookups are dictionary hits; name lookups use a sorted key list for
+    prefix matching and difflib for misspellings, so common commands are
+    answered without a network call.
+    """
+
+    def __init__(self, airports_file=AIRPORTS_FILE, aircraft_file=AIRCRAFT_FILE):
+        """
+        Initialize the ReferenceIndex instance and load the data files.
+
+        Args:
+            airports_file (str): The airports CSV with iata, icao, name, city and country columns (default: the bundled file).
+            aircraft_file (str): The aircraft CSV with icao, manufacturer and model columns (default: the bundled file).
+        """
+        started = time.perf_counter()
+        self._airports = {}
+        self._aircraft = {}
+        self._airport_names = NameIndex()
+        self._aircraft_names = NameIndex()
+        for row in _read_rows(airports_file):
+            airport = Airport(row["iata"].upper(), row["icao"].upper(), row["name"], row["city"], row["country"])
+            self._airports[airport.iata] = airport
+            self._airports[airport.icao] = airport
+            self._airport_names.add(airport, airport.name, airport.city)
+        for row in _read_rows(aircraft_file):
+            aircraft = AircraftType(row["icao"].upper(), row["manufacturer"], row["model"])
+            self._aircraft[aircraft.icao] = aircraft
+            self._aircraft_names.add(aircraft, f"{aircraft.manufacturer} {aircraft.model}")
+        self._airport_names.freeze()
+        self._aircraft_names.freeze()
+        self.hits = 0
+        self.misses = 0
+        logging.info(
+            f"Loaded {len(set(self._airports.values()))} airports and {len(self._aircraft)} aircraft types "
+            f"in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+
+    def airport(self, code):
+        """
+        Look up an airport by code.
+
+        Args:
+            code (str): The IATA or ICAO airport code.
+
+        Returns:
+            Airport: The airport, or None if it is not in the reference data.
+        """
+        return self._count(self._airports.get(code.strip().upper()))
+
+    def aircraft(self, code):
+        """
+        Look up an aircraft type by its ICAO type designator.
+
+        Args:
+            code (str): The type designator, e.g. "B738".
+
+        Returns:
+            AircraftType: The aircraft type, or None if it is not in the reference data.
+        """
+        return self._count(self._aircraft.get(code.strip().upper()))
+
+    def search_airports(self, query, limit=5):
+        """
+        Find airports by code, or by name or city prefix, tolerating misspellings.
+
+        Args:
+            query (str): An airport code or a name such as "heathrow".
+            limit (int): The maximum number of airports to return (default: 5).
+
+        Returns:
+            list: The matching airports, best first.
+        """
+        airport = self._airports.get(query.strip().upper())
+        return [airport] if airport else self._airport_names.search(query, limit)
+
+    def search_aircraft(self, query, limit=5):
+        """
+        Find aircraft types by designator, or by manufacturer and model prefix, tolerating misspellings.
+
+        Args:
+            query (str): A type designator or a name such as "boeing 787".
+            limit (int): The maximum number of aircraft types to return (default: 5).
+
+        Returns:
+            list: The matching aircraft types, best first.
+        """
+        aircraft = self._aircraft.get(query.strip().upper())
+        return [aircraft] if aircraft else self._aircraft_names.search(query, limit)
+
+    def stats(self):
+        """
+        Report index size and code lookup counters.
+
+        Returns:
+            dict: The airport and aircraft type counts, hits and misses.
+        """
+        return {
+            "airports": len(set(self._airports.values())),
+            "aircraft": len(self._aircraft),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def _count(self, record):
+        if record is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return record
+
+def _read_rows(path):
+    """
+    Read the rows of a reference CSV file.
+
+    Args:
+        path (str): The path of the file.
+
+    Returns:
+        list: One dictionary per row, or an empty list if the file cannot be read.
+    """
+    try:
+        with open(path, newline="", encoding="utf-8") as file:
+            return list(csv.DictReader(file))
+    except OSError as e:
+        logging.error(f"Could not read reference data from {path}: {e}")
+        return []
+
+def get_reference_index():
+    """
+    Get the shared reference index, loading it on first use.
+
+    Returns:
+        ReferenceIndex: The index of the bundled reference data.
+    """
+    global _index
+    if _index is None:
+        _index = ReferenceIndex()
+    return _index
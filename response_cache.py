@@ -0,0 +1,354 @@
+# response_cache.py
+import re
+import time
+import zlib
+import random
+from collections import OrderedDict
+from config import Config
+
+# MinHash signature length and locality-sensitive hashing layout: 16 bands of 4 rows
+# puts two questions in a shared bucket with ~50% probability at Jaccard 0.5 and >99% at 0.8
+MINHASH_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = MINHASH_PERMUTATIONS // LSH_BANDS
+SHINGLE_SIZE = 3
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Fixed seed so signatures are comparable across runs
+_rng = random.Random(20240620)
+PERMUTATIONS = [(_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME)) for _ in range(MINHASH_PERMUTATIONS)]
+
+CONTRACTIONS = [
+    (re.compile(r"\b(\w+)'s\b"), r"\1 is"),
+    (re.compile(r"\b(\w+)'re\b"), r"\1 are"),
+    (re.compile(r"\b(\w+)n't\b"), r"\1 not"),
+]
+NON_WORD = re.compile(r"[^\w\s]")
+FILLER_WORDS = frozenset({"hey", "hi", "hello", "yo", "please", "pls", "plz", "bot", "um", "uh", "so", "the", "a", "an"})
+
+# Airport codes, callsigns and numbers change the answer, so they must match exactly
+KEY_TOKEN = re.compile(r"\b(?:[A-Z]{3,4}|\w*\d\w*)\b")
+
+# Answers about fast-changing subjects expire sooner; the first matching topic wins
+TOPIC_PATTERNS = [
+    ("weather", re.compile(r"\b(?:weather|metar|taf|winds?|visibility|temperature|rain|snow|fog|storms?|clouds?|ceiling|forecast)\b")),
+    ("flights", re.compile(r"\b(?:flights?|delays?|delayed|arrivals?|departures?|landing|gate|eta|status)\b")),
+]
+
+# Cache shared by every conversation, created on first use
+_cache = None
+
+def normalize_question(text):
+    """
+    Reduce a chat question to a canonical form so trivially different phrasings share a cache key.
+
+    Args:
+        text (str): The question as typed by the viewer.
+
+    Returns:
+        str: The lower-cased question without punctuation, contractions or filler words.
+    """
+    text = text.lower()
+    for pattern, replacement in CONTRACTIONS:
+        text = pattern.sub(replacement, text)
+    words = NON_WORD.sub(" ", text).split()
+    return " ".join(word for word in words if word not in FILLER_WORDS)
+
+def key_tokens(text):
+    """
+    Extract the tokens that must match exactly for two questions to share an answer.
+
+    Args:
+        text (str): The question as typed by the viewer.
+
+    Returns:
+        frozenset: Upper-case codes and words containing digits, lower-cased.
+    """
+    return frozenset(token.lower() for token in KEY_TOKEN.findall(text))
+
+def classify_topic(normalized):
+    """
+    Assign a normalized question to a topic for choosing its TTL.
+
+    Args:
+        normalized (str): The normalized question.
+
+    Returns:
+        str: "weather", "flights" or "general".
+    """
+    for topic, pattern in TOPIC_PATTERNS:
+        if pattern.search(normalized):
+            return topic
+    return "general"
+
+def topic_ttl(topic):
+    """
+    Look up how long answers on a topic stay valid.
+
+    Args:
+        topic (str): The topic returned by classify_topic.
+
+    Returns:
+        float: The TTL in seconds.
+    """
+    if topic == "weather":
+        return Config.RESPONSE_CACHE_WEATHER_TTL
+    if topic == "flights":
+        return Config.RESPONSE_CACHE_FLIGHTS_TTL
+    return Config.RESPONSE_CACHE_TTL
+
+def shingles(normalized):
+    """
+    Split a normalized question into overlapping character n-grams.
+
+    Args:
+        normalized (str): The normalized question.
+
+    Returns:
+        set: The CRC32 hashes of the question's character shingles.
+    """
+    if len(normalized) <= SHINGLE_SIZE:
+        return {zlib.crc32(normalized.encode())}
+    return {zlib.crc32(normalized[i:i + SHINGLE_SIZE].encode()) for i in range(len(normalized) - SHINGLE_SIZE + 1)}
+
+def minhash(hashed_shingles):
+    """
+    Compute the MinHash signature of a set of shingles.
+
+    Args:
+        hashed_shingles (set): The shingle hashes.
+
+    Returns:
+        tuple: One minimum hash per permutation.
+    """
+    return tuple(
+        min((a * h + b) % MERSENNE_PRIME for h in hashed_shingles)
+        for a, b in PERMUTATIONS
+    )
+
+def band_hashes(scope, signature):
+    """
+    Split a MinHash signature into locality-sensitive hashing bands.
+
+    Args:
+        scope (str): The cache scope, so questions only share buckets within it.
+        signature (tuple): The MinHash signature.
+
+    Returns:
+        tuple: One bucket hash per band.
+    """
+    return tuple(hash((scope, band, signature[band * LSH_ROWS:(band + 1) * LSH_ROWS])) for band in range(LSH_BANDS))
+
+def jaccard(first, second):
+    """
+    Compute the Jaccard similarity of two sets.
+
+    Args:
+        first (set): The first set.
+        second (set): The second set.
+
+    Returns:
+        float: The size of the intersection over the size of the union.
+    """
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+class CachedResponse:
+    """
+    A cached reply together with the data used to match near-duplicate questions.
+    """
+
+    __slots__ = ("key", "keys", "shingles", "bands", "pieces", "topic", "expires_at")
+
+    def __init__(self, key, keys, hashed_shingles, bands, pieces, topic, expires_at):
+        self.key = key
+        self.keys = keys
+        self.shingles = hashed_shingles
+        self.bands = bands
+        self.pieces = pieces
+        self.topic = topic
+        self.expires_at = expires_at
+
+class ResponseCache:
+    """
+    Caches LLM replies to chat questions, matching exact and near-duplicate wording.
+
+    Exact matches are a dictionary lookup on the normalized question. Near
+    duplicates are found with MinHash locality-sensitive hashing over character
+    shingles, then confirmed with the true Jaccard similarity; codes and numbers
+    in the question must match exactly. Replies are only shared within a scope,
+    such as one conversation. Entries expire after a per-topic TTL and the
+    least recently used entries are evicted beyond the size limit.
+    """
+
+    def __init__(self, max_entries=None, similarity=None):
+        """
+        Initialize the ResponseCache instance.
+
+        Args:
+            max_entries (int): The maximum number of cached replies (default: Config.RESPONSE_CACHE_MAX_ENTRIES).
+            similarity (float): The Jaccard similarity a near-duplicate must reach (default: Config.RESPONSE_CACHE_SIMILARITY).
+        """
+        self.max_entries = max_entries or Config.RESPONSE_CACHE_MAX_ENTRIES
+        self.similarity = similarity or Config.RESPONSE_CACHE_SIMILARITY
+        self._entries = OrderedDict()
+        self._buckets = {}
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lookup_time = 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, question, scope=""):
+        """
+        Find a cached reply for a question.
+
+        Args:
+            question (str): The question as typed by the viewer.
+            scope (str): The scope the reply was cached in, e.g. a conversation ID (default: shared by all).
+
+        Returns:
+            tuple: The cached reply pieces, or None on a miss.
+        """
+        started = time.perf_counter()
+        now = time.monotonic()
+        normalized = normalize_question(question)
+        entry = self._live_entry((scope, normalized), now)
+        if entry is not None:
+            self.exact_hits += 1
+        else:
+            entry = self._find_similar(scope, normalized, key_tokens(question), now)
+            if entry is not None:
+                self.near_hits += 1
+            else:
+                self.misses += 1
+        self._lookup_time += time.perf_counter() - started
+        if entry is None:
+            return None
+        self._entries.move_to_end(entry.key)
+        return entry.pieces
+
+    def set(self, question, pieces, scope=""):
+        """
+        Cache the reply to a question.
+
+        Args:
+            question (str): The question as typed by the viewer.
+            pieces (list): The reply, as the pieces it was streamed in.
+            scope (str): The scope the reply may be reused in, e.g. a conversation ID (default: shared by all).
+        """
+        normalized = normalize_question(question)
+        if not normalized:
+            return
+        key = (scope, normalized)
+        if key in self._entries:
+            self._remove(key)
+        hashed_shingles = shingles(normalized)
+        bands = band_hashes(scope, minhash(hashed_shingles))
+        topic = classify_topic(normalized)
+        self._entries[key] = CachedResponse(
+            key, key_tokens(question), hashed_shingles, bands, tuple(pieces), topic,
+            time.monotonic() + topic_ttl(topic)
+        )
+        for band in bands:
+            self._buckets.setdefault(band, set()).add(key)
+        self._evict()
+
+    def resize(self, max_entries):
+        """
+        Change the size limit, evicting the least recently used replies if it shrank.
+
+        Args:
+            max_entries (int): The new maximum number of cached replies.
+        """
+        self.max_entries = max_entries
+        self._evict()
+
+    def clear(self):
+        """
+        Remove every cached reply and reset the counters.
+        """
+        self._entries.clear()
+        self._buckets.clear()
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lookup_time = 0.0
+
+    def stats(self):
+        """
+        Report the cache's hit rates.
+
+        Returns:
+            dict: The entry count, exact and near-duplicate hits, misses, evictions, hit rate and mean lookup time in microseconds.
+        """
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.exact_hits + self.near_hits) / lookups if lookups else 0.0,
+            "avg_lookup_us": self._lookup_time / lookups * 1_000_000 if lookups else 0.0,
+        }
+
+    def _live_entry(self, key, now):
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= now:
+            self._remove(key)
+            return None
+        return entry
+
+    def _find_similar(self, scope, normalized, keys, now):
+        if not normalized:
+            return None
+        hashed_shingles = shingles(normalized)
+        candidates = set()
+        for band in band_hashes(scope, minhash(hashed_shingles)):
+            candidates |= self._buckets.get(band, set())
+        best, best_similarity = None, self.similarity
+        for candidate in candidates:
+            entry = self._live_entry(candidate, now)
+            if entry is None or entry.keys != keys:
+                continue
+            similarity = jaccard(hashed_shingles, entry.shingles)
+            if similarity >= best_similarity:
+                best, best_similarity = entry, similarity
+        return best
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        entry = self._entries.pop(key)
+        for band in entry.bands:
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
+
+def get_response_cache():
+    """
+    Get the shared response cache, creating it on first use.
+
+    Returns:
+        ResponseCache: The cache configured from Config.
+    """
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache()
+        Config.add_reload_listener(_apply_config)
+    return _cache
+
+def _apply_config(changed):
+    _cache.resize(Config.RESPONSE_CACHE_MAX_ENTRIES)
+    _cache.similarity = Config.RESPONSE_CACHE_SIMILARITY
@@ -0,0 +1,171 @@
+# supervisor.py
+import time
+import asyncio
+import logging
+from config import Config
+from rate_limit import backoff_delay
+
+class BotState:
+    """
+    The run history of one supervised bot.
+    """
+
+    __slots__ = ("name", "status", "restarts", "failures", "started_at", "uptime", "last_error")
+
+    def __init__(self, name):
+        """
+        Initialize the BotState instance.
+
+        Args:
+            name (str): The bot's name, e.g. "discord".
+        """
+        self.name = name
+        self.status = "pending"
+        self.restarts = 0
+        self.failures = 0
+        self.started_at = None
+        self.uptime = 0.0
+        self.last_error = None
+
+    def current_uptime(self, now=None):
+        """
+        Get how long the bot has been running since it last started.
+
+        Args:
+            now (float): The current monotonic time (default: the system clock).
+
+        Returns:
+            float: The seconds since the last start, or 0 if the bot is not running.
+        """
+        if self.started_at is None:
+            return 0.0
+        return (now or time.monotonic()) - self.started_at
+
+class Supervisor:
+    """
+    Runs each bot in its own task and restarts it when it crashes.
+
+    A crash in one bot never affects the others. Restarts are delayed with
+    exponential backoff and jitter; the backoff resets once a bot has stayed
+    up for a while. A bot that returns normally is considered finished.
+    """
+
+    def __init__(self, base_delay=None, max_delay=None, stable_after=None, report_interval=None):
+        """
+        Initialize the Supervisor instance.
+
+        Args:
+            base_delay (float): The backoff ceiling for the first restart, in seconds (default: Config.SUPERVISOR_BASE_DELAY).
+            max_delay (float): The maximum backoff ceiling, in seconds (default: Config.SUPERVISOR_MAX_DELAY).
+            stable_after (float): Seconds of uptime after which the backoff resets (default: Config.SUPERVISOR_STABLE_AFTER).
+            report_interval (float): Seconds between status reports in the log; 0 disables them (default: Config.SUPERVISOR_REPORT_INTERVAL).
+        """
+        self.base_delay = base_delay if base_delay is not None else Config.SUPERVISOR_BASE_DELAY
+        self.max_delay = max_delay if max_delay is not None else Config.SUPERVISOR_MAX_DELAY
+        self.stable_after = stable_after if stable_after is not None else Config.SUPERVISOR_STABLE_AFTER
+        self.report_interval = report_interval if report_interval is not None else Config.SUPERVISOR_REPORT_INTERVAL
+        self._runners = {}
+        self._states = {}
+        self._tasks = {}
+
+    def add(self, name, run):
+        """
+        Register a bot to supervise.
+
+        Args:
+            name (str): The bot's name, e.g. "discord".
+            run (Callable): A coroutine function running the bot until it stops or fails.
+        """
+        self._runners[name] = run
+        self._states[name] = BotState(name)
+
+    def apply_config(self, changed):
+        """
+        Pick up reloaded backoff settings.
+
+        Args:
+            changed (set): The names of the settings that changed.
+        """
+        self.base_delay = Config.SUPERVISOR_BASE_DELAY
+        self.max_delay = Config.SUPERVISOR_MAX_DELAY
+        self.stable_after = Config.SUPERVISOR_STABLE_AFTER
+
+    async def run(self):
+        """
+        Start every registered bot and wait until all of them have finished.
+        """
+        for name, run in self._runners.items():
+            self._tasks[name] = asyncio.create_task(self._supervise(name, run), name=f"supervise-{name}")
+        reporter = asyncio.create_task(self._report()) if self.report_interval else None
+        try:
+            await asyncio.gather(*self._tasks.values())
+        finally:
+            if reporter is not None:
+                reporter.cancel()
+            await self.stop()
+
+    async def stop(self):
+        """
+        Stop every bot.
+        """
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    def stats(self):
+        """
+        Report the state of every supervised bot.
+
+        Returns:
+            dict: For each bot, its status, restart count, current and total uptime in seconds and last error.
+        """
+        now = time.monotonic()
+        return {
+            name: {
+                "status": state.status,
+                "restarts": state.restarts,
+                "uptime": state.current_uptime(now),
+                "total_uptime": state.uptime + state.current_uptime(now),
+                "last_error": state.last_error,
+            }
+            for name, state in self._states.items()
+        }
+
+    async def _supervise(self, name, run):
+        state = self._states[name]
+        while True:
+            state.status = "running"
+            state.started_at = time.monotonic()
+            try:
+                await run()
+            except asyncio.CancelledError:
+                self._stopped(state, "stopped")
+                raise
+            except Exception as e:
+                ran_for = self._stopped(state, "restarting")
+                state.last_error = f"{type(e).__name__}: {e}"
+                state.failures = 1 if ran_for >= self.stable_after else state.failures + 1
+                delay = backoff_delay(state.failures - 1, self.base_delay, self.max_delay)
+                logging.error(f"{name} bot crashed after {ran_for:.0f}s ({state.last_error}); restarting in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                state.restarts += 1
+            else:
+                self._stopped(state, "finished")
+                logging.info(f"{name} bot finished")
+                return
+
+    def _stopped(self, state, status):
+        ran_for = state.current_uptime()
+        state.uptime += ran_for
+        state.started_at = None
+        state.status = status
+        return ran_for
+
+    async def _report(self):
+        while True:
+            await asyncio.sleep(self.report_interval)
+            for name, stats in self.stats().items():
+                logging.info(
+                    f"{name} bot {stats['status']}: up {stats['uptime']:.0f}s, "
+                    f"{stats['total_uptime']:.0f}s in total, {stats['restarts']} restarts"
+                )
@@ -0,0 +1,224 @@
+# test_aviation_client.py
+import asyncio
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+import aviation_client
+from config import Config
+from aviation_client import MetarReport, NotamList
+
+class TestAviationClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Provide dummy API keys without loading the real environment
+        keys = patch.multiple(Config, create=True, AVWX_API_KEY="test", ICAO_API_KEY="test", OPENWEATHERMAP_API_KEY="test", RAPIDAPI_KEY="test")
+        keys.start()
+        self.addCleanup(keys.stop)
+        aviation_client.get_aviation_cache().clear()
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_metar(self, mock_get):
+        # Setup mock return value
+        mock_get.return_value = {"raw": "KJFK 121651Z 31012KT 10SM FEW250 24/08 A3012"}
+
+        report = await aviation_client.fetch_metar("KJFK")
+
+        # The translation is produced locally rather than requested from AVWX
+        summary = "Winds 310 at 12kt, Vis 10sm, Few clouds at 25000ft, Temp 24°C, Dew 8°C, Alt 30.12inHg, VFR"
+        self.assertEqual(report, MetarReport("KJFK", "KJFK 121651Z 31012KT 10SM FEW250 24/08 A3012", summary))
+        self.assertEqual(mock_get.call_args.kwargs["params"], {"options": "info"})
+        self.assertEqual(
+            aviation_client.format_metar(report),
+            f"METAR for KJFK:\nKJFK 121651Z 31012KT 10SM FEW250 24/08 A3012\n\nTranslation: {summary}"
+        )
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_metar_failure(self, mock_get):
+        # A failed request is reported as None
+        mock_get.return_value = None
+
+        self.assertIsNone(await aviation_client.fetch_metar("KJFK"))
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_metar_malformed(self, mock_get):
+        # A response missing expected fields is reported as None
+        mock_get.return_value = {"meta": {"timestamp": "2024-07-12T16:55:00Z"}}
+
+        self.assertIsNone(await aviation_client.fetch_metar("KJFK"))
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_metar_cached(self, mock_get):
+        mock_get.return_value = {"raw": "KJFK 121651Z 31012KT"}
+
+        first = await aviation_client.fetch_metar("KJFK")
+        second = await aviation_client.fetch_metar("KJFK")
+
+        # Repeated lookups for the same station should be served from the cache
+        self.assertEqual(first, second)
+        mock_get.assert_called_once()
+        self.assertEqual(aviation_client.get_aviation_cache().stats()["hits"], 1)
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_concurrent_airport_lookups_coalesced(self, mock_get):
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"name": "John F Kennedy International", "location": {"city": "New York", "country": "US"}}
+        mock_get.side_effect = slow_response
+
+        # TEB is not in the bundled reference data, so it is looked up upstream
+        results = await asyncio.gather(*(aviation_client.fetch_airport_info("TEB") for _ in range(3)))
+
+        # Simultaneous requests for the same airport should reach upstream once
+        mock_get.assert_called_once()
+        self.assertTrue(all(result == results[0] for result in results))
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_reference_data_answers_without_network(self, mock_get):
+        airport = await aviation_client.fetch_airport_info("LHR")
+        aircraft = await aviation_client.fetch_aircraft_info("B738")
+
+        mock_get.assert_not_called()
+        self.assertEqual(airport, aviation_client.AirportInfo("LHR", "London Heathrow", "London", "GB"))
+        self.assertEqual(aircraft, aviation_client.AircraftInfo("B738", "Boeing", "737-800"))
+
+    def test_metar_ttl(self):
+        now = datetime(2024, 7, 12, 17, 10, tzinfo=timezone.utc)
+
+        # A report observed at 16:51 stays current until the 17:51 issuance
+        self.assertEqual(aviation_client.metar_ttl("KJFK 121651Z 31012KT", now), 41 * 60)
+        # A report observed just before midnight yesterday is measured across the day boundary
+        self.assertEqual(aviation_client.metar_ttl("KJFK 112351Z 31012KT", datetime(2024, 7, 12, 0, 20, tzinfo=timezone.utc)), 31 * 60)
+        # Stale reports are kept only briefly, and unparseable ones fall back to the default TTL
+        self.assertEqual(aviation_client.metar_ttl("KJFK 101651Z 31012KT", now), aviation_client.METAR_MIN_TTL)
+        self.assertEqual(aviation_client.metar_ttl("garbage", now), Config.METAR_CACHE_TTL)
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_raw_metar(self, mock_get):
+        mock_get.return_value = (
+            "<response><data><METAR><raw_text>EGLL 121650Z 24008KT CAVOK 18/09 Q1021</raw_text></METAR></data></response>"
+        )
+
+        report = await aviation_client.fetch_raw_metar("EGLL")
+
+        self.assertEqual(report.raw, "EGLL 121650Z 24008KT CAVOK 18/09 Q1021")
+        self.assertEqual(aviation_client.format_metar(report), "METAR for EGLL:\nEGLL 121650Z 24008KT CAVOK 18/09 Q1021")
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_raw_metars_in_one_request(self, mock_get):
+        mock_get.return_value = (
+            "<response><data>"
+            "<METAR><raw_text>EGLL 121650Z 24008KT CAVOK 18/09 Q1021</raw_text></METAR>"
+            "<METAR><raw_text>KJFK 121651Z 31012KT 1/2SM FG OVC002 24/23 A3012</raw_text></METAR>"
+            "</data></response>"
+        )
+        await aviation_client.fetch_raw_metar("EGLL")
+
+        reports = await aviation_client.fetch_raw_metars(["EGLL", "KJFK", "KBOS"])
+
+        # EGLL comes from the cache; KJFK and KBOS are requested together
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args.kwargs["params"]["stationString"], "KJFK,KBOS")
+        self.assertEqual(list(reports), ["EGLL", "KJFK"])
+        self.assertEqual(
+            aviation_client.format_metar_line(reports["KJFK"]),
+            "KJFK LIFR: KJFK 121651Z 31012KT 1/2SM FG OVC002 24/23 A3012"
+        )
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_taf_translated_locally(self, mock_get):
+        mock_get.return_value = {"raw": "TAF EGLL 121100Z 1212/1318 24010KT 9999 SCT030 TEMPO 1214/1218 4000 SHRA BKN012"}
+
+        report = await aviation_client.fetch_taf("EGLL")
+
+        self.assertEqual(report.summary, (
+            "1212-1318: Winds 240 at 10kt, Vis 6.2sm, Scattered clouds at 3000ft, VFR\n"
+            "TEMPO 1214-1218: Vis 2.5sm, Showers of rain, Broken layer at 1200ft, IFR"
+        ))
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_notams(self, mock_get):
+        mock_get.return_value = {"notams": [{"all": "A0001/24 RWY 04L CLSD"}]}
+
+        notam_list = await aviation_client.fetch_notams("KJFK")
+
+        self.assertEqual(notam_list, NotamList("KJFK", ["A0001/24 RWY 04L CLSD"]))
+        self.assertEqual(aviation_client.format_notams(notam_list), "NOTAMs for KJFK:\nA0001/24 RWY 04L CLSD")
+        self.assertEqual(aviation_client.format_notams(NotamList("KJFK")), "No NOTAMs found for KJFK.")
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_weather_info(self, mock_get):
+        mock_get.return_value = {
+            "weather": [{"description": "clear sky"}],
+            "main": {"temp": 21.5, "humidity": 40},
+            "wind": {"speed": 3.1}
+        }
+
+        info = await aviation_client.fetch_weather_info("London")
+
+        self.assertEqual(
+            aviation_client.format_weather_info(info),
+            "Weather Information for London:\nDescription: clear sky\nTemperature: 21.5°C\nHumidity: 40%\nWind Speed: 3.1 m/s"
+        )
+
+class TestAviationEdge(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        keys = patch.multiple(Config, create=True, AVIATION_EDGE_API_KEY="edge-test", AVIATION_EDGE_DAILY_QUOTA=3)
+        keys.start()
+        self.addCleanup(keys.stop)
+        aviation_client.get_aviation_cache().clear()
+        aviation_client._edge_quotas.clear()
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_fetch_for_airports_fans_out(self, mock_get):
+        mock_get.side_effect = lambda url, params: [{"station": params["codeIataAirport"], "type": params["type"]}]
+
+        results = await aviation_client.fetch_for_airports(aviation_client.fetch_edge_tafs, ["LHR", "JFK", "LHR"])
+
+        self.assertEqual(list(results), ["LHR", "JFK"])
+        self.assertEqual(results["JFK"], [{"station": "JFK", "type": "taf"}])
+        self.assertEqual(mock_get.call_count, 2)
+
+        # Repeated lookups are served from the shared cache without using quota
+        await aviation_client.fetch_for_airports(aviation_client.fetch_edge_tafs, ["JFK"])
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(aviation_client.get_edge_quota().remaining(), 1)
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_quota_is_tracked_per_key(self, mock_get):
+        mock_get.return_value = []
+
+        results = await aviation_client.fetch_for_airports(aviation_client.fetch_flights, ["LHR", "JFK", "CDG", "AMS"])
+
+        # The fourth call would exceed the daily quota of the key
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertIsNone(results["AMS"])
+        self.assertEqual(aviation_client.get_edge_quota().remaining(), 0)
+        self.assertEqual(aviation_client.get_edge_quota("other-key").remaining(), 3)
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_no_records_is_empty(self, mock_get):
+        mock_get.return_value = {"error": "No Record Found", "success": False}
+        self.assertEqual(await aviation_client.fetch_edge_notams("LHR"), [])
+
+        mock_get.return_value = {"error": "Invalid API key"}
+        self.assertIsNone(await aviation_client.fetch_flights("JFK"))
+
+    @patch("aviation_client._get", new_callable=AsyncMock)
+    async def test_airport_database_by_iata_or_icao(self, mock_get):
+        mock_get.return_value = [{"nameAirport": "Van Ferit Melen"}]
+
+        await aviation_client.fetch_airport_database("VAN")
+        await aviation_client.fetch_airport_database("LTCI")
+
+        params = [call.kwargs["params"] for call in mock_get.call_args_list]
+        self.assertEqual(params[0]["codeIataAirport"], "VAN")
+        self.assertEqual(params[1]["codeIcaoAirport"], "LTCI")
+
+    def test_parse_airport_codes(self):
+        self.assertEqual(aviation_client.parse_airport_codes("lhr JFK, cdg jfk"), ("LHR", "JFK", "CDG"))
+        self.assertIsNone(aviation_client.parse_airport_codes(""))
+        self.assertIsNone(aviation_client.parse_airport_codes("LHR KJFK"))
+        with patch.object(Config, "AVIATION_EDGE_MAX_CODES", 2):
+            self.assertIsNone(aviation_client.parse_airport_codes("LHR JFK CDG"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# test_cache.py
+import asyncio
+import unittest
+from unittest.mock import patch
+from cache import TTLCache, SingleFlight, estimate_size
+
+class TestTTLCache(unittest.TestCase):
+    def test_get_and_set(self):
+        cache = TTLCache(10_000)
+        cache.set("KJFK", "METAR data", ttl=60)
+
+        self.assertEqual(cache.get("KJFK"), "METAR data")
+        self.assertIsNone(cache.get("EGLL"))
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    @patch("cache.time.monotonic")
+    def test_entries_expire(self, mock_monotonic):
+        cache = TTLCache(10_000)
+        mock_monotonic.return_value = 100.0
+        cache.set("KJFK", "METAR data", ttl=60)
+
+        # The entry is fresh until its TTL elapses
+        mock_monotonic.return_value = 159.0
+        self.assertEqual(cache.get("KJFK"), "METAR data")
+        mock_monotonic.return_value = 160.0
+        self.assertIsNone(cache.get("KJFK"))
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction_by_memory(self):
+        value_size = estimate_size("x" * 100)
+        cache = TTLCache(value_size * 2)
+        cache.set("a", "x" * 100, ttl=60)
+        cache.set("b", "y" * 100, ttl=60)
+
+        # Touch "a" so "b" becomes the least recently used entry
+        cache.get("a")
+        cache.set("c", "z" * 100, ttl=60)
+
+        self.assertEqual(cache.get("a"), "x" * 100)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+class TestSingleFlight(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_calls_share_one_request(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def request():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "Airport Information for JFK"
+
+        results = await asyncio.gather(*(flight.do("JFK", request) for _ in range(5)))
+
+        # Only the first caller reaches upstream; the rest share its result
+        self.assertEqual(results, ["Airport Information for JFK"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.shared, 4)
+        self.assertEqual(len(flight), 0)
+
+    async def test_errors_propagate_to_every_caller(self):
+        flight = SingleFlight()
+
+        async def request():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        results = await asyncio.gather(flight.do("JFK", request), flight.do("JFK", request), return_exceptions=True)
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        flight = SingleFlight()
+
+        async def request():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("JFK", request))
+        second = asyncio.ensure_future(flight.do("JFK", request))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, "done")
+
+if __name__ == "__main__":
+    unittest.main()
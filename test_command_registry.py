@@ -0,0 +1,76 @@
+# test_command_registry.py
+import unittest
+from command_registry import CommandRegistry
+
+class FakeService:
+    platform = "youtube"
+
+    def __init__(self):
+        self.lookups = []
+
+    async def fetch_metar(self, station_code):
+        self.lookups.append(station_code)
+        return f"METAR data for {station_code}"
+
+class TestCommandRegistry(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.registry = CommandRegistry()
+        self.service = FakeService()
+
+        @self.registry.command("metar", usage="!metar <station_code>", description="Get METAR data",
+                               pattern=r"[A-Z]{4}", error="Please provide a valid 4-letter ICAO station code.", uppercase=True)
+        async def metar(service, station_code):
+            return await service.fetch_metar(station_code)
+
+        @self.registry.command("search", usage="!search <query>", description="Search videos",
+                               platforms=["youtube"], aliases=["find"])
+        async def search(service, query):
+            return f"Results for {query}"
+
+    async def test_dispatch_normalizes_argument(self):
+        response = await self.registry.dispatch("!metar kjfk", self.service)
+
+        self.assertEqual(response, "METAR data for KJFK")
+        self.assertEqual(self.service.lookups, ["KJFK"])
+
+    async def test_dispatch_rejects_invalid_argument(self):
+        response = await self.registry.dispatch("!metar JFK", self.service)
+
+        # The handler must not run when validation fails
+        self.assertEqual(response, "Please provide a valid 4-letter ICAO station code.")
+        self.assertEqual(self.service.lookups, [])
+
+    async def test_dispatch_ignores_plain_chat(self):
+        self.assertIsNone(await self.registry.dispatch("hello everyone", self.service))
+
+    async def test_dispatch_unknown_command_points_to_help(self):
+        response = await self.registry.dispatch("!unknown", self.service)
+
+        self.assertEqual(response, "I'm sorry, I don't know that command. Try !help for the list of commands.")
+
+    async def test_dispatch_unknown_command_ignored_on_twitch(self):
+        twitch_service = FakeService()
+        twitch_service.platform = "twitch"
+
+        # Commands meant for other channel bots must not trigger a reply
+        self.assertIsNone(await self.registry.dispatch("!lurk", twitch_service))
+        self.assertIsNone(await self.registry.dispatch("!so somestreamer", twitch_service))
+
+    async def test_platform_specific_commands(self):
+        twitch_service = FakeService()
+        twitch_service.platform = "twitch"
+
+        # YouTube-only commands are neither dispatched nor listed on other platforms
+        self.assertEqual(await self.registry.dispatch("!find planes", self.service), "Results for planes")
+        response = await self.registry.dispatch("!search planes", twitch_service)
+        self.assertIsNone(response)
+        self.assertNotIn("!search", self.registry.help_text("twitch"))
+
+    def test_duplicate_registration_rejected(self):
+        with self.assertRaises(ValueError):
+            @self.registry.command("find")
+            async def find(service, query):
+                return query
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# test_config.py
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+from config import Config, Settings
+
+# The credentials every deployment needs, plus the key of the default language model provider
+SHARED_CREDENTIALS = {
+    name: "test" for name in (
+        "OPENAI_API_KEY", "GOOGLE_PSE_ID", "GOOGLE_PSE_API_KEY", "AVWX_API_KEY", "ICAO_API_KEY", "RAPIDAPI_KEY",
+        "OPENWEATHERMAP_API_KEY", "AVIATION_EDGE_API_KEY", "NAVIGRAPH_API_KEY"
+    )
+}
+
+class TestSettings(unittest.TestCase):
+    def setUp(self):
+        self.environ = dict(SHARED_CREDENTIALS, ENABLED_PLATFORMS="discord", DISCORD_BOT_TOKEN="test")
+
+    def write_config(self, values):
+        file = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        with file:
+            json.dump(values, file)
+        self.addCleanup(os.unlink, file.name)
+        return file.name
+
+    def test_environment_values_are_converted(self):
+        self.environ.update(YOUTUBE_SEND_RATE="1.5", DISPATCH_CONCURRENCY="8")
+
+        settings = Settings.load(environ=self.environ)
+
+        self.assertEqual(settings.YOUTUBE_SEND_RATE, 1.5)
+        self.assertEqual(settings.DISPATCH_CONCURRENCY, 8)
+        self.assertEqual(settings.METAR_CACHE_TTL, 600.0)
+
+    def test_environment_overrides_config_file(self):
+        path = self.write_config({"DISPATCH_CONCURRENCY": 2, "METAR_CACHE_TTL": 300})
+        self.environ["DISPATCH_CONCURRENCY"] = "6"
+
+        settings = Settings.load(path, environ=self.environ)
+
+        self.assertEqual(settings.DISPATCH_CONCURRENCY, 6)
+        self.assertEqual(settings.METAR_CACHE_TTL, 300.0)
+
+    def test_reports_every_problem(self):
+        self.environ.update(DISPATCH_CONCURRENCY="0", TWITCH_RATE_PROFILE="admin", ENABLED_PLATFORMS="discord,twitch")
+
+        with self.assertRaises(ValueError) as error:
+            Settings.load(environ=self.environ)
+
+        message = str(error.exception)
+        self.assertIn("DISPATCH_CONCURRENCY must be at least 1", message)
+        self.assertIn("TWITCH_RATE_PROFILE must be one of", message)
+        self.assertIn("TWITCH_BOT_TOKEN is required", message)
+
+    def test_only_listed_providers_need_api_keys(self):
+        self.environ.pop("OPENAI_API_KEY")
+
+        with self.assertRaises(ValueError) as error:
+            Settings.load(environ=dict(self.environ, LLM_PROVIDERS="anthropic"))
+        self.assertIn("ANTHROPIC_API_KEY is required when LLM_PROVIDERS includes anthropic", str(error.exception))
+        self.assertNotIn("OPENAI_API_KEY", str(error.exception))
+
+        settings = Settings.load(environ=dict(self.environ, LLM_PROVIDERS="anthropic", ANTHROPIC_API_KEY="test"))
+        self.assertIsNone(settings.OPENAI_API_KEY)
+        with self.assertRaises(ValueError):
+            Settings.load(environ=dict(self.environ, LLM_PROVIDERS="openai,claude", OPENAI_API_KEY="test"))
+
+    def test_rejects_bad_types_and_unknown_settings(self):
+        with self.assertRaises(ValueError):
+            Settings.load(environ=dict(self.environ, YOUTUBE_SEND_BURST="lots"))
+        with self.assertRaises(ValueError):
+            Settings.load(self.write_config({"YOUTUBE_SEND_BURTS": 3}), environ=self.environ)
+
+class TestReload(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(Config.apply, Config.settings)
+        self.addCleanup(setattr, Config, "config_file", Config.config_file)
+        self.environ = dict(SHARED_CREDENTIALS, ENABLED_PLATFORMS="discord", DISCORD_BOT_TOKEN="test")
+        with patch.dict(os.environ, self.environ, clear=True):
+            Config.load_configuration()
+
+    def test_reload_applies_tunables_and_notifies_listeners(self):
+        changes = []
+        Config.add_reload_listener(changes.append)
+        self.addCleanup(Config.remove_reload_listener, changes.append)
+
+        with patch.dict(os.environ, dict(self.environ, YOUTUBE_SEND_RATE="2", DISCORD_BOT_TOKEN="other"), clear=True):
+            changed = Config.reload()
+
+        # The token needs a restart, so only the rate changes
+        self.assertEqual(changed, {"YOUTUBE_SEND_RATE"})
+        self.assertEqual(changes, [{"YOUTUBE_SEND_RATE"}])
+        self.assertEqual(Config.YOUTUBE_SEND_RATE, 2.0)
+        self.assertEqual(Config.DISCORD_BOT_TOKEN, "test")
+
+    def test_invalid_reload_keeps_current_values(self):
+        with patch.dict(os.environ, dict(self.environ, YOUTUBE_SEND_RATE="-1"), clear=True):
+            self.assertEqual(Config.reload(), set())
+
+        self.assertEqual(Config.YOUTUBE_SEND_RATE, 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# test_conversation_memory.py
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from conversation_memory import ConversationStore, Conversation, Turn, count_tokens
+
+class TestConversation(unittest.TestCase):
+    def test_count_tokens(self):
+        self.assertEqual(count_tokens("METAR KJFK, please!"), 5)
+
+    def test_trims_oldest_turns_over_budget(self):
+        conversation = Conversation("twitch_aviation", max_turns=10)
+        for i in range(5):
+            conversation.add(Turn("user", f"message number {i}"), token_budget=9)
+
+        # Each turn is three tokens, so only the newest three fit
+        self.assertEqual([turn.content for turn in conversation.turns], ["message number 2", "message number 3", "message number 4"])
+        self.assertEqual(conversation.tokens, 9)
+
+    def test_ring_buffer_drops_oldest_turn(self):
+        conversation = Conversation("twitch_aviation", max_turns=2)
+        for content in ("one", "two", "three"):
+            conversation.add(Turn("user", content), token_budget=100)
+
+        self.assertEqual([turn.content for turn in conversation.turns], ["two", "three"])
+        self.assertEqual(conversation.tokens, 2)
+
+    def test_window_starts_with_user_turn(self):
+        conversation = Conversation("twitch_aviation", max_turns=10)
+        conversation.add(Turn("user", "alice: what is a METAR?"), token_budget=100)
+        conversation.add(Turn("assistant", "A routine weather report."), token_budget=100)
+        conversation.add(Turn("user", "bob: and a TAF?"), token_budget=100)
+
+        # The assistant turn fits the budget but would open the history
+        window = conversation.window(token_budget=10)
+
+        self.assertEqual([turn.content for turn in window], ["bob: and a TAF?"])
+
+class TestConversationStore(unittest.IsolatedAsyncioTestCase):
+    async def test_context_returns_recent_turns(self):
+        store = ConversationStore(max_conversations=10, max_turns=10, token_budget=100, idle_timeout=60)
+        await store.add_turn("twitch_aviation", "user", "alice: hello")
+        await store.add_turn("twitch_aviation", "assistant", "Hi alice!")
+
+        context = await store.context("twitch_aviation")
+
+        self.assertEqual(context, [
+            {"role": "user", "content": "alice: hello"},
+            {"role": "assistant", "content": "Hi alice!"}
+        ])
+        self.assertEqual(await store.context("youtube_other"), [])
+
+    async def test_evicts_least_recently_used(self):
+        store = ConversationStore(max_conversations=2, max_turns=10, token_budget=100, idle_timeout=60)
+        await store.add_turn("a", "user", "first")
+        await store.add_turn("b", "user", "second")
+        await store.context("a")
+        await store.add_turn("c", "user", "third")
+
+        self.assertEqual(len(store), 2)
+        self.assertEqual(await store.context("a"), [{"role": "user", "content": "first"}])
+        self.assertEqual(await store.context("b"), [])
+
+    @patch("conversation_memory.time.monotonic")
+    async def test_evicts_idle_conversations(self, mock_monotonic):
+        store = ConversationStore(max_conversations=10, max_turns=10, token_budget=100, idle_timeout=60)
+        mock_monotonic.return_value = 100.0
+        await store.add_turn("a", "user", "first")
+        mock_monotonic.return_value = 150.0
+        await store.add_turn("b", "user", "second")
+
+        mock_monotonic.return_value = 170.0
+        self.assertEqual(store.evict_idle(), 1)
+        self.assertEqual(len(store), 1)
+
+    async def test_persists_history_in_sqlite(self):
+        with tempfile.TemporaryDirectory() as directory:
+            db_path = os.path.join(directory, "memory.db")
+            store = ConversationStore(max_conversations=10, max_turns=3, token_budget=100, idle_timeout=60, db_path=db_path)
+            for content in ("one", "two", "three", "four"):
+                await store.add_turn("twitch_aviation", "user", content)
+            store.close()
+
+            # A new store reloads the newest turns from disk
+            store = ConversationStore(max_conversations=10, max_turns=3, token_budget=100, idle_timeout=60, db_path=db_path)
+            context = await store.context("twitch_aviation")
+            rows = store._db.execute("SELECT COUNT(*) FROM turns").fetchone()[0]
+            store.close()
+
+        self.assertEqual([turn["content"] for turn in context], ["two", "three", "four"])
+        self.assertEqual(rows, 3)
+
+if __name__ == '__main__':
+    unittest.main()
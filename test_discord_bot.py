@@ -0,0 +1,66 @@
+# test_discord_bot.py
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import discord_bot
+
+VAN_AIRPORT = {"nameAirport": "Van Ferit Melen", "codeIataAirport": "VAN", "codeIcaoAirport": "LTCI", "nameCountry": "Turkey"}
+
+class TestAirportInfo(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.ctx = MagicMock()
+        self.ctx.send = AsyncMock()
+
+    def replies(self):
+        return [call.args[0] for call in self.ctx.send.call_args_list]
+
+    @patch("aviation_client.fetch_airport_database", new_callable=AsyncMock)
+    async def test_bundled_code_answered_locally(self, mock_fetch):
+        await discord_bot.airport_info.callback(self.ctx, query="lhr")
+
+        mock_fetch.assert_not_called()
+        self.assertIn("Heathrow", self.replies()[0])
+
+    @patch("aviation_client.fetch_airport_database", new_callable=AsyncMock)
+    async def test_unknown_code_is_not_matched_by_name(self, mock_fetch):
+        mock_fetch.return_value = [VAN_AIRPORT]
+
+        await discord_bot.airport_info.callback(self.ctx, query="VAN")
+
+        # VAN is Van in Turkey, not a name prefix of Vancouver or Vantaa
+        mock_fetch.assert_awaited_once_with("VAN")
+        self.assertEqual(len(self.replies()), 1)
+        self.assertIn("Van Ferit Melen (VAN/LTCI)", self.replies()[0])
+        self.assertNotIn("Vancouver", self.replies()[0])
+
+    @patch("aviation_client.fetch_airport_database", new_callable=AsyncMock)
+    async def test_unknown_upper_case_code_is_not_found(self, mock_fetch):
+        mock_fetch.return_value = []
+
+        await discord_bot.airport_info.callback(self.ctx, query="MIL")
+
+        self.assertEqual(self.replies(), ["Airport information not found."])
+
+    @patch("aviation_client.fetch_airport_database", new_callable=AsyncMock)
+    async def test_names_use_the_reference_index(self, mock_fetch):
+        mock_fetch.return_value = []
+
+        await discord_bot.airport_info.callback(self.ctx, query="heathrow")
+        await discord_bot.airport_info.callback(self.ctx, query="doha")
+
+        # Four-letter names are tried as ICAO codes first, then matched by name
+        mock_fetch.assert_awaited_once_with("DOHA")
+        self.assertIn("Heathrow", self.replies()[0])
+        self.assertIn("Hamad", self.replies()[1])
+
+class TestCreateBot(unittest.IsolatedAsyncioTestCase):
+    async def test_adds_shared_and_discord_commands(self):
+        bot = discord_bot.create_bot()
+        self.addAsyncCleanup(bot.close)
+
+        names = {command.name for command in bot.commands}
+        self.assertIn("metar", names)
+        self.assertIn("airportinfo", names)
+        self.assertIn("flightboard", names)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# test_discord_render.py
+import unittest
+from unittest.mock import MagicMock
+import discord_render
+from discord_render import DISCORD_MESSAGE_LIMIT, field, format_flight, format_text_record, render_records
+
+def make_flight(number, status="en-route", altitude=10668.0):
+    return {
+        "flight": {"iataNumber": number, "icaoNumber": "BAW" + number[2:]},
+        "departure": {"iataCode": "LHR", "icaoCode": "EGLL"},
+        "arrival": {"iataCode": "JFK", "icaoCode": "KJFK"},
+        "aircraft": {"icaoCode": "B77W", "regNumber": "G-STBA", "icao24": "406B71"},
+        "geography": {"altitude": altitude, "latitude": 51.2, "longitude": -30.1, "direction": 270},
+        "speed": {"horizontal": 900, "isGround": 0, "vspeed": 0},
+        "status": status,
+        "system": {"updated": 1720800000, "squawk": None}
+    }
+
+class TestDiscordRender(unittest.TestCase):
+    def test_field(self):
+        flight = make_flight("BA117")
+        self.assertEqual(field(flight, "flight.iataNumber"), "BA117")
+        self.assertEqual(field(flight, "system.squawk", "none"), "none")
+        self.assertEqual(field(flight, "status.code"), "")
+
+    def test_format_flight_projects_fields(self):
+        self.assertEqual(format_flight(make_flight("BA117")), "BA117 LHR→JFK en-route B77W 10668 m")
+        self.assertEqual(format_flight({"status": "scheduled"}), "? ?→? scheduled")
+
+    def test_format_flight_omits_invalid_altitude(self):
+        for altitude in ("", None, "n/a", [], "nan"):
+            self.assertEqual(format_flight(make_flight("BA117", altitude=altitude)), "BA117 LHR→JFK en-route B77W")
+        self.assertEqual(format_flight(make_flight("BA117", altitude="10668")), "BA117 LHR→JFK en-route B77W 10668 m")
+
+    def test_format_text_record(self):
+        self.assertEqual(format_text_record({"raw": "TAF EGLL 121100Z\n  2412/2518 24010KT"}), "TAF EGLL 121100Z 2412/2518 24010KT")
+        self.assertEqual(format_text_record({"id": 1}), '{"id":1}')
+
+    def test_pages_stay_within_limit(self):
+        flights = [make_flight(f"BA{number}") for number in range(500)]
+
+        pages = discord_render.render_flights("JFK", flights, max_pages=3)
+
+        self.assertEqual(len(pages), 3)
+        self.assertTrue(all(len(page) <= DISCORD_MESSAGE_LIMIT for page in pages))
+        self.assertTrue(pages[0].startswith("**Flights arriving at JFK** (500)\nBA0 LHR→JFK"))
+        self.assertRegex(pages[-1], r"\n…and \d+ more\.$")
+
+    def test_stops_formatting_once_full(self):
+        format_record = MagicMock(side_effect=lambda record: "x" * 100)
+
+        pages = render_records("title", list(range(1000)), format_record, limit=500, max_pages=2)
+
+        # Only the records that fit are formatted
+        self.assertLess(format_record.call_count, 12)
+        self.assertTrue(all(len(page) <= 500 for page in pages))
+
+    def test_small_result_fits_one_page(self):
+        pages = discord_render.render_tafs("LHR", {"raw": "TAF EGLL 121100Z 2412/2518 24010KT CAVOK"})
+        self.assertEqual(pages, ["**TAFs for LHR**\nTAF EGLL 121100Z 2412/2518 24010KT CAVOK"])
+
+    def test_long_lines_are_shortened(self):
+        pages = render_records("", [{"text": "A" * 5000}], format_text_record)
+        self.assertEqual(len(pages), 1)
+        self.assertTrue(pages[0].endswith("…"))
+        self.assertLessEqual(len(pages[0]), DISCORD_MESSAGE_LIMIT)
+
+if __name__ == "__main__":
+    unittest.main()
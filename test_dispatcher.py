@@ -0,0 +1,94 @@
+# test_dispatcher.py
+import asyncio
+import unittest
+from dispatcher import MessageDispatcher
+
+class TestMessageDispatcher(unittest.IsolatedAsyncioTestCase):
+    async def test_messages_handled_concurrently(self):
+        running = []
+        peak = []
+
+        async def handler(message):
+            running.append(message)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(message)
+
+        dispatcher = MessageDispatcher(handler, concurrency=3, max_pending=10)
+        dispatcher.start()
+        for user in ("alice", "bob", "carol"):
+            await dispatcher.submit(user, f"!weather from {user}")
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        # Messages from different users should run side by side
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(dispatcher.stats()["processed"], 3)
+
+    async def test_resize_changes_worker_count(self):
+        async def handler(message):
+            await asyncio.sleep(0)
+
+        dispatcher = MessageDispatcher(handler, concurrency=2, max_pending=10)
+        dispatcher.start()
+        dispatcher.resize(4)
+        self.assertEqual(len(dispatcher._workers), 4)
+
+        dispatcher.resize(1)
+        await dispatcher.join()
+        self.assertEqual(len(dispatcher._workers), 1)
+
+        # The remaining worker keeps handling messages
+        await dispatcher.submit("alice", "!metar KJFK")
+        await dispatcher.join()
+        await dispatcher.stop()
+        self.assertEqual(dispatcher.stats()["processed"], 1)
+
+    async def test_users_served_round_robin(self):
+        handled = []
+
+        async def handler(message):
+            handled.append(message)
+
+        dispatcher = MessageDispatcher(handler, concurrency=1, max_pending=10)
+        for i in range(3):
+            await dispatcher.submit("spammer", f"spammer {i}")
+        await dispatcher.submit("viewer", "viewer 0")
+        dispatcher.start()
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        # A quiet user should not wait behind every message from a busy one
+        self.assertEqual(handled, ["spammer 0", "viewer 0", "spammer 1", "spammer 2"])
+
+    async def test_submit_waits_when_full(self):
+        async def handler(message):
+            pass
+
+        dispatcher = MessageDispatcher(handler, concurrency=1, max_pending=1)
+        await dispatcher.submit("alice", "first")
+        blocked = asyncio.ensure_future(dispatcher.submit("bob", "second"))
+        await asyncio.sleep(0)
+
+        # The second submission is held back until a worker takes the first
+        self.assertFalse(blocked.done())
+        dispatcher.start()
+        await blocked
+        await dispatcher.join()
+        await dispatcher.stop()
+        self.assertEqual(dispatcher.stats()["max_depth"], 1)
+
+    async def test_handler_errors_are_counted(self):
+        async def handler(message):
+            raise RuntimeError("boom")
+
+        dispatcher = MessageDispatcher(handler, concurrency=1, max_pending=5)
+        dispatcher.start()
+        await dispatcher.submit("alice", "!metar KJFK")
+        await dispatcher.join()
+        await dispatcher.stop()
+
+        self.assertEqual(dispatcher.stats()["failed"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
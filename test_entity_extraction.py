@@ -0,0 +1,61 @@
+# test_entity_extraction.py
+import unittest
+from unittest.mock import patch
+from nltk.tree import Tree
+from entity_extraction import EntityExtractor, find_aviation_codes, might_contain_names, names_from_tree
+
+class TestPreFilter(unittest.TestCase):
+    def test_find_aviation_codes(self):
+        codes = find_aviation_codes("Is the a320neo at EGLL or LHR? The B737-800 went to KJFK and EGLL")
+
+        self.assertEqual(codes.icao, ("EGLL", "KJFK"))
+        self.assertEqual(codes.iata, ("LHR",))
+        self.assertEqual(codes.aircraft, ("A320NEO", "B737-800"))
+        self.assertFalse(find_aviation_codes("what plane is this?"))
+
+    def test_might_contain_names(self):
+        self.assertTrue(might_contain_names("is this plane flying to London today?"))
+        # Names at the start of a sentence, all-caps codes and lower-case aircraft types still reach NLTK
+        self.assertTrue(might_contain_names("London is busy today"))
+        self.assertTrue(might_contain_names("nice. Heathrow has delays"))
+        self.assertTrue(might_contain_names("EGLL weather please"))
+        self.assertTrue(might_contain_names("is that an a320neo"))
+        self.assertFalse(might_contain_names("what plane is this? it looks big."))
+        self.assertFalse(might_contain_names("lol nice landing"))
+
+    def test_names_from_tree(self):
+        tree = Tree("S", [
+            Tree("PERSON", [("John", "NNP")]), ("flew", "VBD"), ("to", "TO"),
+            Tree("GPE", [("New", "NNP"), ("York", "NNP")]), Tree("GPE", [("City", "NNP")]),
+            ("and", "CC"), Tree("PERSON", [("John", "NNP")])
+        ])
+
+        self.assertEqual(names_from_tree(tree), ("John", "New York City"))
+
+class TestEntityExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = EntityExtractor(cache_size=10)
+        self.addCleanup(self.extractor.close)
+
+    def test_caches_results_and_skips_plain_messages(self):
+        with patch.object(self.extractor, "_extract", return_value=("London",)) as mock_extract:
+            self.assertEqual(self.extractor.extract_sync("flying to London"), ("London",))
+            self.assertEqual(self.extractor.extract_sync("flying to London"), ("London",))
+            self.assertEqual(self.extractor.extract_sync("lol nice landing"), ())
+
+        mock_extract.assert_called_once_with("flying to London")
+        stats = self.extractor.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["skipped"], 1)
+
+    def test_evicts_least_recently_used_results(self):
+        extractor = EntityExtractor(cache_size=2)
+        self.addCleanup(extractor.close)
+        with patch.object(extractor, "_extract", side_effect=lambda text: (text.split()[-1],)):
+            for text in ("flying to London", "flying to Paris", "flying to London", "flying to Rome"):
+                extractor.extract_sync(text)
+
+        self.assertEqual(list(extractor._cache), ["flying to London", "flying to Rome"])
+
+if __name__ == '__main__':
+    unittest.main()
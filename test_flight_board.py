@@ -0,0 +1,139 @@
+# test_flight_board.py
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from flight_board import FlightBoard, LiveFlightBoard, board_line, flight_key
+
+def make_flight(number, status="en-route", origin="LHR", altitude=10000.0):
+    return {
+        "flight": {"iataNumber": number, "icaoNumber": number.replace("BA", "BAW")},
+        "departure": {"iataCode": origin},
+        "arrival": {"iataCode": "JFK"},
+        "aircraft": {"icaoCode": "B77W"},
+        "geography": {"altitude": altitude},
+        "status": status
+    }
+
+class FakeMessage:
+    def __init__(self, content):
+        self.content = content
+        self.edits = 0
+        self.deleted = False
+
+    async def edit(self, content):
+        self.content = content
+        self.edits += 1
+
+    async def delete(self):
+        self.deleted = True
+
+class TestFlightBoard(unittest.TestCase):
+    def test_key_and_line(self):
+        flight = make_flight("BA117")
+        self.assertEqual(flight_key(flight), "BAW117 LHR")
+        self.assertEqual(board_line(flight), "BA117 from LHR en-route B77W")
+
+    def test_key_separates_codeshares_and_legs(self):
+        morning = make_flight("BA117")
+        morning["departure"]["scheduledTime"] = "2024-07-12T08:25:00.000"
+        evening = make_flight("BA117")
+        evening["departure"]["scheduledTime"] = "2024-07-12T18:40:00.000"
+        operated = make_flight("BA117")
+        operated["airline"] = {"icaoCode": "BAW"}
+        codeshare = make_flight("BA117")
+        codeshare["airline"] = {"icaoCode": "BAW"}
+        codeshare["codeshared"] = {"airline": {"icaoCode": "AAL"}}
+
+        self.assertEqual(flight_key(morning), "BAW117 LHR 2024-07-12T08:25:00.000")
+        self.assertEqual(flight_key(operated), "BAW117 LHR BAW")
+        self.assertEqual(flight_key(codeshare), "BAW117 LHR AAL")
+        self.assertEqual(len(FlightBoard("JFK").update([morning, evening, operated, codeshare]).added), 4)
+
+    def test_update_reports_diff(self):
+        board = FlightBoard("JFK")
+        first = board.update([make_flight("BA117"), make_flight("BA175")])
+        self.assertEqual(first.added, ["BAW117 LHR", "BAW175 LHR"])
+
+        # Altitude changes alone are not shown on the board, so they are not changes
+        second = board.update([make_flight("BA117", altitude=9000.0), make_flight("BA175", status="landed"), make_flight("BA113")])
+        self.assertEqual(second.added, ["BAW113 LHR"])
+        self.assertEqual(second.changed, ["BAW175 LHR"])
+        self.assertEqual(second.removed, [])
+
+        third = board.update([make_flight("BA113")])
+        self.assertEqual(third.removed, ["BAW117 LHR", "BAW175 LHR"])
+        self.assertFalse(board.update([make_flight("BA113")]))
+
+    def test_render_is_sorted(self):
+        board = FlightBoard("JFK")
+        board.update([make_flight("BA175"), make_flight("BA117")], now=datetime(2024, 7, 12, 17, 5, tzinfo=timezone.utc))
+
+        self.assertEqual(board.render(), [
+            "**Arrivals board for JFK** (2 flights, updated 17:05Z)\nBA117 from LHR en-route B77W\nBA175 from LHR en-route B77W"
+        ])
+
+class TestLiveFlightBoard(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sent = []
+
+        async def send(content):
+            message = FakeMessage(content)
+            self.sent.append(message)
+            return message
+        self.send = send
+
+    async def test_edits_only_on_change(self):
+        fetch = AsyncMock(return_value=[make_flight("BA117")])
+        live = LiveFlightBoard("JFK", self.send, fetch=fetch, refresh_interval=10, duration=60)
+
+        await live.refresh()
+        await live.refresh()
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(self.sent[0].edits, 0)
+
+        fetch.return_value = [make_flight("BA117", status="landed")]
+        await live.refresh()
+        self.assertEqual(len(self.sent), 1)
+        self.assertEqual(self.sent[0].edits, 1)
+        self.assertIn("BA117 from LHR landed B77W", self.sent[0].content)
+
+    async def test_pages_grow_and_shrink(self):
+        flights = [make_flight(f"BA{number}") for number in range(200)]
+        fetch = AsyncMock(return_value=flights)
+        live = LiveFlightBoard("JFK", self.send, fetch=fetch, refresh_interval=10, duration=60)
+
+        await live.refresh()
+        self.assertGreater(len(self.sent), 1)
+
+        fetch.return_value = flights[:1]
+        await live.refresh()
+        self.assertEqual(len(live.messages), 1)
+        self.assertTrue(all(message.deleted for message in self.sent[1:]))
+
+    async def test_failed_fetch_keeps_board(self):
+        fetch = AsyncMock(return_value=None)
+        live = LiveFlightBoard("JFK", self.send, fetch=fetch, refresh_interval=10, duration=60)
+
+        self.assertIsNone(await live.refresh())
+        self.assertEqual(self.sent, [])
+
+    async def test_failed_first_load_stops_board(self):
+        fetch = AsyncMock(return_value=None)
+        live = LiveFlightBoard("JFK", self.send, fetch=fetch, refresh_interval=10, duration=60)
+
+        await live.run()
+
+        fetch.assert_awaited_once()
+        self.assertEqual([message.content for message in self.sent], ["The flight board for JFK is unavailable right now. Please try again later."])
+
+    async def test_run_stops_after_duration(self):
+        fetch = AsyncMock(return_value=[make_flight("BA117")])
+        live = LiveFlightBoard("JFK", self.send, fetch=fetch, refresh_interval=0.01, duration=0.035)
+
+        await live.run()
+
+        self.assertGreaterEqual(fetch.call_count, 2)
+        self.assertLessEqual(fetch.call_count, 4)
+
+if __name__ == "__main__":
+    unittest.main()
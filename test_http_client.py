@@ -0,0 +1,32 @@
+# test_http_client.py
+import unittest
+from http_client import get_session, start_http_session, close_http_session
+
+class TestHttpClient(unittest.IsolatedAsyncioTestCase):
+    async def asyncTearDown(self):
+        await close_http_session()
+
+    async def test_session_is_shared(self):
+        await start_http_session()
+
+        # Every caller should receive the same pooled session
+        self.assertIs(get_session(), get_session())
+
+    async def test_session_recreated_after_close(self):
+        session = get_session()
+        await close_http_session()
+
+        # A closed session must never be handed out again
+        self.assertTrue(session.closed)
+        self.assertIsNot(get_session(), session)
+
+    async def test_connector_uses_configured_limits(self):
+        session = get_session()
+
+        # The connector should pool connections per host and cache DNS lookups
+        self.assertEqual(session.connector.limit, 100)
+        self.assertEqual(session.connector.limit_per_host, 10)
+        self.assertTrue(session.connector.use_dns_cache)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+# test_llm.py
+import unittest
+from unittest.mock import MagicMock, patch
+import aiohttp
+import llm
+from config import Config
+from conversation_memory import ConversationStore
+from response_cache import get_response_cache
+
+async def token_stream(tokens):
+    for token in tokens:
+        yield token
+
+class CutOffProvider(llm.StubProvider):
+    async def stream(self, messages):
+        yield "The winds are calm and the visibility is ten miles at the field. "
+        raise aiohttp.ClientPayloadError("connection reset")
+
+class FakeResponse:
+    def __init__(self, lines):
+        self.lines = lines
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    @property
+    def content(self):
+        return token_stream(self.lines)
+
+class TestSentenceChunks(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, tokens, min_chars, max_chars):
+        return [piece async for piece in llm.sentence_chunks(token_stream(tokens), min_chars, max_chars)]
+
+    async def test_flushes_complete_sentences(self):
+        tokens = ["The A3", "20 is a narrow", "body jet. It first", " flew in 1987. Thanks", " for asking!"]
+
+        pieces = await self.collect(tokens, min_chars=10, max_chars=100)
+
+        self.assertEqual(pieces, ["The A320 is a narrowbody jet.", "It first flew in 1987.", "Thanks for asking!"])
+
+    async def test_short_sentences_are_merged(self):
+        pieces = await self.collect(["Yes. ", "It is. ", "The wind is calm at KJFK right now. ", "Anything else?"], min_chars=10, max_chars=100)
+
+        self.assertEqual(pieces, ["Yes. It is.", "The wind is calm at KJFK right now.", "Anything else?"])
+
+    async def test_decimal_points_do_not_end_sentences(self):
+        pieces = await self.collect(["QNH is 29.", "92 inches today."], min_chars=5, max_chars=100)
+
+        self.assertEqual(pieces, ["QNH is 29.92 inches today."])
+
+    async def test_long_text_flushed_at_word_boundary(self):
+        pieces = await self.collect(["one two three four five six"], min_chars=5, max_chars=12)
+
+        self.assertTrue(all(len(piece) <= 12 for piece in pieces))
+        self.assertEqual(" ".join(pieces), "one two three four five six")
+
+class TestStreamResponse(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        key = patch.object(Config, "OPENAI_API_KEY", "test", create=True)
+        key.start()
+        self.addCleanup(key.stop)
+        get_response_cache().clear()
+
+    @patch("llm.get_session")
+    async def test_stream_chat_completion_parses_events(self, mock_get_session):
+        mock_get_session.return_value.post = MagicMock(return_value=FakeResponse([
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n',
+            b'\n',
+            b'data: {"choices": [{"delta": {"content": "Hello"}}]}\n',
+            b'data: {"choices": [{"delta": {"content": " there."}}]}\n',
+            b'data: [DONE]\n',
+        ]))
+
+        tokens = [token async for token in llm.stream_chat_completion(llm.build_messages("hi", "alice"))]
+
+        self.assertEqual(tokens, ["Hello", " there."])
+        self.assertTrue(mock_get_session.return_value.post.call_args.kwargs["json"]["stream"])
+
+    @patch("llm.get_conversation_store")
+    @patch("llm.get_router")
+    async def test_get_response_remembers_conversation(self, mock_get_router, mock_get_store):
+        mock_get_store.return_value = ConversationStore(max_conversations=10, max_turns=10, token_budget=1000, idle_timeout=60)
+        provider = llm.StubProvider("It is an Airbus A320.")
+        provider.stream = MagicMock(wraps=provider.stream)
+        mock_get_router.return_value = llm.LLMRouter([provider])
+
+        await llm.get_response("what plane is this?", "alice", "twitch_aviation")
+        await llm.get_response("how many seats?", "bob", "twitch_aviation")
+
+        # The second request carries the first exchange between the system prompt and the new message
+        messages = provider.stream.call_args.args[0]
+        self.assertEqual([message["role"] for message in messages], ["system", "user", "assistant", "user"])
+        self.assertEqual(messages[1]["content"], "alice: what plane is this?")
+        self.assertEqual(messages[2]["content"], "It is an Airbus A320.")
+        self.assertEqual(messages[3]["content"], "bob: how many seats?")
+
+    @patch("llm.get_router")
+    async def test_repeated_question_served_from_cache(self, mock_get_router):
+        provider = llm.StubProvider("It is an Airbus A320.")
+        provider.stream = MagicMock(wraps=provider.stream)
+        mock_get_router.return_value = llm.LLMRouter([provider])
+
+        first = await llm.get_response("What plane is this?", "alice", "twitch_aviation")
+        second = await llm.get_response("hey, what plane is this", "bob", "twitch_aviation")
+
+        self.assertEqual(first, second)
+        self.assertEqual(provider.stream.call_count, 1)
+
+    @patch("llm.get_router")
+    async def test_cache_is_per_conversation(self, mock_get_router):
+        provider = llm.StubProvider("It is an Airbus A320.")
+        provider.stream = MagicMock(wraps=provider.stream)
+        mock_get_router.return_value = llm.LLMRouter([provider])
+
+        await llm.get_response("What plane is this?", "alice", "twitch_aviation")
+        await llm.get_response("What plane is this?", "bob", "discord_42")
+
+        self.assertEqual(provider.stream.call_count, 2)
+
+    @patch("llm.get_router")
+    async def test_replies_naming_the_author_are_not_cached(self, mock_get_router):
+        provider = llm.StubProvider("Alice, it is an Airbus A320.")
+        provider.stream = MagicMock(wraps=provider.stream)
+        mock_get_router.return_value = llm.LLMRouter([provider])
+
+        await llm.get_response("What plane is this?", "alice", "twitch_aviation")
+        await llm.get_response("What plane is this?", "bob", "twitch_aviation")
+
+        self.assertEqual(provider.stream.call_count, 2)
+
+    @patch("llm.get_conversation_store")
+    @patch("llm.get_router")
+    async def test_cut_off_reply_is_not_cached_or_remembered(self, mock_get_router, mock_get_store):
+        store = ConversationStore(max_conversations=10, max_turns=10, token_budget=1000, idle_timeout=60)
+        mock_get_store.return_value = store
+        mock_get_router.return_value = llm.LLMRouter([CutOffProvider()])
+
+        response = await llm.get_response("What is the weather?", "alice", "twitch_aviation")
+
+        # The part that was streamed reaches the viewer, but is not replayed to anyone else
+        self.assertEqual(response, "The winds are calm and the visibility is ten miles at the field.")
+        self.assertIsNone(get_response_cache().get("What is the weather?", "twitch_aviation"))
+        self.assertEqual(await store.context("twitch_aviation"), [])
+
+    @patch("llm.get_router")
+    async def test_get_response_falls_back_on_error(self, mock_get_router):
+        mock_get_router.return_value = llm.LLMRouter([llm.StubProvider(error=aiohttp.ClientError("service unavailable"))])
+
+        response = await llm.get_response("what plane is this?", "alice", "twitch_aviation")
+
+        self.assertEqual(response, llm.FALLBACK_RESPONSE)
+
+    @patch("llm.get_router")
+    async def test_get_response_falls_back_without_providers(self, mock_get_router):
+        mock_get_router.return_value = llm.LLMRouter([])
+
+        response = await llm.get_response("what plane is this?", "alice", "twitch_aviation")
+
+        self.assertEqual(response, llm.FALLBACK_RESPONSE)
+
+    @patch("llm.get_router")
+    async def test_get_response_from_router(self, mock_get_router):
+        mock_get_router.return_value = llm.LLMRouter([llm.StubProvider("It is an Airbus A320.")])
+
+        response = await llm.get_response("what plane is this?", "alice", "twitch_aviation")
+
+        self.assertEqual(response, "It is an Airbus A320.")
+
+class TestLLMRouter(unittest.IsolatedAsyncioTestCase):
+    async def collect(self, router):
+        return "".join([token async for token in router.stream(llm.build_messages("hi", "alice"))])
+
+    async def test_prefers_fastest_provider(self):
+        slow = llm.StubProvider("slow reply", name="slow")
+        fast = llm.StubProvider("fast reply", name="fast")
+        slow.record_success(2.0)
+        fast.record_success(0.5)
+        router = llm.LLMRouter([slow, fast], hedge_after=0)
+
+        self.assertEqual(await self.collect(router), "fast reply")
+        self.assertEqual(slow.requests, 0)
+
+    async def test_hedges_slow_provider_and_cancels_loser(self):
+        stalled = llm.StubProvider("stalled reply", delay=10, name="stalled")
+        backup = llm.StubProvider("backup reply", name="backup")
+        stalled.record_success(0.1)
+        backup.record_success(0.2)
+        router = llm.LLMRouter([stalled, backup], hedge_after=0.01)
+
+        # The backup answers first, so the stalled request is cancelled
+        self.assertEqual(await self.collect(router), "backup reply")
+        self.assertEqual(stalled.cancelled, 1)
+        self.assertEqual(router.stats()["backup"]["requests"], 1)
+
+    async def test_fails_over_to_next_provider(self):
+        broken = llm.StubProvider(error=aiohttp.ClientError("boom"), name="broken")
+        working = llm.StubProvider("working reply", name="working")
+        broken.record_success(0.1)
+        working.record_success(0.2)
+        router = llm.LLMRouter([broken, working], hedge_after=0)
+
+        self.assertEqual(await self.collect(router), "working reply")
+        self.assertEqual(broken.error_rate, 0.5)
+
+    async def test_unhealthy_provider_ranked_last(self):
+        flaky = llm.StubProvider(name="flaky")
+        steady = llm.StubProvider(name="steady")
+        flaky.record_success(0.1)
+        steady.record_success(1.0)
+        for _ in range(llm.MIN_HEALTH_SAMPLES):
+            flaky.record_failure()
+
+        self.assertFalse(flaky.is_healthy())
+        self.assertEqual(llm.LLMRouter([flaky, steady]).ranked(), [steady, flaky])
+
+    async def test_all_providers_failing_raises(self):
+        router = llm.LLMRouter([llm.StubProvider(error=aiohttp.ClientError("boom"))], hedge_after=0)
+
+        with self.assertRaises(llm.LLMUnavailableError):
+            await self.collect(router)
+
+    async def test_no_providers_raises(self):
+        with self.assertRaises(llm.LLMUnavailableError):
+            await self.collect(llm.LLMRouter([]))
+
+    def test_percentiles(self):
+        provider = llm.StubProvider(window=100)
+        for latency in range(1, 101):
+            provider.record_success(latency / 100)
+
+        self.assertEqual(provider.percentile(50), 0.51)
+        self.assertEqual(provider.percentile(95), 0.96)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# test_message_bus.py
+import unittest
+from unittest.mock import patch
+from command_registry import registry
+from message_bus import ChatMessage, MessageBus
+
+class FakeAdapter:
+    def __init__(self, platform):
+        self.platform = platform
+        self.replies = []
+
+    async def reply(self, message, text):
+        self.replies.append((message.channel, text))
+
+async def sentences(*pieces):
+    for piece in pieces:
+        yield piece
+
+async def echo_command(text, service):
+    return f"{service.platform}: {text}"
+
+class TestMessageBus(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.bus = MessageBus(concurrency=2, max_pending=10)
+        self.twitch = FakeAdapter("twitch")
+        self.youtube = FakeAdapter("youtube")
+        self.bus.register(self.twitch)
+        self.bus.register(self.youtube)
+        self.bus.start()
+
+    async def asyncTearDown(self):
+        await self.bus.stop()
+
+    async def test_commands_reply_through_their_platform(self):
+        with patch.object(registry, "dispatch", side_effect=echo_command):
+            await self.bus.publish(ChatMessage("twitch", "pilotchannel", "alice", "!metar KJFK"))
+            await self.bus.publish(ChatMessage("youtube", "chat123", "bob", "!taf EGLL"))
+            await self.bus.join()
+
+        self.assertEqual(self.twitch.replies, [("pilotchannel", "twitch: !metar KJFK")])
+        self.assertEqual(self.youtube.replies, [("chat123", "youtube: !taf EGLL")])
+        self.assertEqual(self.bus.stats()["published"], {"twitch": 1, "youtube": 1})
+
+    async def test_mentions_stream_llm_reply(self):
+        with patch("message_bus.stream_response", return_value=sentences("Cleared to land.", "Wind calm.")) as mock_stream:
+            await self.bus.publish(ChatMessage("twitch", "pilotchannel", "alice", "can I land?", mentions_bot=True))
+            await self.bus.join()
+
+        mock_stream.assert_called_once_with("can I land?", "alice", "twitch_pilotchannel")
+        self.assertEqual(self.twitch.replies, [("pilotchannel", "Cleared to land."), ("pilotchannel", "Wind calm.")])
+
+    async def test_plain_chat_is_ignored(self):
+        with patch("message_bus.stream_response") as mock_stream:
+            await self.bus.publish(ChatMessage("youtube", "chat123", "bob", "hello everyone"))
+            await self.bus.join()
+
+        mock_stream.assert_not_called()
+        self.assertEqual(self.youtube.replies, [])
+
+    async def test_command_errors_are_reported(self):
+        with patch.object(registry, "dispatch", side_effect=RuntimeError("boom")):
+            await self.bus.publish(ChatMessage("twitch", "pilotchannel", "alice", "!metar KJFK"))
+            await self.bus.join()
+
+        self.assertEqual(self.twitch.replies, [("pilotchannel", "An error occurred while processing the command.")])
+
+    async def test_unregistered_platform_is_dropped(self):
+        await self.bus.publish(ChatMessage("discord", "42", "carol", "!metar KJFK"))
+        await self.bus.join()
+
+        self.assertEqual(self.bus.stats()["unrouted"], 1)
+        self.assertEqual(self.twitch.replies + self.youtube.replies, [])
+
+    async def test_unregister_keeps_newer_adapter(self):
+        replacement = FakeAdapter("twitch")
+        self.bus.register(replacement)
+        self.bus.unregister(self.twitch)
+
+        with patch.object(registry, "dispatch", return_value="ok"):
+            await self.bus.publish(ChatMessage("twitch", "pilotchannel", "alice", "!help"))
+            await self.bus.join()
+
+        self.assertEqual(replacement.replies, [("pilotchannel", "ok")])
+
+if __name__ == '__main__':
+    unittest.main()
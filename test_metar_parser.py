@@ -0,0 +1,75 @@
+# test_metar_parser.py
+import unittest
+from metar_parser import (CloudLayer, Wind, flight_category, parse_metar, parse_metars, parse_taf,
+                          translate_metar, translate_taf)
+
+class TestParseMetar(unittest.TestCase):
+    def test_decodes_elements(self):
+        metar = parse_metar("METAR EGLL 121650Z AUTO 24008G18KT 200V280 9999 R27L/1200 -SHRA BKN012 OVC030CB 18/M01 Q1021 NOSIG")
+
+        self.assertEqual((metar.station, metar.time), ("EGLL", "121650Z"))
+        self.assertEqual(metar.conditions.wind, Wind(240, 8, 18, "KT", 200, 280))
+        self.assertAlmostEqual(metar.conditions.visibility, 6.21, places=2)
+        self.assertEqual(metar.conditions.weather, ("-SHRA",))
+        self.assertEqual(metar.conditions.clouds, (CloudLayer("BKN", 1200), CloudLayer("OVC", 3000, "CB")))
+        self.assertEqual(metar.conditions.ceiling, 1200)
+        self.assertEqual((metar.temperature, metar.dewpoint), (18, -1))
+        self.assertEqual((metar.altimeter, metar.altimeter_unit), (1021, "hPa"))
+        self.assertEqual(metar.conditions.flight_category, "MVFR")
+
+    def test_fractional_visibility(self):
+        metar = parse_metar("KSFO 121656Z 28015KT 1 1/2SM BR OVC004 14/13 A2992 RMK AO2 SLP132")
+
+        self.assertEqual(metar.conditions.visibility, 1.5)
+        self.assertEqual(metar.altimeter, 29.92)
+        self.assertEqual(metar.conditions.flight_category, "LIFR")
+
+    def test_translation(self):
+        self.assertEqual(
+            translate_metar(parse_metar("KJFK 121651Z 31012KT 10SM FEW250 24/08 A3012")),
+            "Winds 310 at 12kt, Vis 10sm, Few clouds at 25000ft, Temp 24°C, Dew 8°C, Alt 30.12inHg, VFR"
+        )
+        self.assertEqual(
+            translate_metar(parse_metar("KDEN 121653Z 00000KT M1/4SM FZFG VV001 M05/M06 A3001")),
+            "Winds calm, Vis 0.2sm, Freezing fog, Vertical visibility at 100ft, Temp -5°C, Dew -6°C, Alt 30.01inHg, LIFR"
+        )
+
+    def test_batch_decoding(self):
+        raws = ["LFPG 121700Z VRB02KT CAVOK 25/10 Q1015", "not a metar", "", "LFPG  121700Z VRB02KT CAVOK 25/10 Q1015"]
+
+        metars = parse_metars(raws)
+
+        self.assertEqual(metars[0].conditions.flight_category, "VFR")
+        self.assertIsNone(metars[1])
+        self.assertIsNone(metars[2])
+        # Identical reports are decoded once and shared
+        self.assertIs(metars[0], metars[3])
+
+    def test_flight_category_thresholds(self):
+        self.assertEqual(flight_category(10, None), "VFR")
+        self.assertEqual(flight_category(5, None), "MVFR")
+        self.assertEqual(flight_category(10, 3000), "MVFR")
+        self.assertEqual(flight_category(2.5, 5000), "IFR")
+        self.assertEqual(flight_category(10, 900), "IFR")
+        self.assertEqual(flight_category(0.5, None), "LIFR")
+        self.assertIsNone(flight_category(None, None))
+
+class TestParseTaf(unittest.TestCase):
+    def test_change_groups(self):
+        taf = parse_taf(
+            "TAF AMD KJFK 121120Z 1212/1318 31012KT P6SM FEW250 TEMPO 1214/1218 3SM -TSRA BKN030CB "
+            "FM130200 18005KT P6SM SCT040 PROB30 TEMPO 1306/1310 1SM BR OVC005 BECMG 1312/1314 22010KT"
+        )
+
+        self.assertEqual(taf.station, "KJFK")
+        self.assertEqual([period.kind for period in taf.periods], ["BASE", "TEMPO", "FM", "PROB30 TEMPO", "BECMG"])
+        self.assertEqual((taf.periods[2].start, taf.periods[2].end), ("130200", None))
+        self.assertEqual([period.conditions.flight_category for period in taf.periods], ["VFR", "MVFR", "VFR", "IFR", None])
+        self.assertEqual(translate_taf(taf).splitlines()[2], "From 02:00Z on the 13: Winds 180 at 5kt, Vis 6sm, Scattered clouds at 4000ft, VFR")
+        self.assertEqual(translate_taf(taf).splitlines()[4], "BECMG 1312-1314: Winds 220 at 10kt")
+
+    def test_invalid_taf(self):
+        self.assertIsNone(parse_taf("TAF"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# test_rate_limit.py
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from rate_limit import DailyQuota, TokenBucket, ChannelSendScheduler, backoff_delay
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    @patch("rate_limit.time.monotonic")
+    async def test_bucket_allows_burst_then_refills(self, mock_monotonic):
+        mock_monotonic.return_value = 0.0
+        bucket = TokenBucket(rate=2, capacity=3)
+
+        # The full burst is available immediately, then the bucket is empty
+        self.assertTrue(all(bucket.try_acquire() for _ in range(3)))
+        self.assertFalse(bucket.try_acquire())
+
+        # Half a second at two tokens per second refills one token
+        mock_monotonic.return_value = 0.5
+        self.assertTrue(bucket.try_acquire())
+        self.assertFalse(bucket.try_acquire())
+
+    def test_configure_keeps_earned_tokens(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        bucket.configure(rate=2, capacity=2)
+
+        self.assertEqual(bucket.rate, 2)
+        self.assertEqual(bucket.tokens, 2)
+
+    async def test_acquire_waits_for_tokens(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        await bucket.acquire()
+
+        # The second token becomes available after roughly 10ms
+        await bucket.acquire()
+        self.assertLess(bucket.tokens, 1)
+
+class TestChannelSendScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_replies_are_interleaved(self):
+        scheduler = ChannelSendScheduler(rate=1000, capacity=1)
+        sent = []
+
+        async def send(chunk):
+            sent.append(chunk)
+
+        await asyncio.gather(
+            scheduler.send("aviation", ["long 1", "long 2", "long 3"], send),
+            scheduler.send("aviation", ["short 1"], send)
+        )
+
+        # The short reply gets its turn after the first chunk of the long one
+        self.assertEqual(sent, ["long 1", "short 1", "long 2", "long 3"])
+
+    async def test_channels_have_separate_budgets(self):
+        scheduler = ChannelSendScheduler(rate=1, capacity=1)
+
+        self.assertIsNot(scheduler.bucket_for("aviation"), scheduler.bucket_for("weather"))
+        self.assertIs(scheduler.bucket_for("aviation"), scheduler.bucket_for("aviation"))
+
+    async def test_send_errors_reach_the_caller(self):
+        scheduler = ChannelSendScheduler(rate=1000, capacity=5)
+
+        async def send(chunk):
+            raise ConnectionError("disconnected")
+
+        with self.assertRaises(ConnectionError):
+            await scheduler.send("aviation", ["chunk 1", "chunk 2"], send)
+
+class TestBackoffDelay(unittest.TestCase):
+    def test_delay_is_capped(self):
+        for attempt in range(10):
+            delay = backoff_delay(attempt, base=1.0, cap=8.0)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(8.0, 2 ** attempt))
+
+class TestDailyQuota(unittest.TestCase):
+    def test_resets_each_day(self):
+        pacific = ZoneInfo("America/Los_Angeles")
+        quota = DailyQuota(2, timezone=pacific)
+        today = datetime(2024, 7, 1, 23, 0, tzinfo=pacific)
+
+        self.assertTrue(quota.try_consume(today))
+        self.assertTrue(quota.try_consume(today))
+        self.assertFalse(quota.try_consume(today))
+        self.assertEqual(quota.remaining(today), 0)
+        self.assertEqual(quota.remaining(datetime(2024, 7, 2, 0, 30, tzinfo=pacific)), 2)
+
+if __name__ == "__main__":
+    unittest.main()
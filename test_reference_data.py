@@ -0,0 +1,47 @@
+# test_reference_data.py
+import os
+import tempfile
+import unittest
+from reference_data import ReferenceIndex, get_reference_index, normalize_name
+
+class TestReferenceIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = get_reference_index()
+
+    def test_airport_by_iata_or_icao(self):
+        self.assertEqual(self.index.airport("jfk").name, "John F. Kennedy International")
+        self.assertIs(self.index.airport("EGLL"), self.index.airport("LHR"))
+        self.assertIsNone(self.index.airport("TEB"))
+
+    def test_aircraft_by_designator(self):
+        aircraft = self.index.aircraft("a20n")
+        self.assertEqual((aircraft.manufacturer, aircraft.model), ("Airbus", "A320neo"))
+        self.assertIsNone(self.index.aircraft("ZZZZ"))
+
+    def test_airport_name_prefix(self):
+        self.assertEqual([airport.iata for airport in self.index.search_airports("heathrow")], ["LHR"])
+        # Accents and case are ignored, and cities match as well as names
+        self.assertEqual([airport.iata for airport in self.index.search_airports("montreal")], ["YUL"])
+        self.assertEqual({airport.iata for airport in self.index.search_airports("tokyo")}, {"HND", "NRT"})
+
+    def test_airport_fuzzy_match(self):
+        self.assertEqual([airport.iata for airport in self.index.search_airports("Schipohl")], ["AMS"])
+        self.assertEqual(self.index.search_airports("qwertyuiop"), [])
+
+    def test_aircraft_search(self):
+        models = [aircraft.model for aircraft in self.index.search_aircraft("boeing 787")]
+        self.assertEqual(models, ["787-10", "787-8", "787-9"])
+        self.assertEqual(self.index.search_aircraft("b77w")[0].model, "777-300ER")
+
+    def test_missing_file_loads_empty(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertLogs(level="ERROR"):
+                index = ReferenceIndex(os.path.join(directory, "airports.csv"), os.path.join(directory, "aircraft.csv"))
+        self.assertEqual(index.stats()["airports"], 0)
+        self.assertIsNone(index.airport("LHR"))
+
+    def test_normalize_name(self):
+        self.assertEqual(normalize_name("  Montréal-Trudeau  International "), "montreal trudeau international")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# test_response_cache.py
+import unittest
+from unittest.mock import patch
+from response_cache import ResponseCache, normalize_question, key_tokens, classify_topic
+
+class TestNormalization(unittest.TestCase):
+    def test_normalize_question(self):
+        self.assertEqual(normalize_question("Hey bot, what's the weather at EGLL??"), "what is weather at egll")
+        self.assertEqual(normalize_question("what is weather at egll"), "what is weather at egll")
+
+    def test_key_tokens(self):
+        self.assertEqual(key_tokens("What's the weather at EGLL for BA123?"), frozenset({"egll", "ba123"}))
+        self.assertEqual(key_tokens("what plane is this?"), frozenset())
+
+    def test_classify_topic(self):
+        self.assertEqual(classify_topic("what is weather at egll"), "weather")
+        self.assertEqual(classify_topic("is ba123 delayed"), "flights")
+        self.assertEqual(classify_topic("what plane is this"), "general")
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(max_entries=10, similarity=0.8)
+
+    def test_exact_match_after_normalization(self):
+        self.cache.set("What plane is this?", ["It is an Airbus A320."])
+
+        self.assertEqual(self.cache.get("what plane is this"), ("It is an Airbus A320.",))
+        self.assertEqual(self.cache.stats()["exact_hits"], 1)
+
+    def test_near_duplicate_match(self):
+        self.cache.set("What kind of airplane is landing right now?", ["A Boeing 737."])
+
+        self.assertEqual(self.cache.get("what kind of airplane is landng right now"), ("A Boeing 737.",))
+        self.assertEqual(self.cache.stats()["near_hits"], 1)
+
+    def test_different_question_misses(self):
+        self.cache.set("What plane is this?", ["It is an Airbus A320."])
+
+        self.assertIsNone(self.cache.get("How long is the runway?"))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(self.cache.stats()["hit_rate"], 0.0)
+
+    def test_codes_must_match(self):
+        self.cache.set("What's the weather like at the airport in EGLL right now?", ["Light rain."])
+
+        self.assertIsNone(self.cache.get("What's the weather like at the airport in KJFK right now?"))
+        self.assertEqual(self.cache.get("What is the weather like at the airport in EGLL right now"), ("Light rain.",))
+
+    @patch("response_cache.time.monotonic")
+    def test_topic_ttls(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        with patch.multiple("response_cache.Config", RESPONSE_CACHE_TTL=3600, RESPONSE_CACHE_WEATHER_TTL=600):
+            self.cache.set("What's the weather at EGLL?", ["Light rain."])
+            self.cache.set("What plane is this?", ["It is an Airbus A320."])
+
+        # Weather answers expire before general ones
+        mock_monotonic.return_value = 800.0
+        self.assertIsNone(self.cache.get("What's the weather at EGLL?"))
+        self.assertIsNotNone(self.cache.get("What plane is this?"))
+        self.assertEqual(len(self.cache), 1)
+
+    def test_scopes_are_separate(self):
+        self.cache.set("What plane is this?", ["It is an Airbus A320."], "twitch_aviation")
+
+        self.assertIsNone(self.cache.get("What plane is this?", "discord_42"))
+        self.assertIsNone(self.cache.get("what plane is this", "discord_42"))
+        self.assertEqual(self.cache.get("what plane is this", "twitch_aviation"), ("It is an Airbus A320.",))
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2, similarity=0.8)
+        cache.set("first question", ["one"])
+        cache.set("second question", ["two"])
+        cache.get("first question")
+        cache.set("third question", ["three"])
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("second question"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_resize_evicts_least_recently_used(self):
+        for question in ("first question", "second question", "third question"):
+            self.cache.set(question, [question])
+        self.cache.get("first question")
+        self.cache.resize(2)
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("second question"))
+        self.assertIsNotNone(self.cache.get("first question"))
+
+    def test_clear_resets_counters(self):
+        self.cache.set("What plane is this?", ["It is an Airbus A320."])
+        self.cache.get("What plane is this?")
+        self.cache.get("Where is the gate?")
+        self.cache.clear()
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual((stats["exact_hits"], stats["near_hits"], stats["misses"]), (0, 0, 0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+# test_startup.py
+import os
+import sys
+import subprocess
+import unittest
+import main
+
+# Cumulative import time allowed for main.py, in seconds. Wall-clock timings are
+# flaky on loaded CI machines, so the check only runs with RUN_BENCHMARKS=1.
+IMPORT_BUDGET = 1.5
+
+# Libraries that must not load until a platform is started
+HEAVY_MODULES = ("discord", "twitchio", "googleapiclient", "nltk", "pypresence")
+
+def loaded_modules(module_name):
+    """
+    List the modules loaded by importing a module in a fresh interpreter.
+
+    Args:
+        module_name (str): The module to import.
+
+    Returns:
+        set: The names of every module loaded.
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module_name}; print(*sys.modules, sep='\\n')"],
+        capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+def import_time(module_name):
+    """
+    Measure the cumulative import time of a module in a fresh interpreter.
+
+    Args:
+        module_name (str): The module to import.
+
+    Returns:
+        float: The cumulative import time in seconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True, text=True, check=True
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.strip() == module_name:
+            return int(cumulative) / 1_000_000
+    raise AssertionError(f"No import time reported for {module_name}")
+
+class TestStartup(unittest.TestCase):
+    def test_main_import_is_light(self):
+        loaded = loaded_modules("main")
+
+        for module_name in HEAVY_MODULES:
+            self.assertNotIn(module_name, loaded)
+
+    @unittest.skipUnless(os.environ.get("RUN_BENCHMARKS"), "set RUN_BENCHMARKS=1 to check the import time budget")
+    def test_main_import_time_budget(self):
+        self.assertLess(import_time("main"), IMPORT_BUDGET)
+
+    def test_discord_bot_import_has_no_side_effects(self):
+        import discord_bot
+
+        # The bot and Rich Presence are only created by run_discord_bot
+        self.assertIsNone(discord_bot.bot)
+        self.assertIsNone(discord_bot.RPC)
+
+class TestLoadPlatform(unittest.IsolatedAsyncioTestCase):
+    async def test_load_platform_returns_runner(self):
+        runner = await main.load_platform("twitch")
+
+        self.assertEqual(runner.__name__, "run_twitch_bot")
+
+    async def test_load_discord_on_worker_thread(self):
+        # discord.py 1.x binds a Bot to the creating thread's event loop, so none may be built during the import
+        runner = await main.load_platform("discord")
+
+        self.assertEqual(runner.__name__, "run_discord_bot")
+        self.assertIsNone(sys.modules["discord_bot"].bot)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+# test_supervisor.py
+import os
+import asyncio
+import unittest
+from unittest.mock import patch
+from config import Config
+from supervisor import Supervisor
+
+class TestSupervisor(unittest.IsolatedAsyncioTestCase):
+    def make_supervisor(self):
+        return Supervisor(base_delay=0.01, max_delay=0.05, stable_after=60, report_interval=0)
+
+    async def test_restarts_crashed_bot(self):
+        supervisor = self.make_supervisor()
+        attempts = []
+
+        async def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError("quota exceeded")
+
+        supervisor.add("youtube", flaky)
+        await supervisor.run()
+
+        stats = supervisor.stats()["youtube"]
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(stats["restarts"], 2)
+        self.assertEqual(stats["status"], "finished")
+        self.assertEqual(stats["last_error"], "ConnectionError: quota exceeded")
+
+    async def test_failures_are_isolated(self):
+        supervisor = self.make_supervisor()
+        discord_ran = asyncio.Event()
+
+        async def broken():
+            raise RuntimeError("boom")
+
+        async def healthy():
+            discord_ran.set()
+            await asyncio.sleep(3600)
+
+        supervisor.add("youtube", broken)
+        supervisor.add("discord", healthy)
+        task = asyncio.create_task(supervisor.run())
+        await asyncio.wait_for(discord_ran.wait(), 1)
+        await asyncio.sleep(0.1)
+
+        # The crashing bot keeps restarting while the healthy one stays up
+        stats = supervisor.stats()
+        self.assertGreater(stats["youtube"]["restarts"], 0)
+        self.assertEqual(stats["discord"]["status"], "running")
+        self.assertEqual(stats["discord"]["restarts"], 0)
+        self.assertGreater(stats["discord"]["uptime"], 0)
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        self.assertEqual(supervisor.stats()["discord"]["status"], "stopped")
+
+    @patch("supervisor.backoff_delay", return_value=0)
+    async def test_backoff_grows_until_bot_is_stable(self, mock_backoff):
+        supervisor = self.make_supervisor()
+        attempts = []
+
+        async def crash_three_times():
+            attempts.append(1)
+            if len(attempts) <= 3:
+                raise RuntimeError("boom")
+
+        supervisor.add("twitch", crash_three_times)
+        await supervisor.run()
+
+        self.assertEqual([call.args[0] for call in mock_backoff.call_args_list], [0, 1, 2])
+
+    @patch("supervisor.backoff_delay", return_value=0)
+    async def test_explicit_zero_settings_are_kept(self, mock_backoff):
+        supervisor = Supervisor(base_delay=0, max_delay=0, stable_after=0, report_interval=0)
+        attempts = []
+
+        async def crash_three_times():
+            attempts.append(1)
+            if len(attempts) <= 3:
+                raise RuntimeError("boom")
+
+        supervisor.add("twitch", crash_three_times)
+        await supervisor.run()
+
+        # With stable_after=0 every run counts as stable, so the backoff never grows
+        self.assertEqual((supervisor.base_delay, supervisor.max_delay, supervisor.stable_after), (0, 0, 0))
+        self.assertEqual([call.args[0] for call in mock_backoff.call_args_list], [0, 0, 0])
+
+class TestEnabledPlatforms(unittest.TestCase):
+    def restore_config(self, saved):
+        for name in list(vars(Config)):
+            if name not in saved:
+                delattr(Config, name)
+        for name, value in saved.items():
+            if not name.startswith("__"):
+                setattr(Config, name, value)
+
+    def test_enabled_platforms(self):
+        with patch.object(Config, "ENABLED_PLATFORMS", " Discord, youtube "):
+            self.assertEqual(Config.enabled_platforms(), ["discord", "youtube"])
+            self.assertFalse(Config.platform_enabled("twitch"))
+
+    def test_only_enabled_platform_credentials_required(self):
+        shared = ["OPENAI_API_KEY", "GOOGLE_PSE_ID", "GOOGLE_PSE_API_KEY", "AVWX_API_KEY", "ICAO_API_KEY", "RAPIDAPI_KEY",
+                  "OPENWEATHERMAP_API_KEY", "AVIATION_EDGE_API_KEY", "NAVIGRAPH_API_KEY"]
+        environ = {name: "test" for name in shared}
+        environ.update(ENABLED_PLATFORMS="discord", DISCORD_BOT_TOKEN="test")
+        self.addCleanup(self.restore_config, dict(vars(Config)))
+
+        with patch.dict(os.environ, environ, clear=True):
+            Config.load_configuration()
+
+        self.assertIsNone(Config.TWITCH_BOT_TOKEN)
+        self.assertIsNone(Config.YOUTUBE_LIVE_CHAT_ID)
+
+    def test_unknown_platform(self):
+        with patch.object(Config, "ENABLED_PLATFORMS", "discord,myspace"):
+            with self.assertRaises(ValueError):
+                Config.enabled_platforms()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# test_twitch_bot.py
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from twitch_bot import TwitchBot
+
+def twitch_message(content, echo=False):
+    return SimpleNamespace(
+        content=content,
+        echo=echo,
+        channel=SimpleNamespace(name="aviation"),
+        author=SimpleNamespace(name="viewer")
+    )
+
+class TestEventMessage(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.bot = SimpleNamespace(nick="AviationBot", platform=TwitchBot.platform)
+        self.bus = MagicMock()
+        self.bus.publish = AsyncMock()
+        patcher = patch("twitch_bot.get_message_bus", return_value=self.bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def published(self):
+        return [call.args[0] for call in self.bus.publish.call_args_list]
+
+    async def test_plain_chat_is_not_published(self):
+        await TwitchBot.event_message(self.bot, twitch_message("what a landing lol"))
+        await TwitchBot.event_message(self.bot, twitch_message("!metar EGLL", echo=True))
+
+        self.bus.publish.assert_not_called()
+
+    async def test_commands_and_mentions_are_published(self):
+        await TwitchBot.event_message(self.bot, twitch_message("!metar EGLL"))
+        await TwitchBot.event_message(self.bot, twitch_message("AviationBot what plane is this?"))
+
+        command, mention = self.published()
+        self.assertEqual(command.text, "!metar EGLL")
+        self.assertFalse(command.mentions_bot)
+        self.assertEqual(mention.text, "what plane is this?")
+        self.assertTrue(mention.mentions_bot)
+
+if __name__ == '__main__':
+    unittest.main()
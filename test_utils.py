@@ -0,0 +1,24 @@
+# test_utils.py
+import unittest
+from utils import split_message
+
+class TestSplitMessage(unittest.TestCase):
+    def test_short_message_unchanged(self):
+        self.assertEqual(split_message("METAR for KJFK", 200), ["METAR for KJFK"])
+
+    def test_prefers_line_breaks(self):
+        message = "METAR for KJFK:\nKJFK 121651Z 31012KT 10SM FEW250"
+
+        self.assertEqual(split_message(message, 35), ["METAR for KJFK:", "KJFK 121651Z 31012KT 10SM FEW250"])
+
+    def test_splits_between_words(self):
+        chunks = split_message("the quick brown fox jumps over the lazy dog", 15)
+
+        self.assertTrue(all(len(chunk) <= 15 for chunk in chunks))
+        self.assertEqual(" ".join(chunks), "the quick brown fox jumps over the lazy dog")
+
+    def test_long_words_are_cut(self):
+        self.assertEqual(split_message("x" * 25, 10), ["x" * 10, "x" * 10, "x" * 5])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# test_web_search.py
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import web_search
+from chat_commands import AviationCommands
+from command_registry import registry
+from config import Config
+from web_search import SearchResult, format_results, normalize_query
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self.data
+
+RESULTS = [
+    SearchResult("Airbus A320", "https://example.com/a320", "The Airbus A320 is a narrow-body airliner."),
+    SearchResult("Boeing 737", "https://example.com/737", "The Boeing 737 is a narrow-body aircraft produced by Boeing."),
+    SearchResult("Embraer E190", "https://example.com/e190", "The E190 is a regional jet."),
+]
+
+class TestFormatting(unittest.TestCase):
+    def test_normalize_query(self):
+        self.assertEqual(normalize_query("  Airbus   A320\n"), "airbus a320")
+
+    def test_fits_budget(self):
+        for budget in (30, 60, 100, 200):
+            self.assertLessEqual(len(format_results(RESULTS, budget)), budget)
+
+    def test_truncates_last_line_at_word_boundary(self):
+        reply = format_results(RESULTS, 60)
+
+        self.assertEqual(reply, "The Airbus A320 is a narrow-body airliner.\nThe Boeing 737…")
+
+    def test_never_cuts_links(self):
+        for budget in range(1, 200):
+            reply = format_results(RESULTS, budget, include_links=True)
+            if reply == web_search.NO_RESULTS_MESSAGE:
+                continue
+            self.assertLessEqual(len(reply), budget)
+            for line in reply.splitlines():
+                self.assertRegex(line, r" <https://example\.com/\w+>$")
+
+        # The snippet is shortened so the link still fits; a link that cannot fit drops the result
+        self.assertEqual(format_results(RESULTS, 50, include_links=True), "The Airbus A320 is a… <https://example.com/a320>")
+        self.assertEqual(format_results(RESULTS, 26, include_links=True), web_search.NO_RESULTS_MESSAGE)
+
+    def test_includes_all_results_when_they_fit(self):
+        reply = format_results(RESULTS, 2000, include_links=True)
+
+        self.assertEqual(len(reply.splitlines()), 3)
+        self.assertIn("<https://example.com/737>", reply)
+
+    def test_no_results(self):
+        self.assertEqual(format_results(None), web_search.NO_RESULTS_MESSAGE)
+        self.assertEqual(format_results([]), web_search.NO_RESULTS_MESSAGE)
+
+class TestSearch(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        keys = patch.multiple(Config, create=True, GOOGLE_PSE_ID="test", GOOGLE_PSE_API_KEY="test")
+        keys.start()
+        self.addCleanup(keys.stop)
+        web_search.get_search_cache().clear()
+        web_search._quota = None
+
+    @patch("web_search.get_session")
+    async def test_search_parses_and_caches_results(self, mock_get_session):
+        mock_get_session.return_value.get = MagicMock(return_value=FakeResponse({
+            "items": [{"title": "Airbus A320", "link": "https://example.com/a320", "snippet": "A narrow-body airliner."}]
+        }))
+
+        first = await web_search.search("Airbus  A320")
+        second = await web_search.search("airbus a320")
+
+        self.assertEqual(first, [SearchResult("Airbus A320", "https://example.com/a320", "A narrow-body airliner.")])
+        self.assertEqual(second, first)
+        mock_get_session.return_value.get.assert_called_once()
+        self.assertEqual(mock_get_session.return_value.get.call_args.kwargs["params"]["q"], "airbus a320")
+        self.assertEqual(web_search.get_search_quota().used, 1)
+
+    @patch("web_search.get_session")
+    async def test_quota_exhausted(self, mock_get_session):
+        with patch.object(Config, "GOOGLE_PSE_DAILY_QUOTA", 0):
+            self.assertIsNone(await web_search.search("airbus a320"))
+
+        mock_get_session.return_value.get.assert_not_called()
+
+class TestWebSearchCommand(unittest.IsolatedAsyncioTestCase):
+    @patch("web_search.search", new_callable=AsyncMock)
+    async def test_reply_fits_each_platform_budget(self, mock_search):
+        mock_search.return_value = RESULTS * 20
+
+        for platform, budget in web_search.PLATFORM_BUDGETS.items():
+            service = AviationCommands()
+            service.platform = platform
+            reply = await registry.dispatch("!websearch narrow-body airliners", service)
+            self.assertLessEqual(len(reply), budget)
+            self.assertGreater(len(reply), budget // 2)
+
+    @patch("web_search.search", new_callable=AsyncMock)
+    async def test_failed_search(self, mock_search):
+        mock_search.return_value = None
+        service = AviationCommands()
+        service.platform = "twitch"
+
+        self.assertEqual(await registry.dispatch("!websearch a320", service), "Failed to search the web. Please try again later.")
+
+if __name__ == '__main__':
+    unittest.main()
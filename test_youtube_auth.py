@@ -0,0 +1,67 @@
+# test_youtube_auth.py
+import os
+import asyncio
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from youtube_auth import YouTubeCredentialsManager, REFRESH_MARGIN, MIN_REFRESH_DELAY
+
+class TestYouTubeCredentialsManager(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.token_file = os.path.join(self.directory.name, "token.json")
+        self.manager = YouTubeCredentialsManager(token_file=self.token_file)
+        self.manager.credentials = MagicMock()
+        self.manager.credentials.to_json.return_value = '{"token": "first"}'
+
+    def test_save_writes_only_when_changed(self):
+        self.manager.save()
+        first_mtime = os.stat(self.token_file).st_mtime_ns
+
+        # Saving unchanged credentials must not touch the file
+        os.utime(self.token_file, ns=(0, 0))
+        self.manager.save()
+        self.assertEqual(os.stat(self.token_file).st_mtime_ns, 0)
+
+        # Changed credentials replace the file and leave no temporary files behind
+        self.manager.credentials.to_json.return_value = '{"token": "second"}'
+        self.manager.save()
+        with open(self.token_file) as token:
+            self.assertEqual(token.read(), '{"token": "second"}')
+        self.assertEqual(os.listdir(self.directory.name), ["token.json"])
+        self.assertNotEqual(first_mtime, 0)
+
+    def test_seconds_until_refresh(self):
+        now = datetime(2024, 7, 12, 12, 0)
+
+        # Refresh ahead of expiry, but never busy-loop on an already expired token
+        self.manager.credentials.expiry = now + timedelta(hours=1)
+        self.assertEqual(self.manager.seconds_until_refresh(now), 3600 - REFRESH_MARGIN)
+        self.manager.credentials.expiry = now - timedelta(minutes=1)
+        self.assertEqual(self.manager.seconds_until_refresh(now), MIN_REFRESH_DELAY)
+
+    @patch("youtube_auth.Request")
+    def test_access_token_refreshed_when_invalid(self, mock_request):
+        self.manager.credentials.valid = True
+        self.manager.credentials.token = "current"
+        self.assertEqual(asyncio.run(self.manager.get_access_token()), "current")
+        self.manager.credentials.refresh.assert_not_called()
+
+        # An expired or rejected token is refreshed before it is handed out
+        self.manager.credentials.valid = False
+        asyncio.run(self.manager.get_access_token())
+        asyncio.run(self.manager.get_access_token(force_refresh=True))
+        self.assertEqual(self.manager.credentials.refresh.call_count, 2)
+
+    @patch("youtube_auth.build")
+    def test_client_built_once(self, mock_build):
+        first = self.manager.get_client()
+        second = self.manager.get_client()
+
+        self.assertIs(first, second)
+        mock_build.assert_called_once_with('youtube', 'v3', credentials=self.manager.credentials)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,7 @@
 # test_youtube_bot.py
 import unittest
 from unittest.mock import AsyncMock, patch, MagicMock
-from youtube_bot import YouTubeBot
+from youtube_bot import YouTubeBot, YouTubeChatPoller, LiveChatOutbox
 
 class TestIntegration(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
@@ -205,7 +205,184 @@ class TestIntegration(unittest.IsolatedAsyncioTestCase):
         mock_fetch_weather_info.assert_called_once_with("New York")
         mock_send_message.assert_called_once_with("Weather Information for New York")
 
+    @patch("youtube_bot.YouTubeBot.send_message")
+    @patch("youtube_bot.YouTubeBot.fetch_metars")
+    async def test_handle_message_metar_several_stations(self, mock_fetch_metars, mock_send_message):
+        mock_fetch_metars.return_value = "KJFK VFR: ...\nEGLL MVFR: ..."
+
+        await self.bot.handle_message("!metar kjfk, egll KJFK")
+
+        # Duplicate stations are dropped and the rest looked up together
+        mock_fetch_metars.assert_called_once_with(["KJFK", "EGLL"])
+        mock_send_message.assert_called_once_with("KJFK VFR: ...\nEGLL MVFR: ...")
+
+    @patch("youtube_bot.YouTubeBot.send_message")
+    @patch("youtube_bot.YouTubeBot.fetch_metar")
+    async def test_handle_message_invalid_station(self, mock_fetch_metar, mock_send_message):
+        # Simulate a user message with an IATA code instead of an ICAO code
+        await self.bot.handle_message("!metar JFK")
+
+        # Assert the expected behavior
+        mock_fetch_metar.assert_not_called()
+        mock_send_message.assert_called_once_with("Please provide a valid 4-letter ICAO station code.")
+
+    @patch("youtube_bot.YouTubeBot.send_message")
+    async def test_handle_message_ignores_plain_chat(self, mock_send_message):
+        # Ordinary chat messages are not commands and get no reply
+        await self.bot.handle_message("great stream today")
+
+        mock_send_message.assert_not_called()
+
+    @patch("youtube_bot.YouTubeBot.send_message")
+    async def test_handle_message_help(self, mock_send_message):
+        await self.bot.handle_message("!help")
+
+        response = mock_send_message.call_args.args[0]
+        self.assertIn("!search <query> - Search for YouTube videos\n", response)
+        self.assertIn("!weather <location> - Get weather information for a specific location\n", response)
+
     # Add more test methods for other commands and scenarios
 
+def chat_item(message_id, author, text, channel_id="UC_VIEWER", owner=False):
+    return {
+        "id": message_id,
+        "authorDetails": {"displayName": author, "channelId": channel_id, "isChatOwner": owner},
+        "snippet": {"displayMessage": text}
+    }
+
+class TestYouTubeChatPoller(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.youtube = MagicMock()
+        self.list_request = self.youtube.liveChatMessages.return_value.list
+        self.poller = YouTubeChatPoller("YOUR_YOUTUBE_LIVE_CHAT_ID", youtube=self.youtube, skip_backlog=False, bot_channel_id="UC_BOT")
+
+    async def test_poll_persists_page_token_and_interval(self):
+        # Setup mock return values for two consecutive polls
+        self.list_request.return_value.execute.side_effect = [
+            {"items": [chat_item("1", "alice", "!metar KJFK")], "nextPageToken": "PAGE_2", "pollingIntervalMillis": 3000},
+            {"items": [], "nextPageToken": "PAGE_3", "pollingIntervalMillis": 8000},
+        ]
+
+        await self.poller.poll()
+        await self.poller.poll()
+
+        # The second poll should resume from the token returned by the first
+        self.assertIsNone(self.list_request.call_args_list[0].kwargs["pageToken"])
+        self.assertEqual(self.list_request.call_args_list[1].kwargs["pageToken"], "PAGE_2")
+        self.assertEqual(self.poller.next_page_token, "PAGE_3")
+        self.assertEqual(self.poller.polling_interval, 8)
+
+    async def test_poll_deduplicates_messages(self):
+        self.list_request.return_value.execute.side_effect = [
+            {"items": [chat_item("1", "alice", "!metar KJFK")], "nextPageToken": "PAGE_2"},
+            {"items": [chat_item("1", "alice", "!metar KJFK"), chat_item("2", "bob", "!taf EGLL")], "nextPageToken": "PAGE_3"},
+        ]
+
+        first = await self.poller.poll()
+        second = await self.poller.poll()
+
+        self.assertEqual(first, [{"id": "1", "author": "alice", "message": "!metar KJFK"}])
+        self.assertEqual(second, [{"id": "2", "author": "bob", "message": "!taf EGLL"}])
+
+    async def test_own_messages_are_skipped(self):
+        self.list_request.return_value.execute.return_value = {"items": [
+            chat_item("1", "AviationBot", "!help - List the available commands", channel_id="UC_BOT"),
+            chat_item("2", "Streamer", "!chart KJFK ILS 4R", owner=True),
+            chat_item("3", "alice", "!help"),
+        ]}
+
+        # Only the viewer's message reaches the bot, so it never answers its own replies
+        self.assertEqual(await self.poller.poll(), [{"id": "3", "author": "alice", "message": "!help"}])
+
+    async def test_bot_channel_looked_up_once(self):
+        poller = YouTubeChatPoller("YOUR_YOUTUBE_LIVE_CHAT_ID", youtube=self.youtube, skip_backlog=False)
+        self.youtube.channels.return_value.list.return_value.execute.return_value = {"items": [{"id": "UC_BOT"}]}
+        self.list_request.return_value.execute.return_value = {"items": [chat_item("1", "AviationBot", "!help", channel_id="UC_BOT")]}
+
+        self.assertEqual(await poller.poll(), [])
+        await poller.poll()
+        self.youtube.channels.return_value.list.assert_called_once_with(part="id", mine=True)
+
+    async def test_first_poll_skips_backlog(self):
+        poller = YouTubeChatPoller("YOUR_YOUTUBE_LIVE_CHAT_ID", youtube=self.youtube)
+        self.list_request.return_value.execute.side_effect = [
+            {"items": [chat_item("1", "alice", "old message")], "nextPageToken": "PAGE_2"},
+            {"items": [chat_item("1", "alice", "old message"), chat_item("2", "bob", "!taf EGLL")], "nextPageToken": "PAGE_3"},
+        ]
+
+        # Messages from before startup are never yielded
+        self.assertEqual(await poller.poll(), [])
+        self.assertEqual(await poller.poll(), [{"id": "2", "author": "bob", "message": "!taf EGLL"}])
+
+class TestLiveChatOutbox(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.outbox = LiveChatOutbox("YOUR_YOUTUBE_LIVE_CHAT_ID", "YOUR_YOUTUBE_ACCESS_TOKEN", max_length=25, rate=1000, burst=10, max_retries=2)
+
+    async def asyncTearDown(self):
+        await self.outbox.close()
+
+    @patch("youtube_bot.LiveChatOutbox._post", new_callable=AsyncMock)
+    async def test_long_messages_are_split(self, mock_post):
+        mock_post.return_value = (200, None)
+
+        await self.outbox.send("Winds calm. Visibility ten miles.")
+        await self.outbox.join()
+
+        # Each chunk should fit the chat limit and break at a sentence end
+        self.assertEqual([call.args[0] for call in mock_post.call_args_list], ["Winds calm.", "Visibility ten miles."])
+        self.assertEqual(self.outbox.stats()["sent"], 2)
+
+    @patch("youtube_bot.LiveChatOutbox._post", new_callable=AsyncMock)
+    async def test_chunks_never_start_with_command_prefix(self, mock_post):
+        mock_post.return_value = (200, None)
+
+        await self.outbox.send("Commands:\n!help - List commands\n!metar <station>")
+        await self.outbox.join()
+
+        chunks = [call.args[0] for call in mock_post.call_args_list]
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(all(not chunk.startswith("!") and len(chunk) <= 25 for chunk in chunks))
+        self.assertEqual(chunks[1], "› !help - List commands")
+
+    @patch("youtube_bot.asyncio.sleep", new_callable=AsyncMock)
+    @patch("youtube_bot.LiveChatOutbox._post", new_callable=AsyncMock)
+    async def test_rate_limited_sends_are_retried(self, mock_post, mock_sleep):
+        mock_post.side_effect = [(429, "2"), (503, None), (200, None)]
+
+        await self.outbox.send("!metar KJFK")
+        await self.outbox.join()
+
+        # The Retry-After header is honoured, then the send succeeds on the third attempt
+        self.assertEqual(mock_post.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[0].args[0], 2.0)
+        self.assertEqual(self.outbox.stats()["retries"], 2)
+        self.assertEqual(self.outbox.stats()["sent"], 1)
+
+    @patch("youtube_bot.LiveChatOutbox._post", new_callable=AsyncMock)
+    async def test_client_errors_are_not_retried(self, mock_post):
+        mock_post.return_value = (403, None)
+
+        await self.outbox.send("!metar KJFK")
+        await self.outbox.join()
+
+        mock_post.assert_called_once()
+        self.assertEqual(self.outbox.stats()["failed"], 1)
+
+    @patch("youtube_bot.asyncio.sleep", new_callable=AsyncMock)
+    @patch("youtube_bot.LiveChatOutbox._post", new_callable=AsyncMock)
+    async def test_sends_use_refreshed_token(self, mock_post, mock_sleep):
+        manager = MagicMock()
+        manager.get_access_token = AsyncMock(side_effect=["EXPIRED_TOKEN", "FRESH_TOKEN"])
+        self.outbox.credentials_manager = manager
+        mock_post.side_effect = [(401, None), (200, None)]
+
+        await self.outbox.send("!metar KJFK")
+        await self.outbox.join()
+
+        # The static token is never used, and a 401 refreshes the token before the retry
+        self.assertEqual([call.args[1] for call in mock_post.call_args_list], ["EXPIRED_TOKEN", "FRESH_TOKEN"])
+        self.assertEqual([call.kwargs["force_refresh"] for call in manager.get_access_token.call_args_list], [False, True])
+        self.assertEqual(self.outbox.stats()["sent"], 1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,211 @@
+# web_search.py
+import re
+import asyncio
+import logging
+from dataclasses import dataclass
+from zoneinfo import ZoneInfo
+import aiohttp
+from cache import TTLCache, SingleFlight
+from config import Config
+from http_client import get_session
+from rate_limit import DailyQuota
+
+GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+
+# The Custom Search JSON API quota resets at midnight Pacific time
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+# Character budgets for search replies on each platform
+PLATFORM_BUDGETS = {
+    "youtube": 200,
+    "twitch": 500,
+    "discord": 2000,
+}
+DEFAULT_BUDGET = 500
+
+NO_RESULTS_MESSAGE = "I'm sorry, I couldn't find any results."
+ELLIPSIS = "…"
+WHITESPACE = re.compile(r"\s+")
+
+# Shared search state, created on first use
+_search_cache = None
+_quota = None
+
+# Concurrent identical searches share a single request
+_in_flight = SingleFlight()
+
+@dataclass
+class SearchResult:
+    """
+    A single web search hit.
+    """
+    title: str
+    link: str
+    snippet: str
+
+def normalize_query(query):
+    """
+    Canonicalize a search query so equivalent queries share a cache entry.
+
+    Args:
+        query (str): The search query.
+
+    Returns:
+        str: The lower-cased query with whitespace collapsed.
+    """
+    return WHITESPACE.sub(" ", query).strip().lower()
+
+def get_search_cache():
+    """
+    Get the cache of search results, creating it on first use.
+
+    Returns:
+        TTLCache: The shared search cache.
+    """
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = TTLCache(Config.SEARCH_CACHE_MAX_BYTES, name="search")
+        Config.add_reload_listener(lambda changed: _search_cache.resize(Config.SEARCH_CACHE_MAX_BYTES))
+    return _search_cache
+
+def get_search_quota():
+    """
+    Get the daily quota tracker for the search API, creating it on first use.
+
+    Returns:
+        DailyQuota: The shared quota tracker.
+    """
+    global _quota
+    if _quota is None:
+        _quota = DailyQuota(Config.GOOGLE_PSE_DAILY_QUOTA, timezone=QUOTA_TIMEZONE)
+        Config.add_reload_listener(_apply_quota)
+    return _quota
+
+def _apply_quota(changed):
+    if _quota is not None:
+        _quota.limit = Config.GOOGLE_PSE_DAILY_QUOTA
+
+async def _request_search(query):
+    """
+    Request search results from the Google Custom Search API.
+
+    Args:
+        query (str): The normalized search query.
+
+    Returns:
+        list: The search results, or None if an error occurred or the daily quota is used up.
+    """
+    quota = get_search_quota()
+    if not quota.try_consume():
+        logging.warning(f"Daily search quota of {quota.limit} requests used up; not searching for {query!r}")
+        return None
+    params = {
+        "q": query,
+        "cx": Config.GOOGLE_PSE_ID,
+        "key": Config.GOOGLE_PSE_API_KEY,
+        "num": Config.SEARCH_RESULTS,
+        "fields": "items(title,link,snippet)",
+    }
+    try:
+        async with get_session().get(GOOGLE_SEARCH_URL, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logging.error(f"Web search for {query!r} failed: {e}")
+        return None
+    return [
+        SearchResult(item.get("title", ""), item.get("link", ""), item.get("snippet", ""))
+        for item in data.get("items", [])
+    ]
+
+async def search(query):
+    """
+    Search the web, serving repeated queries from the cache.
+
+    Args:
+        query (str): The search query.
+
+    Returns:
+        list: The search results (possibly empty), or None if the search failed.
+    """
+    key = normalize_query(query)
+    if not key:
+        return []
+    cache = get_search_cache()
+    results = cache.get(key)
+    if results is None:
+        results = await _in_flight.do(("search", key), lambda: _request_search(key))
+        if results is not None:
+            cache.set(key, results, Config.SEARCH_CACHE_TTL)
+    return results
+
+def budget_for(platform):
+    """
+    Look up the character budget for search replies on a platform.
+
+    Args:
+        platform (str): The platform name, e.g. "youtube".
+
+    Returns:
+        int: The maximum reply length in characters.
+    """
+    return PLATFORM_BUDGETS.get(platform, DEFAULT_BUDGET)
+
+def _truncate(text, limit):
+    if len(text) <= limit:
+        return text
+    if limit <= len(ELLIPSIS):
+        return ""
+    cut = text.rfind(" ", 0, limit - len(ELLIPSIS) + 1)
+    if cut <= 0:
+        cut = limit - len(ELLIPSIS)
+    return text[:cut].rstrip() + ELLIPSIS
+
+def iter_result_lines(results, budget, include_links=False):
+    """
+    Yield one line per search result until the character budget is spent.
+
+    Lines are produced lazily, so callers can stop early; the last line that
+    fits is shortened at a word boundary rather than dropped. Links are never
+    cut: a result whose link does not fit in full is dropped instead.
+
+    Args:
+        results (list): The search results.
+        budget (int): The maximum total characters, counting the newlines between lines.
+        include_links (bool): Append each result's link (default: False).
+
+    Yields:
+        str: Each formatted result line.
+    """
+    remaining = budget
+    for result in results:
+        text = WHITESPACE.sub(" ", result.snippet or result.title).strip()
+        link = f" <{result.link}>" if include_links and result.link else ""
+        line = f"{text}{link}"
+        if not text:
+            continue
+        if remaining < budget:
+            remaining -= 1  # the newline separating it from the previous line
+        if len(line) > remaining:
+            text = _truncate(text, remaining - len(link))
+            if text:
+                yield f"{text}{link}"
+            return
+        remaining -= len(line)
+        yield line
+
+def format_results(results, budget=DEFAULT_BUDGET, include_links=False):
+    """
+    Format search results as a reply that fits a character budget.
+
+    Args:
+        results (list): The search results, or None if the search failed.
+        budget (int): The maximum reply length in characters (default: DEFAULT_BUDGET).
+        include_links (bool): Append each result's link (default: False).
+
+    Returns:
+        str: The formatted results, or a default message if there are none.
+    """
+    if not results:
+        return NO_RESULTS_MESSAGE
+    return "\n".join(iter_result_lines(results, budget, include_links)) or NO_RESULTS_MESSAGE
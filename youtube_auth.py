@@ -0,0 +1,167 @@
+# youtube_auth.py
+import os
+import logging
+import asyncio
+import tempfile
+from datetime import datetime
+from googleapiclient.discovery import build
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+YOUTUBE_SCOPES = ['https://www.googleapis.com/auth/youtube.force-ssl']
+
+# Refresh this long before the access token expires; re-check this often when the expiry is unknown
+REFRESH_MARGIN = 300
+DEFAULT_CHECK_INTERVAL = 1800
+MIN_REFRESH_DELAY = 30
+
+class YouTubeCredentialsManager:
+    """
+    Loads the YouTube OAuth credentials once and keeps them fresh in the background.
+
+    The token file is only rewritten (atomically) when the credentials change,
+    and a single API client is built and shared by every caller.
+    """
+
+    def __init__(self, token_file='token.json', client_secrets_file='client_secret.json', scopes=YOUTUBE_SCOPES):
+        """
+        Initialize the YouTubeCredentialsManager instance.
+
+        Args:
+            token_file (str): The path of the cached OAuth token (default: "token.json").
+            client_secrets_file (str): The path of the OAuth client secrets (default: "client_secret.json").
+            scopes (list): The OAuth scopes to request (default: YOUTUBE_SCOPES).
+        """
+        self.token_file = token_file
+        self.client_secrets_file = client_secrets_file
+        self.scopes = scopes
+        self.credentials = None
+        self._client = None
+        self._saved_token = None
+        self._refresh_task = None
+
+    def load(self):
+        """
+        Load the credentials from the token file, refreshing or re-authorizing them if needed (blocking).
+
+        Returns:
+            google.oauth2.credentials.Credentials: The YouTube API credentials.
+        """
+        creds = None
+        if os.path.exists(self.token_file):
+            creds = Credentials.from_authorized_user_file(self.token_file, self.scopes)
+            with open(self.token_file) as token:
+                self._saved_token = token.read()
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                flow = InstalledAppFlow.from_client_secrets_file(self.client_secrets_file, self.scopes)
+                creds = flow.run_local_server(port=0)
+        self.credentials = creds
+        self.save()
+        return creds
+
+    def save(self):
+        """
+        Write the credentials to the token file if they changed since the last write.
+
+        The file is replaced atomically so a crash never leaves a truncated token behind.
+        """
+        token_json = self.credentials.to_json()
+        if token_json == self._saved_token:
+            return
+        directory = os.path.dirname(os.path.abspath(self.token_file))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.token-', suffix='.json')
+        try:
+            with os.fdopen(fd, 'w') as token:
+                token.write(token_json)
+            os.replace(temp_path, self.token_file)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+        self._saved_token = token_json
+        logging.info(f"Saved refreshed YouTube credentials to {self.token_file}")
+
+    def refresh(self):
+        """
+        Refresh the access token and persist it (blocking).
+        """
+        self.credentials.refresh(Request())
+        self.save()
+        logging.info("YouTube access token refreshed")
+
+    async def get_access_token(self, force_refresh=False):
+        """
+        Get a current access token, loading or refreshing the credentials if needed.
+
+        Args:
+            force_refresh (bool): Refresh the token even if it looks valid, e.g. after YouTube rejected it (default: False).
+
+        Returns:
+            str: The OAuth bearer token.
+        """
+        if self.credentials is None:
+            await asyncio.to_thread(self.load)
+        elif (force_refresh or not self.credentials.valid) and self.credentials.refresh_token:
+            await asyncio.to_thread(self.refresh)
+        return self.credentials.token
+
+    def seconds_until_refresh(self, now=None):
+        """
+        Work out how long to wait before refreshing the access token.
+
+        Args:
+            now (datetime): The current naive UTC time (default: the system clock).
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        expiry = self.credentials.expiry
+        if expiry is None:
+            return DEFAULT_CHECK_INTERVAL
+        now = now or datetime.utcnow()
+        return max((expiry - now).total_seconds() - REFRESH_MARGIN, MIN_REFRESH_DELAY)
+
+    def get_client(self):
+        """
+        Get the shared YouTube API client, building it on first use.
+
+        Returns:
+            googleapiclient.discovery.Resource: The YouTube Data API v3 client.
+        """
+        if self._client is None:
+            if self.credentials is None:
+                self.load()
+            self._client = build('youtube', 'v3', credentials=self.credentials)
+        return self._client
+
+    async def start(self):
+        """
+        Load the credentials and start refreshing them in the background.
+        """
+        if self.credentials is None:
+            await asyncio.to_thread(self.load)
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """
+        Stop the background refresh task.
+        """
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            await asyncio.gather(self._refresh_task, return_exceptions=True)
+            self._refresh_task = None
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.seconds_until_refresh())
+            if not self.credentials.refresh_token:
+                logging.warning("YouTube credentials have no refresh token; background refresh stopped")
+                return
+            try:
+                await asyncio.to_thread(self.refresh)
+            except Exception as e:
+                logging.error(f"Error refreshing YouTube credentials: {e}")
@@ -1,36 +1,46 @@
-```python
 # youtube_bot.py
-import os
+import time
 import logging
 import asyncio
-import requests
+from collections import OrderedDict
+import aiohttp
+from chat_commands import AviationCommands
+from command_registry import registry
 from config import Config
-from utils import make_api_request, get_continuous_chunks, perform_web_search, format_search_results
-from googleapiclient.discovery import build
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
+from http_client import get_session
+from message_bus import ChatMessage, get_message_bus
+from rate_limit import TokenBucket, backoff_delay
+from utils import split_message, make_api_request
+from youtube_auth import YouTubeCredentialsManager
 
-# Set up detailed logging
-logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)-8s %(name)-12s %(message)s')
+# YouTube asks clients to wait pollingIntervalMillis between polls; these bound our own pacing
+DEFAULT_POLLING_INTERVAL = 5
+MIN_POLLING_INTERVAL = 1
 
-class YouTubeBot:
+# Put before outgoing chunks that start with the command prefix, so the bot never reads its own replies as commands
+COMMAND_ESCAPE = "› "
+
+class YouTubeBot(AviationCommands):
     """
     A YouTube bot that interacts with the YouTube API to perform various tasks.
     """
 
-    def __init__(self, api_key, access_token, live_chat_id):
+    platform = "youtube"
+
+    def __init__(self, api_key, access_token, live_chat_id, credentials_manager=None):
         """
         Initialize the YouTubeBot instance.
 
         Args:
             api_key (str): The YouTube API key.
-            access_token (str): The YouTube access token.
+            access_token (str): The YouTube access token, used when there is no credentials manager.
             live_chat_id (str): The ID of the YouTube live chat.
+            credentials_manager (YouTubeCredentialsManager): The source of refreshed access tokens for sending (default: None).
         """
         self.api_key = api_key
         self.access_token = access_token
         self.live_chat_id = live_chat_id
+        self.outbox = LiveChatOutbox(live_chat_id, access_token, credentials_manager=credentials_manager)
 
     async def search_videos(self, query):
         """
@@ -134,192 +144,241 @@ class YouTubeBot:
             logging.error(f"Error retrieving channel information: {e}")
             return None
 
-    async def fetch_metar(self, station_code):
+    async def send_message(self, message):
         """
-        Fetch METAR data for a given station code.
+        Queue a message for the YouTube live chat.
 
         Args:
-            station_code (str): The ICAO station code.
-
-        Returns:
-            str: The METAR data and translation, or an error message if an error occurred.
+            message (str): The message to send.
         """
-        url = f"https://avwx.rest/api/metar/{station_code}?options=info,translate"
-        headers = {"Authorization": f"BEARER {Config.AVWX_API_KEY}"}
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            metar = data['raw']
-            translation = data['translate']['summary']
-            return f"METAR for {station_code}:\n{metar}\n\nTranslation: {translation}"
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching METAR data: {e}")
-            return "Failed to fetch METAR data. Please try again later."
+        await self.outbox.send(message)
 
-    async def fetch_taf(self, station_code):
+    async def handle_message(self, message):
         """
-        Fetch TAF data for a given station code.
+        Handle incoming messages from the YouTube live chat.
 
         Args:
-            station_code (str): The ICAO station code.
-
-        Returns:
-            str: The TAF data and translation, or an error message if an error occurred.
+            message (str): The message received from the live chat.
         """
-        url = f"https://avwx.rest/api/taf/{station_code}?options=translate"
-        headers = {"Authorization": f"BEARER {Config.AVWX_API_KEY}"}
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            taf = data['raw']
-            translation = data['translate']['summary']
-            return f"TAF for {station_code}:\n{taf}\n\nTranslation: {translation}"
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching TAF data: {e}")
-            return "Failed to fetch TAF data. Please try again later."
+        response = await registry.dispatch(message, self)
+        if response:
+            await self.send_message(response)
 
-    async def fetch_notam(self, station_code):
+    async def reply(self, message, text):
         """
-        Fetch NOTAM data for a given station code.
+        Send a reply from the message bus to the live chat.
 
         Args:
-            station_code (str): The ICAO station code.
-
-        Returns:
-            str: The NOTAM data, or an error message if an error occurred.
+            message (message_bus.ChatMessage): The message being answered.
+            text (str): The reply text.
         """
-        url = f"https://applications.icao.int/dataservices/api/notams-realtime-list?api_key={Config.ICAO_API_KEY}&format=json&criticality=1&locations={station_code}"
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            notams = data['notams']
-            if notams:
-                notam_text = "\n".join(notam['all'] for notam in notams)
-                return f"NOTAMs for {station_code}:\n{notam_text}"
-            else:
-                return f"No NOTAMs found for {station_code}."
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching NOTAM data: {e}")
-            return "Failed to fetch NOTAM data. Please try again later."
+        await self.send_message(text)
+
+@registry.command("search", usage="!search <query>", description="Search for YouTube videos",
+                  pattern=r".+", error="Please provide a search query.", platforms=["youtube"])
+async def search_command(youtube_bot, query):
+    videos = await youtube_bot.search_videos(query)
+    if not videos:
+        return "No YouTube videos found for the given query."
+    response = "Here are the top YouTube video results:\n\n"
+    for video in videos:
+        response += f"Title: {video['title']}\n"
+        response += f"Description: {video['description']}\n"
+        response += f"URL: {video['url']}\n\n"
+    return response
+
+@registry.command("videoinfo", usage="!videoinfo <video_id>", description="Get information about a specific video",
+                  pattern=r"\S+", error="Please provide a video ID.", platforms=["youtube"], aliases=["video"])
+async def videoinfo_command(youtube_bot, video_id):
+    video_info = await youtube_bot.get_video_info(video_id)
+    if not video_info:
+        return "No video information found for the given video ID."
+    response = f"Video Information:\n\n"
+    response += f"Title: {video_info['title']}\n"
+    response += f"Description: {video_info['description']}\n"
+    response += f"Views: {video_info['views']}\n"
+    response += f"Likes: {video_info['likes']}\n"
+    response += f"Comments: {video_info['comments']}\n"
+    return response
+
+@registry.command("channelinfo", usage="!channelinfo <channel_id>", description="Get information about a specific channel",
+                  pattern=r"\S+", error="Please provide a channel ID.", platforms=["youtube"], aliases=["channel"])
+async def channelinfo_command(youtube_bot, channel_id):
+    channel_info = await youtube_bot.get_channel_info(channel_id)
+    if not channel_info:
+        return "No channel information found for the given channel ID."
+    response = f"Channel Information:\n\n"
+    response += f"Name: {channel_info['name']}\n"
+    response += f"Description: {channel_info['description']}\n"
+    response += f"Subscribers: {channel_info['subscribers']}\n"
+    response += f"Views: {channel_info['views']}\n"
+    response += f"Videos: {channel_info['videos']}\n"
+    return response
+
+class LiveChatOutbox:
+    """
+    An outbound message queue for one YouTube live chat.
+
+    Long replies are split to fit the chat message limit, sends are paced by a
+    token bucket, and 429/5xx responses are retried with jittered backoff. A
+    chunk starting with the command prefix, such as a line of the !help reply,
+    is escaped so it cannot be read back as a command. With
+    a credentials manager, every send uses its current access token, and a 401
+    response refreshes the token before the retry.
+    """
 
-    async def fetch_aircraft_info(self, aircraft_type):
+    def __init__(self, live_chat_id, access_token, max_length=None, rate=None, burst=None, max_retries=None,
+                 credentials_manager=None):
         """
-        Fetch information about a specific aircraft type.
+        Initialize the LiveChatOutbox instance.
 
         Args:
-            aircraft_type (str): The aircraft type (ICAO code).
+            live_chat_id (str): The ID of the YouTube live chat.
+            access_token (str): The YouTube access token, used when there is no credentials manager.
+            max_length (int): The maximum characters per chat message (default: Config.YOUTUBE_MESSAGE_MAX_LENGTH).
+            rate (float): The sustained number of messages sent per second (default: Config.YOUTUBE_SEND_RATE).
+            burst (int): The number of messages that may be sent back to back (default: Config.YOUTUBE_SEND_BURST).
+            max_retries (int): The number of retries for a failed send (default: Config.YOUTUBE_SEND_MAX_RETRIES).
+            credentials_manager (YouTubeCredentialsManager): The source of refreshed access tokens (default: None).
+        """
+        self.live_chat_id = live_chat_id
+        self.access_token = access_token
+        self.credentials_manager = credentials_manager
+        self.max_length = max_length or Config.YOUTUBE_MESSAGE_MAX_LENGTH
+        self.max_retries = Config.YOUTUBE_SEND_MAX_RETRIES if max_retries is None else max_retries
+        self.bucket = TokenBucket(rate or Config.YOUTUBE_SEND_RATE, burst or Config.YOUTUBE_SEND_BURST)
+        self.queue = asyncio.Queue()
+        self._worker = None
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    async def send(self, message):
+        """
+        Queue a message for delivery, splitting it if it exceeds the chat message limit.
 
-        Returns:
-            str: The aircraft information, or an error message if an error occurred.
+        Args:
+            message (str): The message to send.
         """
-        url = f"https://aerodatabox.p.rapidapi.com/aircrafts/icao/{aircraft_type}"
-        headers = {
-            "X-RapidAPI-Host": "aerodatabox.p.rapidapi.com",
-            "X-RapidAPI-Key": Config.RAPIDAPI_KEY
-        }
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            manufacturer = data['manufacturer']
-            model = data['model']
-            return f"Aircraft Information for {aircraft_type}:\nManufacturer: {manufacturer}\nModel: {model}"
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching aircraft information: {e}")
-            return "Failed to fetch aircraft information. Please try again later."
+        for chunk in split_message(message, self.max_length - len(COMMAND_ESCAPE)):
+            if chunk.startswith(registry.prefix):
+                chunk = COMMAND_ESCAPE + chunk
+            self.queue.put_nowait((time.monotonic(), chunk))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def join(self):
+        """
+        Wait until every queued message has been sent or has failed.
+        """
+        await self.queue.join()
 
-    async def fetch_airport_info(self, airport_code):
+    async def close(self):
         """
-        Fetch information about a specific airport.
+        Stop the delivery task, dropping any messages still queued.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
 
-        Args:
-            airport_code (str): The IATA airport code.
+    def stats(self):
+        """
+        Report delivery metrics.
 
         Returns:
-            str: The airport information, or an error message if an error occurred.
+            dict: The queued, sent, failed and retried counts, and average and maximum send latency in seconds.
         """
-        url = f"https://aerodatabox.p.rapidapi.com/airports/iata/{airport_code}"
-        headers = {
-            "X-RapidAPI-Host": "aerodatabox.p.rapidapi.com",
-            "X-RapidAPI-Key": Config.RAPIDAPI_KEY
+        return {
+            "queued": self.queue.qsize(),
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "avg_latency": self.total_latency / self.sent if self.sent else 0.0,
+            "max_latency": self.max_latency
         }
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            name = data['name']
-            location = f"{data['location']['city']}, {data['location']['country']}"
-            return f"Airport Information for {airport_code}:\nName: {name}\nLocation: {location}"
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching airport information: {e}")
-            return "Failed to fetch airport information. Please try again later."
 
-    async def fetch_chart_info(self, chart_name):
+    async def _run(self):
+        while True:
+            enqueued_at, text = await self.queue.get()
+            try:
+                await self.bucket.acquire()
+                if await self._deliver(text):
+                    latency = time.monotonic() - enqueued_at
+                    self.sent += 1
+                    self.total_latency += latency
+                    self.max_latency = max(self.max_latency, latency)
+                    logging.info(f"Message sent to YouTube chat in {latency:.2f}s: {text}")
+                else:
+                    self.failed += 1
+            finally:
+                self.queue.task_done()
+
+    async def _deliver(self, text):
         """
-        Fetch information about a specific chart.
+        Send one chat message, retrying rate-limit and server errors.
 
         Args:
-            chart_name (str): The name of the chart.
+            text (str): The message text.
 
         Returns:
-            str: The chart information, or an error message if an error occurred.
+            bool: True if the message was accepted by YouTube.
         """
-        url = f"https://api.navigraph.com/v1/charts/{chart_name}"
-        headers = {
-            "Authorization": f"Bearer {Config.NAVIGRAPH_API_KEY}",
-            "Accept": "application/json"
-        }
-        try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
-            chart_info = f"Chart Information for {chart_name}:\n"
-            chart_info += f"Name: {data['name']}\n"
-            chart_info += f"ICAO Code: {data['icaoCode']}\n"
-            chart_info += f"Chart Type: {data['chartType']}\n"
-            chart_info += f"Published Date: {data['publicationDate']}\n"
-            return chart_info
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching chart information: {e}")
-            return "Failed to fetch chart information. Please try again later."
-
-    async def fetch_weather_info(self, location):
-        """
-        Fetch weather information for a specific location.
+        refresh = False
+        for attempt in range(self.max_retries + 1):
+            try:
+                access_token = await self._access_token(refresh)
+            except Exception as e:
+                logging.error(f"Error getting a YouTube access token: {e}")
+                return False
+            try:
+                status, retry_after = await self._post(text, access_token)
+                if status < 400:
+                    return True
+                error = f"HTTP {status}"
+                # A rejected token is refreshed before the next attempt
+                refresh = status == 401 and self.credentials_manager is not None
+                retryable = status == 429 or status >= 500 or refresh
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error, retry_after, retryable = e, None, True
+            if not retryable or attempt == self.max_retries:
+                logging.error(f"Error sending message to YouTube chat: {error}")
+                return False
+            self.retries += 1
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff_delay(attempt)
+            logging.warning(f"YouTube chat send failed ({error}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+    async def _access_token(self, refresh=False):
+        """
+        Get the bearer token for the next send.
 
         Args:
-            location (str): The location (city name).
+            refresh (bool): Refresh the token first because YouTube rejected it (default: False).
 
         Returns:
-            str: The weather information, or an error message if an error occurred.
+            str: The credentials manager's current token, or the static token if there is no manager.
         """
-        url = f"https://api.openweathermap.org/data/2.5/weather?q={location}&appid={Config.OPENWEATHERMAP_API_KEY}&units=metric"
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-            data = response.json()
-            description = data['weather'][0]['description']
-            temperature = data['main']['temp']
-            humidity = data['main']['humidity']
-            wind_speed = data['wind']['speed']
-            return f"Weather Information for {location}:\nDescription: {description}\nTemperature: {temperature}°C\nHumidity: {humidity}%\nWind Speed: {wind_speed} m/s"
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error fetching weather information: {e}")
-            return "Failed to fetch weather information. Please try again later."
+        if self.credentials_manager is None:
+            return self.access_token
+        return await self.credentials_manager.get_access_token(force_refresh=refresh)
 
-    async def send_message(self, message):
+    async def _post(self, text, access_token):
         """
-        Send a message to the YouTube live chat.
+        Post one message to the YouTube live chat.
 
         Args:
-            message (str): The message to send.
+            text (str): The message text.
+            access_token (str): The OAuth bearer token.
+
+        Returns:
+            tuple: The HTTP status code and the Retry-After header, if any.
         """
         url = "https://www.googleapis.com/youtube/v3/liveChat/messages"
         headers = {
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
         data = {
@@ -327,194 +386,171 @@ class YouTubeBot:
                 "type": "textMessageEvent",
                 "liveChatId": self.live_chat_id,
                 "textMessageDetails": {
-                    "messageText": message
+                    "messageText": text
                 }
             }
         }
-        try:
-            response = requests.post(url, headers=headers, json=data)
-            response.raise_for_status()
-            logging.info(f"Message sent to YouTube chat: {message}")
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Error sending message to YouTube chat: {e}")
+        session = get_session()
+        async with session.post(url, params={"part": "snippet"}, headers=headers, json=data) as response:
+            return response.status, response.headers.get("Retry-After")
 
-    async def handle_message(self, message):
+class YouTubeChatPoller:
+    """
+    A stateful poller that streams new messages from a YouTube live chat.
+
+    The poller keeps the page token between polls, waits for the polling
+    interval requested by the server and skips messages it has already seen,
+    as well as messages posted by the bot's own channel or the chat owner.
+    """
+
+    def __init__(self, live_chat_id, youtube=None, credentials_manager=None, skip_backlog=True, max_seen_ids=5000,
+                 bot_channel_id=None):
         """
-        Handle incoming messages from the YouTube live chat.
+        Initialize the YouTubeChatPoller instance.
 
         Args:
-            message (str): The message received from the live chat.
+            live_chat_id (str): The ID of the YouTube live chat.
+            youtube (googleapiclient.discovery.Resource): A YouTube API client (default: taken from the credentials manager).
+            credentials_manager (YouTubeCredentialsManager): The source of the shared API client (default: a new manager).
+            skip_backlog (bool): Ignore the chat history returned by the first poll (default: True).
+            max_seen_ids (int): The number of recent message IDs remembered for deduplication (default: 5000).
+            bot_channel_id (str): The channel the bot posts as (default: looked up for the authorized account on the first poll).
         """
-        if message.startswith("!search"):
-            query = message.replace("!search", "").strip()
-            videos = await self.search_videos(query)
-            if videos:
-                response = "Here are the top YouTube video results:\n\n"
-                for video in videos:
-                    response += f"Title: {video['title']}\n"
-                    response += f"Description: {video['description']}\n"
-                    response += f"URL: {video['url']}\n\n"
-            else:
-                response = "No YouTube videos found for the given query."
-            await self.send_message(response)
-        elif message.startswith("!videoinfo"):
-            video_id = message.replace("!videoinfo", "").strip()
-            video_info = await self.get_video_info(video_id)
-            if video_info:
-                response = f"Video Information:\n\n"
-                response += f"Title: {video_info['title']}\n"
-                response += f"Description: {video_info['description']}\n"
-                response += f"Views: {video_info['views']}\n"
-                response += f"Likes: {video_info['likes']}\n"
-                response += f"Comments: {video_info['comments']}\n"
-            else:
-                response = "No video information found for the given video ID."
-            await self.send_message(response)
-        elif message.startswith("!channelinfo"):
-            channel_id = message.replace("!channelinfo", "").strip()
-            channel_info = await self.get_channel_info(channel_id)
-            if channel_info:
-                response = f"Channel Information:\n\n"
-                response += f"Name: {channel_info['name']}\n"
-                response += f"Description: {channel_info['description']}\n"
-                response += f"Subscribers: {channel_info['subscribers']}\n"
-                response += f"Views: {channel_info['views']}\n"
-                response += f"Videos: {channel_info['videos']}\n"
-            else:
-                response = "No channel information found for the given channel ID."
-            await self.send_message(response)
-        elif message.startswith("!metar"):
-            station_code = message.replace("!metar", "").strip().upper()
-            if len(station_code) == 4:
-                metar_data = await self.fetch_metar(station_code)
-                await self.send_message(metar_data)
-            else:
-                await self.send_message("Please provide a valid 4-letter ICAO station code.")
-        elif message.startswith("!taf"):
-            station_code = message.replace("!taf", "").strip().upper()
-            if len(station_code) == 4:
-                taf_data = await self.fetch_taf(station_code)
-                await self.send_message(taf_data)
-            else:
-                await self.send_message("Please provide a valid 4-letter ICAO station code.")
-        elif message.startswith("!notam"):
-            station_code = message.replace("!notam", "").strip().upper()
-            if len(station_code) == 4:
-                notam_data = await self.fetch_notam(station_code)
-                await self.send_message(notam_data)
-            else:
-                await self.send_message("Please provide a valid 4-letter ICAO station code.")
-        elif message.startswith("!aircraft"):
-            aircraft_type = message.replace("!aircraft", "").strip()
-            aircraft_info = await self.fetch_aircraft_info(aircraft_type)
-            await self.send_message(aircraft_info)
-        elif message.startswith("!airport"):
-            airport_code = message.replace("!airport", "").strip().upper()
-            if len(airport_code) == 3:
-                airport_info = await self.fetch_airport_info(airport_code)
-                await self.send_message(airport_info)
-            else:
-                await self.send_message("Please provide a valid 3-letter IATA airport code.")
-        elif message.startswith("!chart"):
-            chart_name = message.replace("!chart", "").strip()
-            chart_info = await self.fetch_chart_info(chart_name)
-            await self.send_message(chart_info)
-        elif message.startswith("!weather"):
-            location = message.replace("!weather", "").strip()
-            weather_info = await self.fetch_weather_info(location)
-            await self.send_message(weather_info)
-        else:
-            # Handle other common messages or default response
-            response = "I'm sorry, I don't understand your request. Please try one of the following commands:\n\n"
-            response += "!search <query> - Search for YouTube videos\n"
-            response += "!videoinfo <video_id> - Get information about a specific video\n"
-            response += "!channelinfo <channel_id> - Get information about a specific channel\n"
-            response += "!metar <station_code> - Get METAR data for a given station\n"
-            response += "!taf <station_code> - Get TAF data for a given station\n"
-            response += "!notam <station_code> - Get NOTAM data for a given station\n"
-            response += "!aircraft <aircraft_type> - Get information about a specific aircraft type\n"
-            response += "!airport <airport_code> - Get information about a specific airport\n"
-            response += "!chart <chart_name> - Get information about a specific chart\n"
-            response += "!weather <location> - Get weather information for a specific location\n"
-            await self.send_message(response)
+        self.live_chat_id = live_chat_id
+        self.bot_channel_id = bot_channel_id
+        self.youtube = youtube
+        self.credentials_manager = credentials_manager or YouTubeCredentialsManager()
+        self.skip_backlog = skip_backlog
+        self.next_page_token = None
+        self.polling_interval = DEFAULT_POLLING_INTERVAL
+        self._seen_ids = OrderedDict()
+        self._max_seen_ids = max_seen_ids
+
+    def _list_messages(self):
+        """
+        Request the next page of chat messages (blocking).
 
-async def retrieve_youtube_chat_messages():
-    """
-    Retrieve messages from the YouTube live chat.
+        Returns:
+            dict: The liveChatMessages.list API response.
+        """
+        if self.youtube is None:
+            self.youtube = self.credentials_manager.get_client()
+        if self.bot_channel_id is None:
+            self.bot_channel_id = self._own_channel_id()
+        request = self.youtube.liveChatMessages().list(
+            liveChatId=self.live_chat_id,
+            part='snippet,authorDetails',
+            pageToken=self.next_page_token
+        )
+        return request.execute()
+
+    def _own_channel_id(self):
+        """
+        Look up the channel of the authorized account, which the bot posts as (blocking).
 
-    Returns:
-        list: A list of dictionaries containing the author and message of each chat message.
-    """
-    try:
-        # Set up the YouTube API client
-        youtube = build('youtube', 'v3', credentials=get_youtube_credentials())
+        Returns:
+            str: The channel ID, or "" if it could not be looked up.
+        """
+        try:
+            response = self.youtube.channels().list(part='id', mine=True).execute()
+            return response['items'][0]['id']
+        except Exception as e:
+            logging.error(f"Error looking up the bot's YouTube channel: {e}")
+            return ""
 
-        # Make a request to retrieve the chat messages
-        chat_messages = []
-        next_page_token = None
+    def _is_own_message(self, item):
+        author = item.get('authorDetails', {})
+        return bool(author.get('isChatOwner')) or (bool(self.bot_channel_id) and author.get('channelId') == self.bot_channel_id)
 
-        while True:
-            request = youtube.liveChatMessages().list(
-                liveChatId=Config.YOUTUBE_LIVE_CHAT_ID,
-                part='snippet,authorDetails',
-                pageToken=next_page_token
-            )
-            response = request.execute()
-
-            # Extract the relevant message data from the API response
-            for message in response['items']:
-                chat_messages.append({
-                    'author': message['authorDetails']['displayName'],
-                    'message': message['snippet']['displayMessage']
-                })
-
-            next_page_token = response.get('nextPageToken')
-            if not next_page_token:
-                break
-
-        return chat_messages
-
-    except Exception as e:
-        logging.error(f"Error retrieving YouTube chat messages: {e}")
-        return []
-
-def get_youtube_credentials():
-    """
-    Get the YouTube API credentials.
+    async def poll(self):
+        """
+        Retrieve the messages posted since the previous poll.
 
-    Returns:
-        google.oauth2.credentials.Credentials: The YouTube API credentials.
-    """
-    creds = None
-    if os.path.exists('token.json'):
-        creds = Credentials.from_authorized_user_file('token.json', ['https://www.googleapis.com/auth/youtube.force-ssl'])
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file('client_secret.json', ['https://www.googleapis.com/auth/youtube.force-ssl'])
-            creds = flow.run_local_server(port=0)
-        with open('token.json', 'w') as token:
-            token.write(creds.to_json())
-    return creds
-
-async def run_youtube_bot():
+        Returns:
+            list: A list of dictionaries containing the id, author and message of each new chat message.
+        """
+        first_poll = self.next_page_token is None
+        response = await asyncio.to_thread(self._list_messages)
+        self.next_page_token = response.get('nextPageToken', self.next_page_token)
+        interval_millis = response.get('pollingIntervalMillis')
+        if interval_millis is not None:
+            self.polling_interval = max(interval_millis / 1000, MIN_POLLING_INTERVAL)
+
+        new_messages = []
+        for item in response.get('items', []):
+            message_id = item['id']
+            if message_id in self._seen_ids:
+                continue
+            self._remember(message_id)
+            if self._is_own_message(item):
+                # The bot's replies must never be handled as viewer messages
+                continue
+            new_messages.append({
+                'id': message_id,
+                'author': item['authorDetails']['displayName'],
+                'message': item['snippet']['displayMessage']
+            })
+        if first_poll and self.skip_backlog:
+            logging.info(f"Skipped {len(new_messages)} YouTube chat messages from before startup")
+            return []
+        return new_messages
+
+    async def stream(self):
+        """
+        Yield new chat messages as they arrive, polling at the server-requested interval.
+
+        Yields:
+            dict: A dictionary containing the id, author and message of a chat message.
+        """
+        while True:
+            try:
+                for message in await self.poll():
+                    yield message
+            except Exception as e:
+                logging.error(f"Error retrieving YouTube chat messages: {e}")
+            await asyncio.sleep(self.polling_interval)
+
+    def _remember(self, message_id):
+        self._seen_ids[message_id] = None
+        if len(self._seen_ids) > self._max_seen_ids:
+            self._seen_ids.popitem(last=False)
+
+async def run_youtube_bot(youtube_bot=None):
     """
     Run the YouTube bot.
-    """
-    youtube_bot = YouTubeBot(Config.YOUTUBE_API_KEY, Config.YOUTUBE_ACCESS_TOKEN, Config.YOUTUBE_LIVE_CHAT_ID)
-    while True:
-        try:
-            # Retrieve messages from YouTube chat
-            messages = await retrieve_youtube_chat_messages()
-            for message in messages:
-                await youtube_bot.handle_message(message['message'])
-        except Exception as e:
-            logging.error(f"Error in YouTube bot: {e}")
-        await asyncio.sleep(5)  # Wait for 5 seconds before retrieving messages again
 
-            for message in messages:
-                await youtube_bot.handle_message(message['message'])
-        except Exception as e:
-            logging.error(f"Error in YouTube bot: {e}")
-        await asyncio.sleep(5)  # Wait for 5 seconds before retrieving messages again
+    Args:
+        youtube_bot (YouTubeBot): The bot instance to use (default: one built from the configuration).
+    """
+    credentials_manager = YouTubeCredentialsManager()
+    if youtube_bot is None:
+        youtube_bot = YouTubeBot(Config.YOUTUBE_API_KEY, Config.YOUTUBE_ACCESS_TOKEN, Config.YOUTUBE_LIVE_CHAT_ID)
+    # Replies are sent with the refreshed OAuth token, not the static one from the configuration
+    youtube_bot.outbox.credentials_manager = credentials_manager
+    await credentials_manager.start()
+    poller = YouTubeChatPoller(youtube_bot.live_chat_id, credentials_manager=credentials_manager)
+    bus = get_message_bus()
+    bus.register(youtube_bot)
+    bus.start()
+
+    def apply_config(changed):
+        # Retune the live outbox after a configuration reload
+        outbox = youtube_bot.outbox
+        outbox.bucket.configure(Config.YOUTUBE_SEND_RATE, Config.YOUTUBE_SEND_BURST)
+        outbox.max_length = Config.YOUTUBE_MESSAGE_MAX_LENGTH
+        outbox.max_retries = Config.YOUTUBE_SEND_MAX_RETRIES
+
+    Config.add_reload_listener(apply_config)
+    try:
+        async for message in poller.stream():
+            await bus.publish(ChatMessage(
+                platform=youtube_bot.platform,
+                channel=youtube_bot.live_chat_id,
+                author=message['author'],
+                text=message['message']
+            ))
+    finally:
+        Config.remove_reload_listener(apply_config)
+        bus.unregister(youtube_bot)
+        await youtube_bot.outbox.close()
+        await credentials_manager.stop()